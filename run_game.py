@@ -14,6 +14,7 @@ expected_structure = {
     "src/utils/utils.py": "src/utils/utils.py",
     "src/handlers/managers.py": "src/handlers/managers.py",
     "src/interfaces/entities.py": "src/interfaces/entities.py",
+    "src/engine/simulation.py": "src/engine/simulation.py",
 }
 
 missing_files = []
@@ -35,8 +36,10 @@ if missing_files:
     print("│   │   └── utils.py")
     print("│   ├── handlers/")
     print("│   │   └── managers.py")
-    print("│   └── interfaces/")
-    print("│       └── entities.py")
+    print("│   ├── interfaces/")
+    print("│   │   └── entities.py")
+    print("│   └── engine/")
+    print("│       └── simulation.py")
     sys.exit(1)
 
 # Importar e executar o jogo
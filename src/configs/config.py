@@ -19,6 +19,10 @@ class Config:
     INC_PER_CHAR = 0.36
     GLOBAL_CAP = 9.8
 
+    # Simulação em passos fixos
+    SIM_HZ = 120  # passos por segundo, independente da taxa de quadros
+    SIM_MAX_STEPS = 8  # passos por quadro no máximo; o atraso além é descartado
+
     # Inimigos
     SPIDERS_BY_PHASE = {1: 2, 2: 2, 3: 2}
     SPIDER_STEP_BY_PHASE = {1: 0.50, 2: 0.40, 3: 0.33}
@@ -27,14 +31,36 @@ class Config:
     # Power-ups
     POWER_UP_SPAWN_TIME = 15.0
 
+    # Partículas
+    PARTICLE_CAPACITY = 16384
+    PARTICLE_ALPHA_BUCKETS = 16
+
+    # Quadros
+    FPS = 60  # limite durante a partida (0 = sem limite)
+    IDLE_FPS = 8  # taxa nas telas paradas (menus, ranking, pausa)
+    VSYNC = True
+
+    # Renderização
+    DIRTY_RECTS = False  # redesenha só as regiões que mudaram
+    DIRTY_TILE = 4  # lado, em células, dos blocos de atualização
+    SMOOTH_SCALE = False  # suaviza a escala quando a janela não é nativa
+    BG_CACHE_BYTES = 64 * 1024 * 1024  # fundos decodificados guardados em memória
+    OVERLAY_CACHE_BYTES = 12 * 1024 * 1024  # overlays e quadros compostos
+
     # Animação da cobra
     SLITHER_SPEED = 7.6
     SLITHER_AMPL = 4.8
     HEAD_SWAY = 2.6
 
     # Arquivos
-    LB_PATH = "leaderboard.json"
+    LB_PATH = "leaderboard.json"  # ".db" guarda todas as partidas em SQLite
+    LB_JSON_PATH = "leaderboard.json"  # exportação do ranking SQLite
+    LB_SERVER = None  # host do ranking global (src.handlers.scores); None = só local
+    LB_SERVER_PORT = 8765
+    LB_OUTBOX_PATH = "score_outbox.jsonl"  # pontuações ainda não enviadas
     BG_CFG_PATH = "theme_bg.json"
+    REPLAY_DIR = "replays"
+    RECORD_REPLAYS = True  # grava as entradas de cada partida em REPLAY_DIR
 
     # Cores padrão
     DARK_PANEL = (12, 14, 18)
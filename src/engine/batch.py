@@ -0,0 +1,607 @@
+"""Simulação vetorizada: N partidas independentes em arrays NumPy."""
+
+import numpy as np
+
+# Imports com fallback
+try:
+    from ..configs.config import Config
+    from ..interfaces.entities import PowerUp
+    from .simulation import Action
+except ImportError:
+    try:
+        from src.configs.config import Config
+        from src.interfaces.entities import PowerUp
+        from src.engine.simulation import Action
+    except ImportError:
+        import sys
+        import os
+
+        src_dir = os.path.dirname(os.path.dirname(__file__))
+        for name in ("configs", "interfaces", "engine"):
+            sys.path.append(os.path.join(src_dir, name))
+        from config import Config
+        from entities import PowerUp
+        from simulation import Action
+
+
+# Deslocamento por código de ação (índices de Action)
+DX = np.array([0, -1, 1, 0, 0], np.int32)
+DY = np.array([0, 0, 0, -1, 1], np.int32)
+OPPOSITE = np.array([0, 2, 1, 4, 3], np.int8)
+
+# Vizinhos na ordem do fallback de Spider._best_step: direita, esquerda, baixo, cima
+NX4 = np.array([1, -1, 0, 0], np.int32)
+NY4 = np.array([0, 0, 1, -1], np.int32)
+
+# Mesmos valores de Bullet, Pillar e SnakeGame._apply_power_up
+BULLET_SPEED = 15.0
+BULLET_RANGE = (Config.GRID_W // 2) * Config.CELL
+PILLAR_TTL = 5.0
+EFFECT_DURATION = {"speed": 10.0, "freeze": 8.0, "shield": 12.0}
+SPEED_MULT, FREEZE_MULT = 1.5, 0.5
+
+
+class BatchSimulation:
+    """Avança N partidas por tick com as regras de ``Simulation``.
+
+    Corpos ficam em buffers circulares de células (``y * GRID_W + x``),
+    com uma grade de ocupação por partida para colisões O(1). Pilares
+    guardam o instante em que expiram, então não há TTL para decrementar.
+    A transição de fase é imediata: as letras da fase seguinte são
+    colocadas no mesmo tick em que a anterior termina.
+
+    As aranhas seguem o mesmo campo de distâncias (BFS até a cabeça,
+    contornando corpo e pilares) do FlowField, feito uma vez por tick nas
+    partidas com alguma aranha andando, e só caem no passo guloso quando
+    não há vizinho mais perto. Como no jogo, os pilares largados num tick
+    só viram parede depois que todas as aranhas andaram. Os sorteios usam
+    o gerador do NumPy, então a mesma semente não dá a mesma partida que
+    em ``Simulation``; as regras são as mesmas.
+    """
+
+    PLAYING = 0
+    GAME_OVER = 1
+    VICTORY = 2
+
+    DEATH_REASONS = ["", "Parede", "Corpo", "Aranha", "Pilar", "Letra errada"]
+
+    def __init__(self, n, seed=None, max_bullets=8):
+        self.n = n
+        self.w, self.h = Config.GRID_W, Config.GRID_H
+        self.cells = self.w * self.h
+        self.max_len = 3 * Config.NCHARS + 2
+        self.max_spiders = max(Config.SPIDERS_BY_PHASE.values())
+        self.max_bullets = max_bullets
+        self.rng = np.random.default_rng(seed)
+
+        # Tabelas indexadas pela fase
+        phases = range(max(Config.BASE_SPEED) + 1)
+        self._base_speed = np.array([Config.BASE_SPEED.get(p, 0.0) for p in phases])
+        self._speed_cap = np.array(
+            [min(Config.GLOBAL_CAP, Config.PHASE_CAP.get(p, 0.0)) for p in phases]
+        )
+        self._spider_count = np.array(
+            [Config.SPIDERS_BY_PHASE.get(p, 0) for p in phases]
+        )
+        self._spider_period = np.array(
+            [Config.SPIDER_STEP_BY_PHASE.get(p, 1.0) for p in phases]
+        )
+        self._drop_rate = np.array(
+            [Config.DROP_RATE_BY_PHASE.get(p, 0.0) for p in phases]
+        )
+
+        self._rows = np.arange(n)
+        self._alloc()
+        self.reset()
+
+    def _alloc(self):
+        """Aloca os arrays de estado."""
+        n, c = self.n, self.cells
+        s, b = self.max_spiders, self.max_bullets
+
+        self.status = np.zeros(n, np.int8)
+        self.death_reason = np.zeros(n, np.int8)
+        self.phase = np.ones(n, np.int32)
+        self.time = np.zeros(n)  # tempo da partida (afetado pelo power-up "time")
+        self.clock = np.zeros(n)  # relógio monotônico para pilares
+
+        # Cobra
+        self.body = np.zeros((n, self.max_len), np.int32)
+        self.head_ptr = np.zeros(n, np.int32)
+        self.length = np.ones(n, np.int32)
+        self.occ = np.zeros((n, c), np.uint8)
+        self.direction = np.full(n, Action.RIGHT, np.int8)
+        self.velocity = np.zeros(n)
+        self.move_acc = np.zeros(n)
+
+        # Letras
+        self.char_index = np.zeros(n, np.int32)
+        self.letters = np.full((n, Config.NCHARS), -1, np.int32)
+        self.letter_at = np.full((n, c), -1, np.int8)
+
+        # Inimigos
+        self.spiders = np.full((n, s), -1, np.int32)
+        self.spider_acc = np.zeros((n, s))
+        self.pillar_until = np.full((n, c), -np.inf)
+
+        # Power-ups
+        self.power_up_at = np.full((n, c), -1, np.int8)
+        self.power_up_timer = np.zeros(n)
+        self.effect_end = np.full((n, 3), -np.inf)
+
+        # Tiros
+        self.bullets = np.zeros(n, np.int32)
+        self.bullet_x = np.zeros((n, b))
+        self.bullet_y = np.zeros((n, b))
+        self.bullet_dist = np.zeros((n, b))
+        self.bullet_dir = np.zeros((n, b), np.int8)
+        self.bullet_alive = np.zeros((n, b), bool)
+
+        self.spider_kills = np.zeros(n, np.int32)
+
+    def reset(self, mask=None, seed=None):
+        """Reinicia todas as partidas, ou só as marcadas em ``mask``."""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        idx = self._rows if mask is None else np.flatnonzero(mask)
+        if idx.size == 0:
+            return self.observe()
+
+        start = (self.h // 2) * self.w + self.w // 2
+        self.status[idx] = self.PLAYING
+        self.death_reason[idx] = 0
+        self.phase[idx] = 1
+        self.time[idx] = 0.0
+        self.clock[idx] = 0.0
+
+        self.body[idx, 0] = start
+        self.head_ptr[idx] = 0
+        self.length[idx] = 1
+        self.occ[idx] = 0
+        self.occ[idx, start] = 1
+        self.direction[idx] = Action.RIGHT
+        self.velocity[idx] = self._base_speed[1]
+        self.move_acc[idx] = 0.0
+
+        self.char_index[idx] = 0
+        self.letter_at[idx] = -1
+        self.pillar_until[idx] = -np.inf
+        self.power_up_at[idx] = -1
+        self.power_up_timer[idx] = 0.0
+        self.effect_end[idx] = -np.inf
+
+        self.bullets[idx] = 0
+        self.bullet_alive[idx] = False
+        self.spider_kills[idx] = 0
+
+        self._spawn_spiders(idx)
+        self._place_letters(idx)
+        return self.observe()
+
+    def step(self, actions=None, dt=None):
+        """Aplica ``actions`` (um código de Action por partida) e avança um tick.
+
+        Sem ``dt``, o tick é ``1 / Config.SIM_HZ``, como no jogo. Retorna
+        a máscara das partidas que terminaram neste tick.
+        """
+        if dt is None:
+            dt = 1.0 / Config.SIM_HZ
+        playing = self.status == self.PLAYING
+        if actions is not None:
+            self._apply(np.asarray(actions), playing)
+
+        if playing.any():
+            self.time[playing] += dt
+            self.clock[playing] += dt
+            self._update_bullets(playing, dt)
+            self._update_power_up_spawn(playing, dt)
+            self._move_snakes(playing, dt)
+
+            alive = playing & (self.status == self.PLAYING)
+            self._move_spiders(alive, dt)
+            self._collect_power_ups(alive)
+            self._check_bites(alive)
+
+        return playing & (self.status != self.PLAYING)
+
+    def heads(self):
+        """Célula da cabeça de cada partida."""
+        return self.body[self._rows, self.head_ptr]
+
+    def body_cells(self, i):
+        """Corpo da partida ``i`` como lista de (x, y), cabeça primeiro."""
+        ptr = (self.head_ptr[i] - np.arange(self.length[i])) % self.max_len
+        return [(int(c % self.w), int(c // self.w)) for c in self.body[i, ptr]]
+
+    def observe(self):
+        """Estado atual em arrays (vistas, sem cópia)."""
+        heads = self.heads()
+        return {
+            "status": self.status,
+            "phase": self.phase,
+            "time": self.time,
+            "head": np.stack([heads % self.w, heads // self.w], axis=1),
+            "length": self.length,
+            "direction": self.direction,
+            "velocity": self.velocity,
+            "char_index": self.char_index,
+            "letters": self.letters,
+            "spiders": self.spiders,
+            "pillars": (self.pillar_until > self.clock[:, None]).reshape(
+                self.n, self.h, self.w
+            ),
+            "power_ups": self.power_up_at.reshape(self.n, self.h, self.w),
+            "bullets": self.bullets,
+            "spider_kills": self.spider_kills,
+            "death_reason": self.death_reason,
+        }
+
+    # ------------------------------------------------------------------
+    # Spawns
+
+    def _blocked(self, idx, letters=False):
+        """Máscara (len(idx), células) de corpo, pilares, aranhas e letras."""
+        blocked = self.occ[idx] > 0
+        blocked |= self.pillar_until[idx] > self.clock[idx, None]
+
+        sp = self.spiders[idx]
+        valid = sp >= 0
+        rows = np.broadcast_to(np.arange(idx.size)[:, None], sp.shape)
+        blocked[rows[valid], sp[valid]] = True
+
+        if letters:
+            blocked |= self.letter_at[idx] >= 0
+        return blocked
+
+    def _sample_free(self, blocked, k):
+        """Sorteia ``k`` células livres distintas por linha de ``blocked``."""
+        keys = self.rng.random(blocked.shape)
+        keys[blocked] = 2.0
+        return np.argpartition(keys, k - 1, axis=1)[:, :k].astype(np.int32)
+
+    def _spawn_spiders(self, idx):
+        """Gera aranhas da fase atual em células sem nada (``sample_free``)."""
+        self.spiders[idx] = -1
+        blocked = self._blocked(idx, letters=True) | (self.power_up_at[idx] >= 0)
+        cells = self._sample_free(blocked, self.max_spiders)
+        count = self._spider_count[self.phase[idx]]
+        cells[np.arange(self.max_spiders)[None, :] >= count[:, None]] = -1
+        self.spiders[idx] = cells
+        self.spider_acc[idx] = 0.0
+
+    def _place_letters(self, idx):
+        """Espalha as letras da frase em células livres."""
+        cells = self._sample_free(self._blocked(idx), Config.NCHARS)
+        self.letters[idx] = cells
+        self.letter_at[idx] = -1
+        self.letter_at[idx[:, None], cells] = np.arange(Config.NCHARS)
+
+    def _update_power_up_spawn(self, alive, dt):
+        """Gera power-ups a cada POWER_UP_SPAWN_TIME segundos."""
+        self.power_up_timer[alive] += dt
+        idx = np.flatnonzero(
+            alive & (self.power_up_timer >= Config.POWER_UP_SPAWN_TIME)
+        )
+        if idx.size == 0:
+            return
+
+        blocked = self._blocked(idx, letters=True) | (self.power_up_at[idx] >= 0)
+        cells = self._sample_free(blocked, 1)[:, 0]
+        types = self.rng.integers(0, len(PowerUp.TYPES), idx.size)
+        self.power_up_at[idx, cells] = types
+        self.power_up_timer[idx] = 0.0
+
+    # ------------------------------------------------------------------
+    # Ações e tiros
+
+    def _apply(self, actions, playing):
+        """Mudança de direção e disparo."""
+        turn = (
+            playing
+            & (actions >= Action.LEFT)
+            & (actions <= Action.DOWN)
+            & (actions != OPPOSITE[self.direction])
+        )
+        self.direction[turn] = actions[turn]
+
+        shoot = playing & (actions == Action.SHOOT) & (self.bullets > 0)
+        if shoot.any():
+            self._shoot(np.flatnonzero(shoot))
+
+    def _shoot(self, idx):
+        """Dispara um projétil a partir da cabeça."""
+        free = ~self.bullet_alive[idx]
+        has_slot = free.any(axis=1)
+        idx = idx[has_slot]
+        slot = free[has_slot].argmax(axis=1)
+
+        head = self.body[idx, self.head_ptr[idx]]
+        self.bullet_x[idx, slot] = (head % self.w) * Config.CELL + Config.CELL // 2
+        self.bullet_y[idx, slot] = (
+            Config.FIELD_Y + (head // self.w) * Config.CELL + Config.CELL // 2
+        )
+        self.bullet_dir[idx, slot] = self.direction[idx]
+        self.bullet_dist[idx, slot] = 0.0
+        self.bullet_alive[idx, slot] = True
+        self.bullets[idx] -= 1
+
+    def _update_bullets(self, alive, dt):
+        """Move projéteis e resolve acertos em aranhas."""
+        moving = self.bullet_alive & alive[:, None]
+        if not moving.any():
+            return
+
+        step = BULLET_SPEED * dt
+        d = self.bullet_dir
+        self.bullet_x += np.where(moving, DX[d] * step, 0.0)
+        self.bullet_y += np.where(moving, DY[d] * step, 0.0)
+        self.bullet_dist += np.where(moving, step, 0.0)
+        self.bullet_alive &= ~moving | (self.bullet_dist < BULLET_RANGE)
+
+        gx = (self.bullet_x // Config.CELL).astype(np.int32)
+        gy = ((self.bullet_y - Config.FIELD_Y) // Config.CELL).astype(np.int32)
+        inside = (gx >= 0) & (gx < self.w) & (gy >= 0) & (gy < self.h)
+        gcell = np.where(inside & self.bullet_alive & moving, gy * self.w + gx, -2)
+
+        for b in range(self.max_bullets):
+            hit = (gcell[:, b, None] == self.spiders) & (self.spiders >= 0)
+            rows = np.flatnonzero(hit.any(axis=1))
+            if rows.size:
+                s = hit[rows].argmax(axis=1)
+                self.spiders[rows, s] = -1
+                self.spider_kills[rows] += 1
+                self.bullet_alive[rows, b] = False
+
+    # ------------------------------------------------------------------
+    # Cobra
+
+    def _effect_active(self, name, idx=slice(None)):
+        col = ("speed", "freeze", "shield").index(name)
+        return self.time[idx] < self.effect_end[idx, col]
+
+    def _move_snakes(self, alive, dt):
+        """Acumula tempo e move cada cobra quantas vezes couber no tick."""
+        vel = self.velocity.copy()
+        vel[self._effect_active("speed")] *= SPEED_MULT
+        vel[self._effect_active("freeze")] *= FREEZE_MULT
+        step = 1.0 / np.maximum(vel, 0.0001)
+
+        self.move_acc[alive] += dt
+        moving = alive & (self.move_acc >= step)
+        while moving.any():
+            self.move_acc[moving] -= step[moving]
+            self._advance(np.flatnonzero(moving))
+            moving &= (self.status == self.PLAYING) & (self.move_acc >= step)
+
+    def _advance(self, idx):
+        """Um passo da cobra (``_move_snake``) nas partidas ``idx``."""
+        ptr = self.head_ptr[idx]
+        head = self.body[idx, ptr]
+        d = self.direction[idx]
+        nx = head % self.w + DX[d]
+        ny = head // self.w + DY[d]
+
+        wall = (nx < 0) | (nx >= self.w) | (ny < 0) | (ny >= self.h)
+        new = np.where(wall, 0, ny * self.w + nx)
+        tail = self.body[idx, (ptr - self.length[idx] + 1) % self.max_len]
+
+        body_hit = ~wall & (self.occ[idx, new] > 0) & (new != tail)
+        exposed = ~wall & ~self._effect_active("shield", idx)
+        spider_hit = exposed & (self.spiders[idx] == new[:, None]).any(axis=1)
+        pillar_hit = exposed & (self.pillar_until[idx, new] > self.clock[idx])
+        letter = np.where(wall, -1, self.letter_at[idx, new])
+        wrong = (letter >= 0) & (letter != self.char_index[idx])
+
+        reason = np.select(
+            [wall, body_hit, spider_hit, pillar_hit, wrong], [1, 2, 3, 4, 5]
+        )
+        dead = reason > 0
+        if dead.any():
+            self._game_over(idx[dead], reason[dead])
+
+        ok = ~dead
+        idx, new, tail, letter = idx[ok], new[ok], tail[ok], letter[ok]
+        ptr = (ptr[ok] + 1) % self.max_len
+        self.head_ptr[idx] = ptr
+        self.body[idx, ptr] = new
+        self.occ[idx, new] += 1
+
+        grow = letter >= 0
+        self.occ[idx[~grow], tail[~grow]] -= 1
+        if grow.any():
+            self.length[idx[grow]] += 1
+            self._collect(idx[grow], new[grow], letter[grow])
+
+    def _collect(self, idx, cells, letter):
+        """Coleta a letra certa (``_collect_letter``)."""
+        self.char_index[idx] += 1
+        self.bullets[idx] += 1
+        self.velocity[idx] = np.minimum(
+            self._speed_cap[self.phase[idx]], self.velocity[idx] + Config.INC_PER_CHAR
+        )
+        self.letter_at[idx, cells] = -1
+        self.letters[idx, letter] = -1
+
+        done = idx[self.char_index[idx] >= Config.NCHARS]
+        if done.size:
+            self._complete_phase(done)
+
+    def _complete_phase(self, idx):
+        """Vitória na fase 3; nas demais já começa a próxima."""
+        self.char_index[idx] = 0
+        last = self.phase[idx] >= 3
+        self.status[idx[last]] = self.VICTORY
+
+        nxt = idx[~last]
+        if nxt.size:
+            self.phase[nxt] += 1
+            self.velocity[nxt] = self._base_speed[self.phase[nxt]]
+            self.move_acc[nxt] = 0.0
+            self._spawn_spiders(nxt)
+            self._place_letters(nxt)
+
+    def _game_over(self, idx, reason):
+        self.status[idx] = self.GAME_OVER
+        self.death_reason[idx] = reason
+
+    # ------------------------------------------------------------------
+    # Aranhas e power-ups
+
+    def _move_spiders(self, alive, dt):
+        """Avança cada aranha no seu próprio passo (``Spider.update``)."""
+        step = self._spider_period[self.phase]
+        active = (self.spiders >= 0) & alive[:, None]
+        self.spider_acc += np.where(active, dt, 0.0)
+        due = active & (self.spider_acc >= step[:, None])
+        moving = np.flatnonzero(due.any(axis=1))
+        if moving.size == 0:
+            return
+
+        # Paredes e distâncias valem o tick inteiro, como no jogo; só das
+        # partidas em ``moving``, e ``slot`` leva a partida à sua linha
+        heads = self.heads()
+        walls = self._walls(moving)
+        dist = self._distances(moving, heads[moving], walls)
+        slot = np.zeros(self.n, np.intp)
+        slot[moving] = np.arange(moving.size)
+
+        drops = []
+        for s in range(self.max_spiders):
+            due = active[:, s] & (self.spider_acc[:, s] >= step)
+            while due.any():
+                rows = np.flatnonzero(due)
+                self.spider_acc[rows, s] -= step[rows]
+                at = slot[rows]
+                drops.append(
+                    self._spider_step(rows, s, heads[rows], walls[at], dist[at])
+                )
+                due &= self.spider_acc[:, s] >= step
+
+        for rows, cells in drops:
+            self.pillar_until[rows, cells] = self.clock[rows] + PILLAR_TTL
+
+    def _walls(self, idx):
+        """Células que as aranhas contornam: corpo e pilares ativos."""
+        return (self.occ[idx] > 0) | (self.pillar_until[idx] > self.clock[idx, None])
+
+    def _distances(self, idx, heads, walls):
+        """BFS do FlowField até a cabeça, uma frente por partida de ``idx``.
+
+        A grade ganha uma borda de parede, para os quatro vizinhos serem
+        deslocamentos fixos no array achatado. Para assim que todas as
+        aranhas têm distância: as células mais perto da cabeça que elas
+        já estão rotuladas.
+        """
+        m, w = idx.size, self.w + 2
+        k = np.arange(m)
+
+        def pad(cells):
+            return (cells // self.w + 1) * w + cells % self.w + 1
+
+        open_ = np.zeros((m, self.h + 2, w), bool)
+        open_[:, 1:-1, 1:-1] = ~walls.reshape(m, self.h, self.w)
+        open_ = open_.reshape(m, -1)
+        dist = np.full(open_.shape, -1, np.int32)
+        frontier = np.zeros(open_.shape, bool)
+        head = pad(heads)
+        dist[k, head] = 0
+        frontier[k, head] = True
+        open_[k, head] = False
+
+        sp = self.spiders[idx]
+        rows = np.broadcast_to(k[:, None], sp.shape)[sp >= 0]
+        cells = pad(sp[sp >= 0])
+
+        d = 0
+        nb = np.empty_like(frontier)
+        while (dist[rows, cells] < 0).any() and frontier.any():
+            d += 1
+            nb[:, 1:] = frontier[:, :-1]
+            nb[:, :1] = False
+            nb[:, :-1] |= frontier[:, 1:]
+            nb[:, w:] |= frontier[:, :-w]
+            nb[:, :-w] |= frontier[:, w:]
+            nb &= open_
+            open_ ^= nb
+            dist[nb] = d
+            frontier, nb = nb, frontier
+        return dist.reshape(m, self.h + 2, w)[:, 1:-1, 1:-1].reshape(m, self.cells)
+
+    def _spider_step(self, rows, s, target, walls, dist):
+        """Um passo de ``Spider.update``; devolve as células dos pilares largados.
+
+        ``walls`` e ``dist`` têm uma linha por partida de ``rows``. Vai para
+        o vizinho livre mais perto da cabeça no campo ``dist`` (empate
+        sorteado); sem ele, passo guloso em direção à cabeça, com fallback
+        na ordem fixa.
+        """
+        cur = self.spiders[rows, s]
+        x, y = cur % self.w, cur // self.w
+        tx, ty = target % self.w, target // self.w
+
+        nx = x[:, None] + NX4
+        ny = y[:, None] + NY4
+        inside = (nx >= 0) & (nx < self.w) & (ny >= 0) & (ny < self.h)
+        cand = np.where(inside, ny * self.w + nx, 0)
+        k = np.arange(rows.size)
+        r = k[:, None]
+        free = inside & ~walls[r, cand]
+
+        # Campo de distâncias (FlowField.next_step)
+        here = dist[k, cur][:, None]
+        nd = dist[r, cand]
+        closer = free & (nd >= 0) & ((here < 0) | (nd < here))
+        nd = np.where(closer, nd, np.iinfo(np.int32).max)
+        best = closer & (nd == nd.min(axis=1)[:, None])
+        flow = np.where(best, self.rng.random(cand.shape), np.inf)
+
+        # Passo guloso (Spider._best_step)
+        toward = np.stack([tx > x, tx < x, ty > y, ty < y], axis=1)
+        greedy = np.where(
+            toward & free,
+            self.rng.random(cand.shape),
+            np.where(free, 2.0 + np.arange(4), np.inf),
+        )
+
+        prio = np.where(best.any(axis=1)[:, None], flow, greedy)
+        choice = prio.argmin(axis=1)
+        new = np.where(np.isfinite(prio[k, choice]), cand[k, choice], cur)
+        self.spiders[rows, s] = new
+
+        drop = (new != cur) & (
+            self.rng.random(rows.size) < self._drop_rate[self.phase[rows]]
+        )
+        return rows[drop], cur[drop]
+
+    def _collect_power_ups(self, alive):
+        """Aplica o power-up sob a cabeça."""
+        idx = np.flatnonzero(alive)
+        head = self.body[idx, self.head_ptr[idx]]
+        kind = self.power_up_at[idx, head]
+        got = kind >= 0
+        idx, head, kind = idx[got], head[got], kind[got]
+        if idx.size == 0:
+            return
+
+        self.power_up_at[idx, head] = -1
+        for t, name in enumerate(PowerUp.TYPES):
+            sel = idx[kind == t]
+            if sel.size == 0:
+                continue
+            if name in EFFECT_DURATION:
+                col = ("speed", "freeze", "shield").index(name)
+                self.effect_end[sel, col] = self.time[sel] + EFFECT_DURATION[name]
+            elif name == "time":
+                self.time[sel] -= 5.0
+            elif name == "kill":
+                self.bullets[sel] += 3
+
+    def _check_bites(self, alive):
+        """Aranha sobre qualquer segmento mata a cobra sem escudo."""
+        valid = self.spiders >= 0
+        bitten = valid & (
+            self.occ[self._rows[:, None], np.where(valid, self.spiders, 0)] > 0
+        )
+        dead = alive & bitten.any(axis=1) & ~self._effect_active("shield")
+        if dead.any():
+            self._game_over(np.flatnonzero(dead), 3)
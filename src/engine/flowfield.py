@@ -0,0 +1,130 @@
+"""Campo de distâncias (BFS) até a cabeça da cobra."""
+
+from collections import deque
+
+
+class FlowField:
+    """Distância em passos de cada célula até a cabeça, evitando paredes.
+
+    É um BFS só, compartilhado por todas as aranhas. Mudar a cabeça ou
+    criar parede só marca o campo como sujo; a busca recomeça na próxima
+    consulta e avança apenas até alcançar a aranha que perguntou, então
+    aranhas perto da cabeça custam pouco. Quando uma parede some (pilar
+    expirado) com o campo completo, as distâncias só podem diminuir e são
+    relaxadas a partir daquela célula.
+    """
+
+    def __init__(self, grid, wall_mask):
+        self.grid = grid
+        self.wall_mask = wall_mask
+        w, h = grid.w, grid.h
+        self._blank = [-1] * (w * h)
+        self.dist = list(self._blank)
+        self.source = None
+        self.dirty = True
+        self._queue = deque()
+
+        # Vizinhos na ordem do fallback de Spider._best_step
+        self.neighbors = []
+        for y in range(h):
+            for x in range(w):
+                cells = []
+                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < w and 0 <= ny < h:
+                        cells.append(ny * w + nx)
+                self.neighbors.append(cells)
+
+    @property
+    def complete(self):
+        """O BFS já visitou todas as células alcançáveis?"""
+        return not self.dirty and not self._queue
+
+    def invalidate(self):
+        """Força um BFS novo na próxima consulta."""
+        self.dirty = True
+
+    def set_source(self, pos):
+        """Move a origem do campo (a cabeça da cobra)."""
+        i = pos[1] * self.grid.w + pos[0]
+        if i != self.source:
+            self.source = i
+            self.dirty = True
+
+    def wall_removed(self, pos):
+        """Atualiza o campo quando ``pos`` deixa de ser parede."""
+        if not self.complete:
+            self.dirty = True
+            return
+        i = pos[1] * self.grid.w + pos[0]
+        flags, mask, dist = self.grid.flags, self.wall_mask, self.dist
+        if flags[i] & mask:
+            return
+
+        reach = [dist[n] for n in self.neighbors[i] if dist[n] >= 0]
+        if not reach:
+            return
+        best = min(reach) + 1
+        if 0 <= dist[i] <= best:
+            return
+
+        dist[i] = best
+        queue = deque([i])
+        while queue:
+            c = queue.popleft()
+            nd = dist[c] + 1
+            for n in self.neighbors[c]:
+                if not flags[n] & mask and (dist[n] < 0 or dist[n] > nd):
+                    dist[n] = nd
+                    queue.append(n)
+
+    def _restart(self):
+        self.dist[:] = self._blank
+        self.dist[self.source] = 0
+        self._queue = deque([self.source])
+        self.dirty = False
+
+    def reach(self, i):
+        """Avança o BFS até a célula ``i`` ter distância (ou não haver mais)."""
+        if self.source is None:
+            return
+        if self.dirty:
+            self._restart()
+
+        flags, mask, dist = self.grid.flags, self.wall_mask, self.dist
+        neighbors, queue = self.neighbors, self._queue
+        pop, push = queue.popleft, queue.append
+        while queue and dist[i] < 0:
+            c = pop()
+            nd = dist[c] + 1
+            for n in neighbors[c]:
+                if dist[n] < 0 and not flags[n] & mask:
+                    dist[n] = nd
+                    push(n)
+
+    def next_step(self, pos, rng):
+        """Vizinho livre mais perto da cabeça que ``pos``, ou None.
+
+        Quando ``pos`` recebe sua distância ``d`` no BFS, todas as células
+        a ``d - 1`` já foram rotuladas, então os vizinhos úteis são conhecidos.
+        """
+        w = self.grid.w
+        i = pos[1] * w + pos[0]
+        self.reach(i)
+        flags, mask, dist = self.grid.flags, self.wall_mask, self.dist
+        here = dist[i]
+
+        best, best_d = [], None
+        for n in self.neighbors[i]:
+            d = dist[n]
+            if d < 0 or flags[n] & mask or (here >= 0 and d >= here):
+                continue
+            if best_d is None or d < best_d:
+                best, best_d = [n], d
+            elif d == best_d:
+                best.append(n)
+
+        if not best:
+            return None
+        n = best[0] if len(best) == 1 else rng.choice(best)
+        return n % w, n // w
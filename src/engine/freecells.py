@@ -0,0 +1,74 @@
+"""Índice de células livres com sorteio em tempo constante."""
+
+
+class FreeCellIndex:
+    """Conjunto de índices de célula com add/discard/sorteio O(1).
+
+    ``dense`` guarda as células livres sem buracos e ``where`` diz em que
+    posição de ``dense`` cada célula está (-1 quando ocupada); remover é
+    trocar com o último elemento e encurtar a lista.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.dense = list(range(size))
+        self.where = list(range(size))
+
+    def reset(self):
+        """Marca todas as células como livres."""
+        self.dense[:] = range(self.size)
+        self.where[:] = range(self.size)
+
+    def __len__(self):
+        return len(self.dense)
+
+    def __contains__(self, i):
+        return self.where[i] >= 0
+
+    def add(self, i):
+        """Marca a célula ``i`` como livre."""
+        if self.where[i] < 0:
+            self.where[i] = len(self.dense)
+            self.dense.append(i)
+
+    def discard(self, i):
+        """Marca a célula ``i`` como ocupada."""
+        j = self.where[i]
+        if j < 0:
+            return
+        last = self.dense.pop()
+        if last != i:
+            self.dense[j] = last
+            self.where[last] = j
+        self.where[i] = -1
+
+    def sample(self, k, rng, reject=None):
+        """Sorteia até ``k`` células livres distintas.
+
+        ``reject(i)`` exclui células (zonas proibidas). Com a grade quase
+        cheia ou zonas muito grandes, o sorteio por rejeição desiste e as
+        células restantes saem de uma varredura das livres.
+        """
+        n = len(self.dense)
+        if n == 0 or k <= 0:
+            return []
+
+        chosen = []
+        seen = set()
+        attempts = 8 * k + 16
+        while len(chosen) < k and attempts:
+            attempts -= 1
+            i = self.dense[rng.randrange(n)]
+            if i in seen or (reject is not None and reject(i)):
+                continue
+            seen.add(i)
+            chosen.append(i)
+
+        if len(chosen) < k:
+            rest = [
+                i
+                for i in self.dense
+                if i not in seen and (reject is None or not reject(i))
+            ]
+            chosen.extend(rng.sample(rest, min(k - len(chosen), len(rest))))
+        return chosen
@@ -0,0 +1,118 @@
+"""Grade de ocupação persistente da simulação."""
+
+from array import array
+
+# Imports com fallback
+try:
+    from .freecells import FreeCellIndex
+except ImportError:
+    try:
+        from src.engine.freecells import FreeCellIndex
+    except ImportError:
+        from freecells import FreeCellIndex
+
+
+class OccupancyGrid:
+    """Flags por célula (corpo, aranha, pilar, letra, power-up).
+
+    Cada tipo guarda também uma contagem, porque duas aranhas podem
+    dividir a mesma célula e a cabeça pode entrar onde o rabo ainda
+    está; a flag só some quando a contagem volta a zero. As contagens são
+    ``array('I')`` porque centenas de aranhas podem se empilhar numa
+    célula, mais do que cabe num byte. As células sem nenhuma flag ficam
+    num FreeCellIndex para sorteio de spawns.
+    """
+
+    BODY = 1
+    SPIDER = 2
+    PILLAR = 4
+    LETTER = 8
+    POWER_UP = 16
+
+    FLAGS = (BODY, SPIDER, PILLAR, LETTER, POWER_UP)
+
+    def __init__(self, w, h):
+        self.w, self.h = w, h
+        self.flags = bytearray(w * h)
+        self._zeros = array("I", [0]) * (w * h)
+        self.counts = {flag: array("I", self._zeros) for flag in self.FLAGS}
+        self.free = FreeCellIndex(w * h)
+
+    def clear(self):
+        """Esvazia a grade sem realocar."""
+        size = self.w * self.h
+        self.flags[:] = bytes(size)
+        for counts in self.counts.values():
+            counts[:] = self._zeros
+        self.free.reset()
+
+    def in_bounds(self, pos):
+        x, y = pos
+        return 0 <= x < self.w and 0 <= y < self.h
+
+    def add(self, pos, flag):
+        """Marca ``pos`` com ``flag``."""
+        i = pos[1] * self.w + pos[0]
+        if not self.flags[i]:
+            self.free.discard(i)
+        self.counts[flag][i] += 1
+        self.flags[i] |= flag
+
+    def remove(self, pos, flag):
+        """Desfaz um ``add`` em ``pos``."""
+        i = pos[1] * self.w + pos[0]
+        counts = self.counts[flag]
+        if counts[i]:
+            counts[i] -= 1
+            if not counts[i]:
+                self.flags[i] &= ~flag
+                if not self.flags[i]:
+                    self.free.add(i)
+
+    def move(self, old, new, flag):
+        """Move uma ocupação de ``old`` para ``new``."""
+        if old != new:
+            self.add(new, flag)
+            self.remove(old, flag)
+
+    def has(self, pos, mask):
+        """``pos`` tem alguma das flags de ``mask``? Fora da grade é False."""
+        x, y = pos
+        if not (0 <= x < self.w and 0 <= y < self.h):
+            return False
+        return bool(self.flags[y * self.w + x] & mask)
+
+    def is_free(self, pos):
+        """Célula dentro da grade e sem nenhuma flag."""
+        x, y = pos
+        return 0 <= x < self.w and 0 <= y < self.h and not self.flags[y * self.w + x]
+
+    def sample_free(self, k, rng, exclude=None):
+        """Sorteia até ``k`` posições sem nenhuma flag.
+
+        ``exclude`` é qualquer contêiner de posições (x, y) a evitar.
+        """
+        w = self.w
+
+        def _rejected(i):
+            return (i % w, i // w) in exclude
+
+        reject = _rejected if exclude is not None else None
+        return [(i % w, i // w) for i in self.free.sample(k, rng, reject)]
+
+    def view(self, mask):
+        """Objeto com ``in`` que consulta as flags de ``mask``."""
+        return GridMask(self, mask)
+
+
+class GridMask:
+    """Visão de uma OccupancyGrid que responde a ``pos in visão``."""
+
+    __slots__ = ("grid", "mask")
+
+    def __init__(self, grid, mask):
+        self.grid = grid
+        self.mask = mask
+
+    def __contains__(self, pos):
+        return self.grid.has(pos, self.mask)
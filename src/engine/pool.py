@@ -0,0 +1,29 @@
+"""Execução em blocos num pool de processos, com fila limitada."""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+
+
+def run_chunked(pool, fn, items, chunk_size, max_pending, *args):
+    """Gera ``fn(bloco, *args)`` para blocos de ``items`` à medida que terminam.
+
+    Cada bloco tem até ``chunk_size`` itens e no máximo ``max_pending``
+    ficam pendentes no ``pool``, então a memória não cresce com o número
+    de itens. Os resultados saem na ordem em que os blocos terminam.
+    """
+    items = iter(items)
+
+    def next_chunk():
+        return [item for _, item in zip(range(chunk_size), items)]
+
+    pending = set()
+    while True:
+        while len(pending) < max_pending:
+            chunk = next_chunk()
+            if not chunk:
+                break
+            pending.add(pool.submit(fn, chunk, *args))
+        if not pending:
+            return
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
@@ -0,0 +1,271 @@
+"""Gravação e reprodução de partidas em formato binário compacto.
+
+Formato (little-endian, só se acrescenta ao fim):
+    cabeçalho: b"SNKR", versão (u8), semente (i64), hash do Config (8 bytes)
+    registros: delta de tick (varint) + operação (u8)
+
+O tick é ``Simulation.steps`` no momento da entrada: a operação vale antes
+do passo seguinte. Cada registro é gravado e descarregado na hora, então
+um arquivo cortado no meio (queda do jogo) ainda reproduz o trecho salvo.
+
+Uso:
+    python -m src.engine.replay replays/arquivo.snkr
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import time
+
+# Imports com fallback
+try:
+    from ..configs.config import Config
+    from .simulation import Simulation, SimStatus, Action
+except ImportError:
+    try:
+        from src.configs.config import Config
+        from src.engine.simulation import Simulation, SimStatus, Action
+    except ImportError:
+        import sys
+
+        src_dir = os.path.dirname(os.path.dirname(__file__))
+        for name in ("configs", "engine"):
+            sys.path.append(os.path.join(src_dir, name))
+        from config import Config
+        from simulation import Simulation, SimStatus, Action
+
+
+MAGIC = b"SNKR"
+VERSION = 1
+HEADER = struct.Struct("<4sBq8s")
+
+
+class Op:
+    """Operações gravadas (as de 1 a 5 são os códigos de Action)."""
+
+    END = 0
+    PAUSE = 6
+    RESUME = 7
+    START_PHASE = 8
+    RESTART_PHASE = 9
+
+
+# Atributos do Config que mudam a partida; outro valor, outro jogo
+GAMEPLAY_KEYS = (
+    "GRID_W",
+    "GRID_H",
+    "CELL",
+    "FIELD_Y",
+    "TARGET_PHRASE",
+    "BASE_SPEED",
+    "PHASE_CAP",
+    "INC_PER_CHAR",
+    "GLOBAL_CAP",
+    "SIM_HZ",
+    "SPIDERS_BY_PHASE",
+    "SPIDER_STEP_BY_PHASE",
+    "DROP_RATE_BY_PHASE",
+    "POWER_UP_SPAWN_TIME",
+)
+
+
+def config_hash():
+    """Impressão digital das regras atuais (8 bytes)."""
+    values = repr([(key, getattr(Config, key)) for key in GAMEPLAY_KEYS])
+    return hashlib.sha1(values.encode("utf-8")).digest()[:8]
+
+
+def _varint(n):
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+class ReplayRecorder:
+    """Grava as entradas de uma partida à medida que acontecem.
+
+    Erros de disco desligam a gravação em silêncio, como no ranking: o
+    jogo continua sem replay.
+    """
+
+    def __init__(self, path, seed):
+        self.path = path
+        self.last_tick = 0
+        try:
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            self.stream = open(path, "wb")
+            self._write(HEADER.pack(MAGIC, VERSION, seed, config_hash()))
+        except OSError:
+            self.stream = None
+
+    def _write(self, data):
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(data)
+            self.stream.flush()
+        except OSError:
+            self.close_quietly()
+
+    def record(self, tick, op):
+        """Acrescenta ``op`` no ``tick`` (não decrescente)."""
+        self._write(_varint(tick - self.last_tick) + bytes((op,)))
+        self.last_tick = tick
+
+    def close(self, tick=None):
+        """Marca o fim da partida e fecha o arquivo."""
+        if self.stream is None:
+            return
+        self.record(self.last_tick if tick is None else tick, Op.END)
+        self.close_quietly()
+
+    def close_quietly(self):
+        """Fecha sem marcar o fim."""
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError:
+                pass
+            self.stream = None
+
+
+class ReplayPlayer:
+    """Lê um replay e o aplica a uma Simulation.
+
+    ``run`` reproduz tudo sem janela, passo a passo, o mais rápido
+    possível; ``advance`` segue o relógio do jogo para assistir na janela.
+    """
+
+    def __init__(self, data):
+        if len(data) < HEADER.size:
+            raise ValueError("replay sem cabeçalho")
+        magic, version, self.seed, digest = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("arquivo não é um replay conhecido")
+        if digest != config_hash():
+            raise ValueError("replay gravado com outra configuração de jogo")
+
+        self.records = []
+        self.complete = False
+        tick = 0
+        i = HEADER.size
+        while i < len(data):
+            delta = shift = 0
+            while i < len(data) and data[i] & 0x80:
+                delta |= (data[i] & 0x7F) << shift
+                shift += 7
+                i += 1
+            if i + 1 >= len(data):
+                break  # registro cortado: fica o trecho anterior
+            delta |= data[i] << shift
+            tick += delta
+            op = data[i + 1]
+            i += 2
+            if op == Op.END:
+                self.end_tick = tick
+                self.complete = True
+                break
+            self.records.append((tick, op))
+        if not self.complete:
+            self.end_tick = self.records[-1][0] if self.records else 0
+        self.cursor = 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    @property
+    def finished(self):
+        """Todas as entradas já foram aplicadas."""
+        return self.cursor >= len(self.records)
+
+    def start(self, sim):
+        """Reinicia ``sim`` na semente do replay."""
+        self.cursor = 0
+        return sim.reset(self.seed)
+
+    def apply_due(self, sim):
+        """Aplica as entradas cujo tick já chegou."""
+        records = self.records
+        while self.cursor < len(records) and records[self.cursor][0] <= sim.steps:
+            self._apply(sim, records[self.cursor][1])
+            self.cursor += 1
+
+    @staticmethod
+    def _apply(sim, op):
+        if op in Action.DIRECTIONS or op == Action.SHOOT:
+            sim.apply(op)
+        elif op == Op.START_PHASE:
+            sim.start_phase()
+        elif op == Op.RESTART_PHASE:
+            sim.restart_phase()
+
+    def done(self, sim):
+        """A reprodução chegou ao último tick gravado."""
+        return self.finished and sim.steps >= self.end_tick
+
+    def advance(self, sim, dt):
+        """Como ``Simulation.advance``, injetando as entradas gravadas.
+
+        Nunca passa do último tick gravado. Transições (nova fase, repetir
+        fase) gravadas no tick em que a partida parou também são
+        aplicadas, para ela seguir.
+        """
+        max_steps = min(Config.SIM_MAX_STEPS, max(self.end_tick - sim.steps, 0))
+        events = sim.advance(dt, max_steps, inputs=self.apply_due)
+        self.apply_due(sim)
+        return events
+
+    def run(self, sim=None):
+        """Reproduz o replay inteiro sem janela e devolve a Simulation."""
+        sim = sim or Simulation()
+        self.start(sim)
+        dt = 1.0 / Config.SIM_HZ
+        step = sim.step
+        for tick, op in self.records + [(self.end_tick, Op.END)]:
+            while sim.steps < tick:
+                if sim.status != SimStatus.PLAYING:
+                    raise ValueError(
+                        f"replay dessincronizado no tick {sim.steps} "
+                        f"(partida em '{sim.status}')"
+                    )
+                step(Action.NONE, dt)
+            self._apply(sim, op)
+        self.cursor = len(self.records)
+        return sim
+
+
+def replay_path(seed, folder=None):
+    """Caminho novo para o replay de uma partida."""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(folder or Config.REPLAY_DIR, f"{stamp}-{seed:016x}.snkr")
+
+
+def main(argv=None):
+    """Reproduz replays sem janela e mostra o resultado."""
+    parser = argparse.ArgumentParser(description="Reprodução headless de replays.")
+    parser.add_argument("paths", nargs="+")
+    args = parser.parse_args(argv)
+
+    sim = Simulation()
+    for path in args.paths:
+        player = ReplayPlayer.load(path)
+        started = time.perf_counter()
+        player.run(sim)
+        elapsed = time.perf_counter() - started
+        trecho = "" if player.complete else " (trecho, sem fim gravado)"
+        print(
+            f"{path}: {sim.status} na fase {sim.phase}, {sim.time:.3f}s de jogo, "
+            f"{sim.steps} ticks em {elapsed * 1000:.1f} ms{trecho}"
+        )
+
+
+if __name__ == "__main__":
+    main()
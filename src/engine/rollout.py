@@ -0,0 +1,254 @@
+"""Partidas headless em massa num pool de processos.
+
+Uso:
+    python -m src.engine.rollout --games 10000 --policy greedy
+    python -m src.engine.rollout --set SPIDER_STEP_BY_PHASE='{"1": 0.4}'
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Imports com fallback
+try:
+    from ..configs.config import Config
+    from .simulation import Simulation, SimStatus, Action
+    from .grid import OccupancyGrid
+    from .pool import run_chunked
+except ImportError:
+    try:
+        from src.configs.config import Config
+        from src.engine.simulation import Simulation, SimStatus, Action
+        from src.engine.grid import OccupancyGrid
+        from src.engine.pool import run_chunked
+    except ImportError:
+        import sys
+
+        src_dir = os.path.dirname(os.path.dirname(__file__))
+        for name in ("configs", "engine"):
+            sys.path.append(os.path.join(src_dir, name))
+        from config import Config
+        from simulation import Simulation, SimStatus, Action
+        from grid import OccupancyGrid
+        from pool import run_chunked
+
+
+# ----------------------------------------------------------------------
+# Políticas: recebem a Simulation e um random.Random próprio da partida
+# e devolvem um código de Action.
+
+
+def random_policy(sim, rng):
+    """Vira para uma direção aleatória de vez em quando."""
+    if rng.random() < 0.1:
+        return rng.choice(list(Action.DIRECTIONS))
+    return Action.NONE
+
+
+def greedy_policy(sim, rng):
+    """Vai até a próxima letra evitando mortes imediatas e atira em aranhas."""
+    hx, hy = sim.snake[0]
+
+    if sim.bullets > 0 and _spider_ahead(sim, hx, hy):
+        return Action.SHOOT
+
+    target = sim.pos_by_idx.get(sim.char_index)
+    if target is None:
+        return Action.NONE
+    tx, ty = target
+
+    G = OccupancyGrid
+    grid, tail = sim.grid, sim.snake[-1]
+
+    best, best_dist = Action.NONE, None
+    for action, (dx, dy) in Action.DIRECTIONS.items():
+        if (dx, dy) == (-sim.direction[0], -sim.direction[1]):
+            continue
+        cell = nx, ny = hx + dx, hy + dy
+        if not grid.in_bounds(cell) or grid.has(cell, G.SPIDER | G.PILLAR):
+            continue
+        if grid.has(cell, G.BODY) and cell != tail:
+            continue
+        if grid.has(cell, G.LETTER) and cell != target:
+            continue
+        dist = abs(tx - nx) + abs(ty - ny) + rng.random() * 0.5
+        if best_dist is None or dist < best_dist:
+            best, best_dist = action, dist
+    return best
+
+
+def _spider_ahead(sim, hx, hy):
+    """Há aranha na linha de tiro, à frente da cabeça?"""
+    dx, dy = sim.direction
+    for s in sim.spiders:
+        sx, sy = s.pos
+        if dx and sy == hy and (sx - hx) * dx > 0:
+            return True
+        if dy and sx == hx and (sy - hy) * dy > 0:
+            return True
+    return False
+
+
+POLICIES = {"random": random_policy, "greedy": greedy_policy}
+
+
+def resolve_policy(name):
+    """Política por nome curto ou ``modulo:funcao``."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, attr = name.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+# ----------------------------------------------------------------------
+# Execução
+
+
+def play_game(seed, policy, dt=None, max_time=600.0):
+    """Joga uma partida completa e devolve o resumo.
+
+    Sem ``dt``, usa o tick fixo do jogo (``1 / Config.SIM_HZ``), o mesmo
+    dos replays e do verificador.
+    """
+    if dt is None:
+        dt = 1.0 / Config.SIM_HZ
+    sim = Simulation(seed)
+    rng = random.Random(seed)
+    ticks = 0
+
+    while sim.time < max_time:
+        if sim.status == SimStatus.LEVEL:
+            sim.start_phase()
+        elif sim.status != SimStatus.PLAYING:
+            break
+        sim.step(policy(sim, rng), dt)
+        ticks += 1
+
+    reason = sim.death_reason
+    if sim.status == SimStatus.PLAYING:
+        reason = "Tempo"
+
+    return {
+        "seed": seed,
+        "won": sim.status == SimStatus.VICTORY,
+        "death_reason": reason,
+        "time": round(sim.time, 3),
+        "phase": sim.phase,
+        "spider_kills": sim.spider_kills,
+        "ticks": ticks,
+    }
+
+
+def _init_worker(overrides):
+    """Aplica ajustes de balanceamento no Config do processo filho."""
+    apply_overrides(overrides)
+
+
+def apply_overrides(overrides):
+    """Sobrescreve atributos do Config (chaves de dict por fase viram int)."""
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict):
+            merged = dict(getattr(Config, key))
+            merged.update({int(k): v for k, v in value.items()})
+            value = merged
+        setattr(Config, key, value)
+
+
+def _play_chunk(seeds, policy_name, dt, max_time):
+    policy = resolve_policy(policy_name)
+    return [play_game(seed, policy, dt, max_time) for seed in seeds]
+
+
+def run_rollouts(
+    games,
+    policy="greedy",
+    workers=None,
+    chunk_size=64,
+    base_seed=0,
+    dt=None,
+    max_time=600.0,
+    overrides=None,
+):
+    """Gera os resultados em blocos à medida que os processos terminam.
+
+    Até ``2 * workers`` blocos ficam pendentes (ver ``run_chunked``).
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = range(base_seed, base_seed + games)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(overrides,)
+    ) as pool:
+        yield from run_chunked(
+            pool, _play_chunk, seeds, chunk_size, 2 * workers, policy, dt, max_time
+        )
+
+
+def main(argv=None):
+    """Linha de comando com relatório de vazão."""
+    parser = argparse.ArgumentParser(description="Rollouts headless do Snake.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--policy", default="greedy")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-time", type=float, default=600.0)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="CHAVE=JSON",
+        help="Sobrescreve um atributo do Config, ex.: BASE_SPEED='{\"1\": 3.0}'",
+    )
+    args = parser.parse_args(argv)
+
+    overrides = {}
+    for item in args.set:
+        key, _, value = item.partition("=")
+        overrides[key] = json.loads(value)
+
+    started = time.perf_counter()
+    games = wins = ticks = kills = 0
+    total_time = 0.0
+    reasons = Counter()
+
+    for chunk in run_rollouts(
+        args.games,
+        policy=args.policy,
+        workers=args.workers,
+        chunk_size=args.chunk,
+        base_seed=args.seed,
+        max_time=args.max_time,
+        overrides=overrides,
+    ):
+        for r in chunk:
+            games += 1
+            wins += r["won"]
+            ticks += r["ticks"]
+            kills += r["spider_kills"]
+            total_time += r["time"]
+            if not r["won"]:
+                reasons[r["death_reason"]] += 1
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"{games}/{args.games} partidas | {games / elapsed:.0f} partidas/s | "
+            f"{ticks / elapsed:.0f} ticks/s"
+        )
+
+    elapsed = time.perf_counter() - started
+    print(f"\nTempo total: {elapsed:.2f}s")
+    if games:
+        print(f"Vitórias: {wins} ({100.0 * wins / games:.1f}%)")
+        print(f"Tempo médio de partida: {total_time / games:.2f}s")
+        print(f"Aranhas abatidas por partida: {kills / games:.2f}")
+        for reason, count in reasons.most_common():
+            print(f"  {reason}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,493 @@
+"""Simulação headless das regras do jogo Snake."""
+
+import random
+
+# Imports com fallback
+try:
+    from ..configs.config import Config
+    from ..interfaces.entities import Bullet, Spider, PowerUp
+    from .grid import OccupancyGrid
+    from .flowfield import FlowField
+    from .snake import SnakeBody
+except ImportError:
+    try:
+        from src.configs.config import Config
+        from src.interfaces.entities import Bullet, Spider, PowerUp
+        from src.engine.grid import OccupancyGrid
+        from src.engine.flowfield import FlowField
+        from src.engine.snake import SnakeBody
+    except ImportError:
+        import sys
+        import os
+
+        src_dir = os.path.dirname(os.path.dirname(__file__))
+        for name in ("configs", "interfaces", "engine"):
+            sys.path.append(os.path.join(src_dir, name))
+        from config import Config
+        from entities import Bullet, Spider, PowerUp
+        from grid import OccupancyGrid
+        from flowfield import FlowField
+        from snake import SnakeBody
+
+
+class SimStatus:
+    """Estados da simulação (mesmos valores de GameState)."""
+
+    PLAYING = "play"
+    LEVEL = "level"
+    GAME_OVER = "over"
+    VICTORY = "win"
+
+
+class Action:
+    """Ações aceitas pela simulação."""
+
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    UP = 3
+    DOWN = 4
+    SHOOT = 5
+
+    DIRECTIONS = {LEFT: (-1, 0), RIGHT: (1, 0), UP: (0, -1), DOWN: (0, 1)}
+
+
+class Simulation:
+    """Regras do jogo sem janela, fontes ou áudio.
+
+    ``step`` devolve eventos ``(tipo, posição, dado)``; quem renderiza
+    decide que som tocar e quais partículas criar para cada um.
+
+    ``advance`` consome tempo real em passos fixos de ``1 / SIM_HZ``, então
+    a mesma semente e as mesmas ações dão a mesma partida em qualquer
+    máquina. Cada subsistema (letras e aranhas ao surgir, movimento das
+    aranhas, power-ups) tem seu próprio gerador, derivado da semente.
+    """
+
+    def __init__(self, seed=None):
+        self.grid = OccupancyGrid(Config.GRID_W, Config.GRID_H)
+        walls = OccupancyGrid.BODY | OccupancyGrid.PILLAR
+        self._spider_blocked = self.grid.view(walls)
+        self.flow = FlowField(self.grid, walls)
+        self.snake = SnakeBody()
+        self.reset(seed)
+
+    def reset(self, seed=None, phase=1):
+        """Inicia uma nova partida."""
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.spawn_rng = random.Random(self.rng.getrandbits(64))
+        self.spider_rng = random.Random(self.rng.getrandbits(64))
+        self.power_up_rng = random.Random(self.rng.getrandbits(64))
+        self.steps = 0  # passos rodados desde o reset (ticks do replay)
+        self._new_match(phase)
+        return self.observe()
+
+    def restart_phase(self):
+        """Reinicia a fase atual do zero."""
+        self._new_match(self.phase)
+        return self.observe()
+
+    def start_phase(self):
+        """Libera a fase seguinte após a transição de nível."""
+        if self.status == SimStatus.LEVEL:
+            self.place_letters()
+            self.status = SimStatus.PLAYING
+
+    def _new_match(self, phase):
+        """Estado inicial de uma partida na fase indicada."""
+        self.phase = phase
+        self.status = SimStatus.PLAYING
+        self.time = 0.0
+        self.events = []
+        self.frame_acc = 0.0
+
+        self.grid.clear()
+        self.snake.reset((Config.GRID_W // 2, Config.GRID_H // 2))
+        self.grid.add(self.snake[0], OccupancyGrid.BODY)
+        self.flow.invalidate()
+        self.flow.set_source(self.snake[0])
+        self.direction = (1, 0)
+        self.velocity = Config.BASE_SPEED[phase]
+        self.move_acc = 0.0
+        self.char_index = 0
+
+        # Letter positions
+        self.pos_by_idx = {}
+        self.idx_by_pos = {}
+
+        # Enemies
+        self.spiders = []
+        self.pillars = []
+
+        # Shooting system
+        self.bullets = 0
+        self.active_bullets = []
+
+        # Power-ups
+        self.power_ups = []
+        self.power_up_timer = 0.0
+        self.power_up_effects = {
+            "speed": {"active": False, "end_time": 0, "multiplier": 1.5},
+            "freeze": {"active": False, "end_time": 0, "multiplier": 0.5},
+            "shield": {"active": False, "end_time": 0},
+        }
+
+        # Stats
+        self.spider_kills = 0
+        self.death_reason = ""
+
+        self.spawn_enemies()
+        self.place_letters()
+
+    def apply(self, action):
+        """Aplica uma ação sem avançar o tempo."""
+        if self.status != SimStatus.PLAYING:
+            return
+
+        if action in Action.DIRECTIONS:
+            dx, dy = Action.DIRECTIONS[action]
+            if self.direction != (-dx, -dy):
+                self.direction = (dx, dy)
+        elif action == Action.SHOOT:
+            self.shoot()
+
+    def step(self, action=Action.NONE, dt=None):
+        """Aplica a ação, avança ``dt`` segundos e devolve os eventos.
+
+        Sem ``dt``, avança um tick de ``1 / Config.SIM_HZ``, como o jogo.
+        """
+        if dt is None:
+            dt = 1.0 / Config.SIM_HZ
+        self.apply(action)
+        if self.status == SimStatus.PLAYING:
+            self._update(dt)
+            self.steps += 1
+        events, self.events = self.events, []
+        return events
+
+    def advance(self, dt, max_steps=None, inputs=None):
+        """Avança ``dt`` segundos de tempo real em passos fixos.
+
+        O que sobra abaixo de um passo fica guardado para o próximo
+        quadro (``alpha`` diz quanto já passou dele). No máximo
+        ``max_steps`` passos rodam por chamada; o atraso além disso é
+        descartado, para um travamento não virar uma fila de quadros
+        lentos. ``inputs(sim)``, se dado, é chamado antes de cada passo
+        (é assim que um replay injeta as teclas no tick certo).
+        """
+        tick = 1.0 / Config.SIM_HZ
+        if max_steps is None:
+            max_steps = Config.SIM_MAX_STEPS
+
+        self.frame_acc += dt
+        events = []
+        steps = 0
+        while self.frame_acc >= tick and self.status == SimStatus.PLAYING:
+            if steps == max_steps:
+                self.frame_acc %= tick
+                break
+            self.frame_acc -= tick
+            if inputs is not None:
+                inputs(self)
+            events += self.step(Action.NONE, tick)
+            steps += 1
+        return events
+
+    @property
+    def alpha(self):
+        """Fração do passo fixo já decorrida (para interpolar o desenho)."""
+        return min(self.frame_acc * Config.SIM_HZ, 1.0)
+
+    def observe(self):
+        """Retrato do estado atual em tipos simples."""
+        return {
+            "status": self.status,
+            "phase": self.phase,
+            "time": self.time,
+            "snake": list(self.snake),
+            "labels": list(self.snake.labels),
+            "direction": self.direction,
+            "velocity": self.velocity,
+            "char_index": self.char_index,
+            "letters": dict(self.pos_by_idx),
+            "spiders": [s.pos for s in self.spiders],
+            "pillars": [(p.pos, p.ttl) for p in self.pillars],
+            "power_ups": [(p.pos, p.type) for p in self.power_ups],
+            "effects": {k: v["active"] for k, v in self.power_up_effects.items()},
+            "bullets": self.bullets,
+            "active_bullets": [b.get_grid_pos() for b in self.active_bullets],
+            "spider_kills": self.spider_kills,
+            "death_reason": self.death_reason,
+        }
+
+    def _emit(self, kind, pos, data=None):
+        self.events.append((kind, pos, data))
+
+    def shoot(self):
+        """Dispara projétil."""
+        if self.bullets <= 0:
+            return
+
+        hx, hy = self.snake[0]
+        bullet_x = hx * Config.CELL + Config.CELL // 2
+        bullet_y = Config.FIELD_Y + hy * Config.CELL + Config.CELL // 2
+        self.active_bullets.append(Bullet(bullet_x, bullet_y, self.direction))
+        self.bullets -= 1
+        self._emit("shoot", self.snake[0])
+
+    def spawn_enemies(self):
+        """Gera inimigos."""
+        for spider in self.spiders:
+            self.grid.remove(spider.pos, OccupancyGrid.SPIDER)
+        self.spiders = []
+        count = Config.SPIDERS_BY_PHASE[self.phase]
+        step_time = Config.SPIDER_STEP_BY_PHASE[self.phase]
+        drop_rate = Config.DROP_RATE_BY_PHASE[self.phase]
+
+        for pos in self.grid.sample_free(count, self.spawn_rng):
+            self.spiders.append(
+                Spider(pos, step_time, drop_rate, rng=self.spider_rng)
+            )
+            self.grid.add(pos, OccupancyGrid.SPIDER)
+
+    def place_letters(self):
+        """Posiciona letras com tentativas de segurança."""
+        for pos in self.pos_by_idx.values():
+            self.grid.remove(pos, OccupancyGrid.LETTER)
+
+        positions = self.grid.sample_free(Config.NCHARS, self.spawn_rng)
+        if len(positions) < Config.NCHARS:
+            positions = []
+        self.pos_by_idx = dict(enumerate(positions))
+        self.idx_by_pos = {pos: i for i, pos in self.pos_by_idx.items()}
+
+        for pos in self.pos_by_idx.values():
+            self.grid.add(pos, OccupancyGrid.LETTER)
+
+    def _update(self, dt):
+        """Avança a lógica do jogo."""
+        self.time += dt
+
+        # Update bullets
+        self.active_bullets = [
+            bullet for bullet in self.active_bullets if bullet.update(dt)
+        ]
+
+        # Check bullet-spider collisions
+        for bullet in self.active_bullets[:]:
+            bullet_pos = bullet.get_grid_pos()
+            for i, spider in enumerate(self.spiders):
+                if bullet_pos == spider.pos:
+                    self.spiders.pop(i)
+                    self.grid.remove(spider.pos, OccupancyGrid.SPIDER)
+                    self.spider_kills += 1
+                    if bullet in self.active_bullets:
+                        self.active_bullets.remove(bullet)
+                    self._emit("kill", spider.pos)
+                    break
+
+        # Update power-ups
+        self.power_up_timer += dt
+        if self.power_up_timer >= Config.POWER_UP_SPAWN_TIME:
+            if self._spawn_power_up():
+                self.power_up_timer = 0.0
+
+        # Check power-up effects expiration
+        for effect in self.power_up_effects.values():
+            if effect.get("active", False) and self.time >= effect.get("end_time", 0):
+                effect["active"] = False
+
+        # Snake movement
+        self.move_acc += dt
+        step = 1.0 / max(self.effective_velocity(), 0.0001)
+
+        while self.move_acc >= step:
+            self.move_acc -= step
+            if not self._move_snake() or self.status != SimStatus.PLAYING:
+                break
+
+        if self.status != SimStatus.PLAYING:
+            return
+
+        # Update enemies
+        new_pillars = []
+        for spider in self.spiders:
+            old = spider.pos
+            pillar = spider.update(
+                dt, self.snake[0], self._spider_blocked, field=self.flow
+            )
+            self.grid.move(old, spider.pos, OccupancyGrid.SPIDER)
+            if pillar:
+                new_pillars.append(pillar)
+        for pillar in new_pillars:
+            self.grid.add(pillar.pos, OccupancyGrid.PILLAR)
+        if new_pillars:
+            self.flow.invalidate()
+        self.pillars.extend(new_pillars)
+        self._update_pillars(dt)
+
+        # Check power-up collection
+        if self.grid.has(self.snake[0], OccupancyGrid.POWER_UP):
+            for i, power_up in enumerate(self.power_ups):
+                if self.snake[0] == power_up.pos:
+                    self._apply_power_up(power_up.type)
+                    self._emit("powerup", self.snake[0], power_up.type)
+                    self.power_ups.pop(i)
+                    self.grid.remove(power_up.pos, OccupancyGrid.POWER_UP)
+                    break
+
+        # Check spider bites snake
+        if (
+            self._any_spider_bites_snake()
+            and not self.power_up_effects["shield"]["active"]
+        ):
+            self._game_over("Aranha")
+
+    def _update_pillars(self, dt):
+        """Desconta o TTL dos pilares e libera os que expiraram."""
+        expired = False
+        for pillar in self.pillars:
+            if pillar.update(dt):
+                self.grid.remove(pillar.pos, OccupancyGrid.PILLAR)
+                self.flow.wall_removed(pillar.pos)
+                expired = True
+        if expired:
+            self.pillars = [p for p in self.pillars if p.ttl > 0]
+
+    def effective_velocity(self):
+        """Velocidade com os power-ups ativos."""
+        vel = self.velocity
+        if self.power_up_effects["speed"]["active"]:
+            vel *= self.power_up_effects["speed"]["multiplier"]
+        if self.power_up_effects["freeze"]["active"]:
+            vel *= self.power_up_effects["freeze"]["multiplier"]
+        return vel
+
+    def _any_spider_bites_snake(self):
+        """Verifica se alguma aranha mordeu a cobra."""
+        return any(s.pos in self.snake for s in self.spiders)
+
+    def _move_snake(self):
+        """Move a cobra."""
+        hx, hy = self.snake[0]
+        nx, ny = hx + self.direction[0], hy + self.direction[1]
+
+        # Check boundary collisions
+        if nx < 0 or nx >= Config.GRID_W or ny < 0 or ny >= Config.GRID_H:
+            self._game_over("Parede")
+            return False
+
+        # Check self collision (the tail cell is vacated on this step)
+        if self.snake.hits_self((nx, ny)):
+            self._game_over("Corpo")
+            return False
+
+        # Check enemy collisions (only if shield is not active)
+        if not self.power_up_effects["shield"]["active"]:
+            # Check spider collision
+            if self.grid.has((nx, ny), OccupancyGrid.SPIDER):
+                self._game_over("Aranha")
+                return False
+            # Check pillar collision
+            if self.grid.has((nx, ny), OccupancyGrid.PILLAR):
+                self._game_over("Pilar")
+                return False
+
+        # Move snake
+        self.snake.push_head((nx, ny))
+        self.grid.add((nx, ny), OccupancyGrid.BODY)
+        self.flow.set_source((nx, ny))
+
+        # Check letter collection
+        if (nx, ny) in self.idx_by_pos:
+            idx = self.idx_by_pos[(nx, ny)]
+            if idx == self.char_index:
+                self._collect_letter(idx)
+            else:
+                self._game_over("Letra errada")
+                return False
+        else:
+            # If not collecting a letter, remove tail
+            self.grid.remove(self.snake.pop_tail(), OccupancyGrid.BODY)
+
+        return True
+
+    def _collect_letter(self, idx):
+        """Coleta uma letra."""
+        self.snake.set_head_label(Config.SEQUENCE[idx])
+        self.char_index += 1
+        self.bullets += 1
+        self.velocity = min(
+            Config.GLOBAL_CAP,
+            min(Config.PHASE_CAP[self.phase], self.velocity + Config.INC_PER_CHAR),
+        )
+
+        # Remove letter from positions
+        pos = self.pos_by_idx[idx]
+        del self.idx_by_pos[pos]
+        del self.pos_by_idx[idx]
+        self.grid.remove(pos, OccupancyGrid.LETTER)
+
+        self._emit("collect", self.snake[0], idx)
+
+        # Check if phase completed
+        if self.char_index >= Config.NCHARS:
+            self._complete_phase()
+
+    def _complete_phase(self):
+        """Completa uma fase."""
+        self.char_index = 0
+        for pos in self.pos_by_idx.values():
+            self.grid.remove(pos, OccupancyGrid.LETTER)
+        self.pos_by_idx.clear()
+        self.idx_by_pos.clear()
+
+        if self.phase >= 3:
+            self.status = SimStatus.VICTORY
+            self._emit("win", self.snake[0], self.time)
+        else:
+            self.phase += 1
+            # Reset match but keep snake and labels
+            self.velocity = Config.BASE_SPEED[self.phase]
+            self.move_acc = 0.0
+            self.spawn_enemies()
+            self.status = SimStatus.LEVEL
+            self._emit("phase", self.snake[0], self.phase)
+
+    def _game_over(self, reason):
+        """Game over."""
+        self.death_reason = reason
+        self.status = SimStatus.GAME_OVER
+        self._emit("death", self.snake[0], reason)
+
+    def _spawn_power_up(self):
+        """Gera power-up."""
+        free_positions = self.grid.sample_free(1, self.power_up_rng)
+
+        if free_positions:
+            pos = free_positions[0]
+            power_type = self.power_up_rng.choice(PowerUp.TYPES)
+            self.power_ups.append(PowerUp(pos, power_type))
+            self.grid.add(pos, OccupancyGrid.POWER_UP)
+            return True
+        return False
+
+    def _apply_power_up(self, power_type):
+        """Aplica efeito do power-up."""
+        now = self.time
+
+        if power_type == "speed":
+            self.power_up_effects["speed"]["active"] = True
+            self.power_up_effects["speed"]["end_time"] = now + 10.0
+        elif power_type == "freeze":
+            self.power_up_effects["freeze"]["active"] = True
+            self.power_up_effects["freeze"]["end_time"] = now + 8.0
+        elif power_type == "shield":
+            self.power_up_effects["shield"]["active"] = True
+            self.power_up_effects["shield"]["end_time"] = now + 12.0
+        elif power_type == "time":
+            # Subtract 5 seconds from the run time
+            self.time -= 5.0
+        elif power_type == "kill":
+            self.bullets += 3
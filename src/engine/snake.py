@@ -0,0 +1,99 @@
+"""Corpo da cobra com operações O(1) nas pontas."""
+
+from collections import deque
+
+
+class SnakeBody:
+    """Segmentos da cabeça (índice 0) ao rabo, com rótulos alinhados.
+
+    ``cells`` e ``labels`` são deques paralelas, então empurrar a cabeça
+    e tirar o rabo não copiam a lista. ``_count`` conta quantos segmentos
+    ocupam cada célula: durante um passo a cabeça pode entrar na célula
+    que o rabo ainda ocupa, e a célula só sai do corpo quando a contagem
+    volta a zero.
+    """
+
+    def __init__(self, head=None):
+        self.cells = deque()
+        self.labels = deque()
+        self._count = {}
+        if head is not None:
+            self.reset(head)
+
+    def reset(self, head):
+        """Volta a ter só a cabeça em ``head``."""
+        self.cells.clear()
+        self.labels.clear()
+        self._count.clear()
+        self.push_head(head)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def __getitem__(self, i):
+        return self.cells[i]
+
+    def __contains__(self, pos):
+        return pos in self._count
+
+    @property
+    def head(self):
+        return self.cells[0]
+
+    @property
+    def tail(self):
+        return self.cells[-1]
+
+    def hits_self(self, pos):
+        """A cabeça bate no corpo ao entrar em ``pos``?
+
+        O rabo sai da célula no mesmo passo, então entrar nele é permitido
+        a menos que outro segmento também esteja lá.
+        """
+        n = self._count.get(pos, 0)
+        return n > (1 if pos == self.cells[-1] else 0)
+
+    def push_head(self, pos, label=None):
+        """Acrescenta um segmento na frente."""
+        self.cells.appendleft(pos)
+        self.labels.appendleft(label)
+        self._count[pos] = self._count.get(pos, 0) + 1
+
+    def pop_tail(self):
+        """Remove o último segmento e devolve sua célula."""
+        pos = self.cells.pop()
+        self.labels.pop()
+        n = self._count[pos] - 1
+        if n:
+            self._count[pos] = n
+        else:
+            del self._count[pos]
+        return pos
+
+    def set_head_label(self, label):
+        """Rotula o segmento da cabeça."""
+        self.labels[0] = label
+
+    def from_tail(self):
+        """Percorre o corpo do rabo até o segmento logo atrás da cabeça.
+
+        Gera ``(i, célula, anterior, seguinte, rótulo)``, onde ``anterior``
+        é o vizinho do lado do rabo (a própria célula no rabo) e
+        ``seguinte`` o vizinho do lado da cabeça.
+        """
+        cells = reversed(self.cells)
+        labels = reversed(self.labels)
+        i = len(self.cells) - 1
+        if i < 1:
+            return
+        behind = cell = next(cells)
+        label = next(labels)
+        for ahead in cells:
+            yield i, cell, behind, ahead, label
+            i -= 1
+            if i < 1:
+                return
+            behind, cell, label = cell, ahead, next(labels)
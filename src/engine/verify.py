@@ -0,0 +1,202 @@
+"""Verificação de pontuações pela reprodução headless dos replays.
+
+Cada submissão é uma linha JSON com o nome, o tempo alegado e o replay:
+    {"name": "Ana", "seconds": 155.542, "replay": "replays/arquivo.snkr"}
+
+O replay é reproduzido sem janela e a pontuação só vale se a partida
+termina em vitória com o mesmo tempo. Submissões malformadas (linha que
+não é JSON, tempo que não é número, replay ausente) são rejeitadas com o
+motivo, sem interromper as demais.
+
+Uso:
+    python -m src.engine.verify envios.jsonl
+    python -m src.engine.verify envios.jsonl --accept leaderboard.json
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Imports com fallback
+try:
+    from ..configs.config import Config
+    from ..utils.utils import open_score_manager
+    from .simulation import Simulation, SimStatus
+    from .replay import ReplayPlayer
+    from .pool import run_chunked
+except ImportError:
+    try:
+        from src.configs.config import Config
+        from src.utils.utils import open_score_manager
+        from src.engine.simulation import Simulation, SimStatus
+        from src.engine.replay import ReplayPlayer
+        from src.engine.pool import run_chunked
+    except ImportError:
+        import sys
+
+        src_dir = os.path.dirname(os.path.dirname(__file__))
+        for name in ("configs", "utils", "engine"):
+            sys.path.append(os.path.join(src_dir, name))
+        from config import Config
+        from utils import open_score_manager
+        from simulation import Simulation, SimStatus
+        from replay import ReplayPlayer
+        from pool import run_chunked
+
+
+# O ranking guarda o tempo com 3 casas; a diferença tem que sumir ali
+TOLERANCE = 0.0005
+
+
+def _rejected(seconds, reason):
+    return {
+        "ok": False,
+        "seconds": seconds,
+        "simulated": None,
+        "ticks": 0,
+        "reason": reason,
+    }
+
+
+def verify_replay(data, seconds, sim=None, max_time=600.0):
+    """Reproduz ``data`` e devolve o resultado da verificação."""
+    try:
+        claimed = float(seconds)
+    except (TypeError, ValueError):
+        claimed = math.nan
+    if not math.isfinite(claimed):
+        return _rejected(seconds, f"tempo alegado inválido: {seconds!r}")
+
+    result = _rejected(seconds, "")
+    try:
+        player = ReplayPlayer(data)
+        if not player.complete:
+            raise ValueError("replay incompleto")
+        if player.end_tick > max_time * Config.SIM_HZ:
+            raise ValueError("replay longo demais")
+        sim = player.run(sim or Simulation())
+    except ValueError as e:
+        result["reason"] = str(e)
+        return result
+
+    result["ticks"] = sim.steps
+    result["simulated"] = round(sim.time, 3)
+    if sim.status != SimStatus.VICTORY:
+        result["reason"] = f"partida terminou em '{sim.status}'"
+    elif abs(sim.time - claimed) > TOLERANCE:
+        result["reason"] = "tempo não confere"
+    else:
+        result["ok"] = True
+        result["reason"] = ""
+    return result
+
+
+def verify_submission(sub, sim=None, max_time=600.0):
+    """Verifica uma submissão (dict com name, seconds e replay)."""
+    path = sub.get("replay")
+    if "error" in sub:
+        result = _rejected(sub.get("seconds"), sub["error"])
+    elif not isinstance(path, str):
+        result = _rejected(sub.get("seconds"), "submissão sem replay")
+    else:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            result = _rejected(sub.get("seconds"), f"replay ilegível: {e}")
+        else:
+            result = verify_replay(data, sub.get("seconds"), sim, max_time)
+    result["name"] = str(sub.get("name") or "Jogador")
+    result["replay"] = path
+    return result
+
+
+def _verify_chunk(subs, max_time):
+    sim = Simulation()
+    return [verify_submission(sub, sim, max_time) for sub in subs]
+
+
+def verify_many(submissions, workers=None, chunk_size=16, max_time=600.0):
+    """Gera os resultados em blocos à medida que os processos terminam.
+
+    Usa o mesmo ``run_chunked`` dos rollouts, com até ``2 * workers``
+    blocos pendentes.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from run_chunked(
+            pool, _verify_chunk, submissions, chunk_size, 2 * workers, max_time
+        )
+
+
+def read_submissions(path):
+    """Lê as submissões de um arquivo JSON Lines.
+
+    Uma linha ilegível vira uma submissão só com ``error``, que a
+    verificação rejeita com esse motivo.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                sub = json.loads(line)
+            except ValueError as e:
+                sub = {"error": f"linha {number}: JSON inválido ({e})"}
+            if not isinstance(sub, dict):
+                sub = {"error": f"linha {number}: esperava um objeto JSON"}
+            yield sub
+
+
+def main(argv=None):
+    """Linha de comando com relatório de vazão."""
+    parser = argparse.ArgumentParser(description="Verifica pontuações por replay.")
+    parser.add_argument("submissions", help="arquivo JSON Lines com as submissões")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=16)
+    parser.add_argument("--max-time", type=float, default=600.0)
+    parser.add_argument(
+        "--accept",
+        metavar="RANKING",
+        help="grava as pontuações aprovadas neste ranking (.json ou .db)",
+    )
+    args = parser.parse_args(argv)
+
+    scores = open_score_manager(args.accept) if args.accept else None
+    started = time.perf_counter()
+    checked = accepted = ticks = 0
+
+    for chunk in verify_many(
+        read_submissions(args.submissions),
+        workers=args.workers,
+        chunk_size=args.chunk,
+        max_time=args.max_time,
+    ):
+        for r in chunk:
+            checked += 1
+            ticks += r["ticks"]
+            if r["ok"]:
+                accepted += 1
+                if scores:
+                    scores.add_score(r["name"], r["simulated"])
+            else:
+                print(f"REJEITADA {r['name']} ({r['replay']}): {r['reason']}")
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"{checked} verificadas | {checked / elapsed:.1f} submissões/s | "
+            f"{ticks / elapsed:.0f} ticks/s"
+        )
+
+    elapsed = time.perf_counter() - started
+    print(f"\nTempo total: {elapsed:.2f}s")
+    print(f"Aprovadas: {accepted} de {checked}")
+    if scores:
+        scores.close()
+
+
+if __name__ == "__main__":
+    main()
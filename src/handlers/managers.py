@@ -1,6 +1,8 @@
 """Gerenciadores de sistema."""
 
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 
 # Imports com fallback
@@ -156,6 +158,108 @@ class ThemeManager:
         pass
 
 
+class BackgroundLoader:
+    """Decodifica imagens de fundo numa thread, com cache LRU limitado em bytes.
+
+    ``request`` devolve o fundo pronto (imagem escalada, sombra e grade do
+    tema) ou ``None`` enquanto ele é preparado; quem chama mostra a cor
+    lisa do tema até lá. ``poll``, no loop principal, recolhe o que ficou
+    pronto e diz se algo chegou. A chave é (caminho, mtime, tamanho,
+    tema): trocar o arquivo ou o tema gera outra entrada.
+    """
+
+    def __init__(self, max_bytes, notify=None):
+        self.max_bytes = max_bytes
+        self.notify = notify
+        self.cache = OrderedDict()
+        self.bytes = 0
+        self.pending = {}
+        self.failed = set()
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bg-loader")
+
+    def request(self, path, size, theme_name, grid_color):
+        """Fundo pronto para ``path`` ou ``None`` (e agenda a decodificação)."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        key = (path, mtime, tuple(size), theme_name)
+        surf = self.cache.get(key)
+        if surf is not None:
+            self.cache.move_to_end(key)
+            return surf
+        if key not in self.pending and key not in self.failed:
+            future = self.pool.submit(self._decode, path, size, grid_color)
+            if self.notify is not None:
+                future.add_done_callback(lambda _: self.notify())
+            self.pending[key] = future
+        return None
+
+    @staticmethod
+    def _decode(path, size, grid_color):
+        """Roda na thread: carrega, escala e compõe sombra e grade.
+
+        Nada aqui toca a janela: ``convert`` depende do vídeo, que o SDL
+        só aceita na thread principal, e fica para ``poll``.
+        """
+        img = pygame.image.load(path)
+        if img.get_bitsize() not in (24, 32):
+            # smoothscale só aceita 24 ou 32 bits (PNG com paleta, por ex.)
+            img = BackgroundLoader._rgb32(img)
+        # Sombra e grade em 32 bits, como no formato da tela
+        surf = BackgroundLoader._rgb32(pygame.transform.smoothscale(img, size))
+        shade = pygame.Surface(size, pygame.SRCALPHA)
+        shade.fill((0, 0, 0, 48))
+        surf.blit(shade, (0, 0))
+        BackgroundLoader.draw_grid(surf, grid_color)
+        return surf
+
+    @staticmethod
+    def _rgb32(img):
+        """Cópia de ``img`` em 32 bits sem alfa, sem passar pela janela."""
+        surf = pygame.Surface(img.get_size(), 0, 32)
+        surf.blit(img, (0, 0))
+        return surf
+
+    @staticmethod
+    def draw_grid(surf, grid_color):
+        """Grade das células sobre o fundo."""
+        w, h = surf.get_size()
+        grid = pygame.Surface((w, h), pygame.SRCALPHA)
+        col = (*grid_color, 28)
+        for x in range(0, w, Config.CELL):
+            pygame.draw.line(grid, col, (x, 0), (x, h))
+        for y in range(0, h, Config.CELL):
+            pygame.draw.line(grid, col, (0, y), (w, y))
+        surf.blit(grid, (0, 0))
+
+    def poll(self):
+        """Guarda no cache o que terminou; devolve se algum fundo chegou."""
+        ready = False
+        for key, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[key]
+            try:
+                surf = future.result().convert()
+            except Exception:
+                self.failed.add(key)
+                continue
+            self.cache[key] = surf
+            self.bytes += surf.get_pitch() * surf.get_height()
+            ready = True
+        while self.bytes > self.max_bytes and len(self.cache) > 1:
+            _, old = self.cache.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+        return ready
+
+    def close(self):
+        """Descarta o que estiver na fila e para a thread."""
+        for future in self.pending.values():
+            future.cancel()
+        self.pool.shutdown(wait=False)
+
+
 class AudioManager:
     """Gerencia áudio."""
 
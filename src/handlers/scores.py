@@ -0,0 +1,405 @@
+"""Ranking global dos quiosques: servidor asyncio e cliente com fila offline.
+
+Protocolo: uma linha JSON por mensagem, numa conexão TCP que fica aberta.
+    {"op": "add", "scores": [{"id", "name", "seconds", "ts", "kiosk"}, ...]}
+        -> {"ok": true, "accepted": n, "rejected": m}
+    {"op": "top", "n": 10} -> {"ok": true, "top": [...]}
+
+O ``id`` de cada pontuação torna o reenvio seguro: se a conexão cai antes
+da confirmação, o cliente manda o lote de novo e o servidor ignora o que
+já tinha. Entradas malformadas são descartadas uma a uma (contadas em
+``rejected``), sem derrubar o lote: senão o cliente o reenviaria para
+sempre.
+
+Uso:
+    python -m src.handlers.scores --port 8765 --snapshot ranking_global.json
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+# Imports com fallback
+try:
+    from ..configs.config import Config
+    from ..utils.utils import FileManager
+except ImportError:
+    try:
+        from src.configs.config import Config
+        from src.utils.utils import FileManager
+    except ImportError:
+        import sys
+
+        current_dir = os.path.dirname(__file__)
+        config_dir = os.path.join(os.path.dirname(current_dir), "configs")
+        utils_dir = os.path.join(os.path.dirname(current_dir), "utils")
+        sys.path.extend([config_dir, utils_dir])
+        from config import Config
+        from utils import FileManager
+
+
+class ScoreServer:
+    """Junta as pontuações de todos os quiosques num ranking em memória.
+
+    Guarda os ``keep`` melhores tempos, ordenados com bisect, e grava um
+    snapshot a cada ``snapshot_every`` segundos se algo mudou (numa
+    thread, para não parar o loop). Ao subir, relê o snapshot.
+
+    Para ignorar reenvios basta lembrar os ``seen_limit`` ids mais
+    recentes: um cliente só reenvia o lote que ainda não foi confirmado.
+    """
+
+    def __init__(
+        self, snapshot_path=None, keep=1000, snapshot_every=5.0, seen_limit=100000
+    ):
+        self.snapshot_path = snapshot_path
+        self.keep = keep
+        self.snapshot_every = snapshot_every
+        self.seen_limit = seen_limit
+        self.entries = []
+        self.times = []
+        self.seen = OrderedDict()
+        self.received = 0
+        self.rejected = 0
+        self.dirty = False
+        if snapshot_path:
+            self.add(FileManager.load_json(snapshot_path, []))
+            self.received = self.rejected = 0
+            self.dirty = False
+
+    @staticmethod
+    def _parse(entry):
+        """Entrada normalizada, ou ``None`` se estiver malformada."""
+        if not isinstance(entry, dict):
+            return None
+        try:
+            seconds = round(float(entry["seconds"]), 3)
+            ts = int(entry.get("ts", 0))
+        except (KeyError, TypeError, ValueError, OverflowError):
+            return None
+        key = entry.get("id")
+        if not math.isfinite(seconds) or seconds < 0:
+            return None
+        if key is not None and not isinstance(key, str):
+            return None
+        return {
+            "id": key,
+            "name": str(entry.get("name") or "Jogador"),
+            "seconds": seconds,
+            "ts": ts,
+            "kiosk": str(entry.get("kiosk", "")),
+        }
+
+    def _remember(self, key):
+        """Registra ``key``; devolve False se já tinha chegado."""
+        if key in self.seen:
+            return False
+        self.seen[key] = None
+        if len(self.seen) > self.seen_limit:
+            self.seen.popitem(last=False)
+        return True
+
+    def _insert(self, entry):
+        key = entry["id"]
+        if key is not None and not self._remember(key):
+            return False
+        seconds = entry["seconds"]
+        if len(self.times) >= self.keep and seconds >= self.times[-1]:
+            return True
+        i = bisect.bisect_right(self.times, seconds)
+        self.times.insert(i, seconds)
+        self.entries.insert(i, entry)
+        if len(self.times) > self.keep:
+            self.times.pop()
+            self.entries.pop()
+        self.dirty = True
+        return True
+
+    def add(self, scores):
+        """Insere um lote; devolve (novas, malformadas)."""
+        accepted = rejected = 0
+        for entry in scores:
+            entry = self._parse(entry)
+            if entry is None:
+                rejected += 1
+            elif self._insert(entry):
+                accepted += 1
+        self.received += accepted
+        self.rejected += rejected
+        return accepted, rejected
+
+    def handle(self, msg):
+        """Resposta para uma mensagem já decodificada."""
+        op = msg.get("op")
+        if op == "add":
+            accepted, rejected = self.add(msg.get("scores", []))
+            return {"ok": True, "accepted": accepted, "rejected": rejected}
+        if op == "top":
+            n = int(msg.get("n", 10))
+            return {"ok": True, "top": self.entries[:n]}
+        return {"ok": False, "error": f"operação desconhecida: {op}"}
+
+    async def _client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = self.handle(json.loads(line))
+                except (ValueError, TypeError, KeyError, AttributeError) as e:
+                    reply = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _snapshots(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.snapshot_every)
+            await self.save_snapshot(loop)
+
+    async def save_snapshot(self, loop=None):
+        """Grava o ranking se mudou desde o último snapshot."""
+        if not (self.snapshot_path and self.dirty):
+            return
+        self.dirty = False
+        data = list(self.entries)
+        loop = loop or asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, FileManager.save_json, self.snapshot_path, data
+        )
+
+    async def serve(self, host="127.0.0.1", port=8765, ready=None):
+        """Atende até ser cancelado; grava o snapshot final ao sair."""
+        server = await asyncio.start_server(self._client, host, port, limit=1 << 24)
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+        snapshots = asyncio.ensure_future(self._snapshots())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            snapshots.cancel()
+            await self.save_snapshot()
+
+
+class RemoteScoreManager:
+    """ScoreManager do quiosque que também envia as pontuações ao servidor.
+
+    Leituras e gravações locais vão para ``local`` (o ranking do próprio
+    quiosque continua funcionando sem rede). Cada pontuação nova entra
+    numa caixa de saída guardada em disco; uma thread a esvazia em lotes
+    de até ``batch`` por uma conexão persistente, tentando de novo a cada
+    ``retry`` segundos enquanto o servidor estiver fora.
+
+    A caixa de saída é JSON Lines só com acréscimos: pontuação nova custa
+    uma linha, por maior que a fila esteja. O arquivo só é reescrito com o
+    que falta depois de um envio confirmado; uma linha cortada por queda
+    é ignorada ao abrir.
+    """
+
+    def __init__(self, local, address, outbox_path=None, batch=500, retry=5.0):
+        self.local = local
+        self.address = address
+        self.outbox_path = outbox_path
+        self.batch = batch
+        self.retry = retry
+        self.kiosk = socket.gethostname()
+        self.outbox, clean = self._load_outbox()
+        if not clean:
+            # Sem isso a próxima linha seria colada ao pedaço cortado
+            self._compact_outbox()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = False
+        self._conn = None
+        self._acked = 0
+        self._thread = threading.Thread(
+            target=self._run, name="score-upload", daemon=True
+        )
+        self._thread.start()
+        if self.outbox:
+            self._wake.set()
+
+    def __getattr__(self, name):
+        return getattr(self.local, name)
+
+    def add_score(self, name, seconds):
+        """Adiciona nova pontuação."""
+        return self.add_scores([(name, seconds, int(time.time()))])
+
+    def add_scores(self, rows):
+        """Grava no ranking local e põe as pontuações na caixa de saída."""
+        result = self.local.add_scores(rows)
+        entries = [
+            {
+                "id": uuid.uuid4().hex,
+                "name": name or "Jogador",
+                "seconds": round(float(seconds), 3),
+                "ts": ts,
+                "kiosk": self.kiosk,
+            }
+            for name, seconds, ts in rows
+        ]
+        with self._lock:
+            self.outbox.extend(entries)
+            self._append_outbox(entries)
+        self._wake.set()
+        return result
+
+    def _load_outbox(self):
+        """Entradas da caixa de saída e se o arquivo estava íntegro."""
+        if not self.outbox_path:
+            return [], True
+        outbox, clean = [], True
+        try:
+            with open(self.outbox_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        entry = None
+                    if isinstance(entry, dict) and line.endswith("\n"):
+                        outbox.append(entry)
+                    else:
+                        clean = False
+        except (OSError, UnicodeDecodeError):
+            pass
+        return outbox, clean
+
+    def _append_outbox(self, entries):
+        if not self.outbox_path:
+            return
+        data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+        try:
+            with open(self.outbox_path, "a", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            pass
+
+    def _compact_outbox(self):
+        """Reescreve o arquivo só com o que não foi confirmado (com a trava)."""
+        if not self.outbox_path:
+            return
+        tmp = f"{self.outbox_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for entry in self.outbox:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.outbox_path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def _connect(self):
+        if self._conn is None:
+            sock = socket.create_connection(self.address, timeout=5.0)
+            self._conn = sock.makefile("rwb")
+        return self._conn
+
+    def _disconnect(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+    def upload(self):
+        """Envia a caixa de saída; devolve False se o servidor não respondeu.
+
+        O arquivo é compactado uma vez no fim, se algum lote foi confirmado.
+        """
+        try:
+            return self._send_batches()
+        finally:
+            with self._lock:
+                if self._acked:
+                    self._acked = 0
+                    self._compact_outbox()
+
+    def _send_batches(self):
+        while True:
+            with self._lock:
+                batch = self.outbox[: self.batch]
+            if not batch:
+                return True
+            try:
+                conn = self._connect()
+                msg = {"op": "add", "scores": batch}
+                conn.write(json.dumps(msg).encode("utf-8") + b"\n")
+                conn.flush()
+                reply = json.loads(conn.readline() or b"{}")
+                if not reply.get("ok"):
+                    raise ValueError(reply.get("error", "sem resposta"))
+            except (OSError, ValueError):
+                self._disconnect()
+                return False
+            with self._lock:
+                del self.outbox[: len(batch)]
+                self._acked += len(batch)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.retry)
+            self._wake.clear()
+            self.upload()
+            if self._stop:
+                self._disconnect()
+                return
+
+    def close(self, timeout=2.0):
+        """Última tentativa de envio, sem esperar a rede mais que ``timeout``.
+
+        O que não foi confirmado fica na caixa de saída em disco e segue na
+        próxima vez que o jogo abrir.
+        """
+        self._stop = True
+        self._wake.set()
+        self._thread.join(timeout)
+        self.local.close()
+
+
+def main(argv=None):
+    """Sobe o servidor do ranking global."""
+    parser = argparse.ArgumentParser(description="Servidor do ranking global.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=Config.LB_SERVER_PORT)
+    parser.add_argument("--snapshot", default="ranking_global.json")
+    parser.add_argument("--keep", type=int, default=1000)
+    parser.add_argument("--every", type=float, default=5.0)
+    parser.add_argument(
+        "--seen", type=int, default=100000, help="ids lembrados para ignorar reenvios"
+    )
+    args = parser.parse_args(argv)
+
+    server = ScoreServer(
+        args.snapshot, keep=args.keep, snapshot_every=args.every, seen_limit=args.seen
+    )
+    print(f"Ranking global em {args.host}:{args.port} ({len(server.entries)} tempos)")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
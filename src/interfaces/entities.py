@@ -2,7 +2,11 @@
 
 import math
 import random
-import pygame
+
+try:
+    import pygame
+except ImportError:  # A simulação headless não depende de pygame
+    pygame = None
 
 # Import do Config com fallback
 try:
@@ -19,39 +23,13 @@ except ImportError:
         from config import Config
 
 
-class Particle:
-    """Partícula para efeitos visuais."""
-
-    def __init__(self, x, y, color, velocity, lifetime=1.0):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.lifetime = lifetime
-        self.age = 0.0
-
-    def update(self, dt):
-        """Atualiza partícula."""
-        self.x += self.velocity[0] * dt
-        self.y += self.velocity[1] * dt
-        self.age += dt
-        return self.age < self.lifetime
-
-    def draw(self, surf):
-        """Desenha partícula."""
-        alpha = 255 * (1 - self.age / self.lifetime)
-        r, g, b = self.color
-        s = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(s, (r, g, b, int(alpha)), (2, 2), 2)
-        surf.blit(s, (int(self.x) - 2, int(self.y) - 2))
-
-
 class Bullet:
     """Projétil."""
 
     def __init__(self, x, y, direction):
         self.x = x
         self.y = y
+        self.prev_x, self.prev_y = x, y  # posição no passo anterior
         self.direction = direction
         self.speed = 15.0
         self.distance = 0
@@ -59,23 +37,26 @@ class Bullet:
 
     def update(self, dt):
         """Atualiza projétil."""
+        self.prev_x, self.prev_y = self.x, self.y
         dx, dy = self.direction
         self.x += dx * self.speed * dt
         self.y += dy * self.speed * dt
         self.distance += self.speed * dt
         return self.distance < self.max_distance * Config.CELL
 
-    def draw(self, surf):
-        """Desenha projétil."""
-        px = self.x
-        py = Config.FIELD_Y + self.y
+    def draw(self, surf, alpha=1.0):
+        """Desenha projétil, a ``alpha`` do caminho desde o passo anterior."""
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        px = x
+        py = Config.FIELD_Y + y
         pygame.draw.circle(surf, (255, 255, 100), (int(px), int(py)), 4)
         pygame.draw.circle(surf, (255, 200, 50), (int(px), int(py)), 2)
 
         # Rastro
         for i in range(1, 4):
-            trail_x = self.x - self.direction[0] * i * 3
-            trail_y = self.y - self.direction[1] * i * 3
+            trail_x = x - self.direction[0] * i * 3
+            trail_y = y - self.direction[1] * i * 3
             pygame.draw.circle(
                 surf,
                 (255, 200, 50),
@@ -92,11 +73,13 @@ class Bullet:
 class Spider:
     """Aranha inimiga."""
 
-    def __init__(self, pos, step_time=0.45, drop_rate=0.25):
+    def __init__(self, pos, step_time=0.45, drop_rate=0.25, rng=None):
         self.pos = pos
+        self.prev_pos = pos  # célula no passo anterior
         self.acc = 0.0
         self.step_time = step_time
         self.drop_rate = drop_rate
+        self.rng = rng or random
 
     def _best_step(self, target, blocked):
         """Encontra melhor movimento."""
@@ -113,7 +96,7 @@ class Spider:
         if ty < y:
             choices.append((0, -1))
 
-        random.shuffle(choices)
+        self.rng.shuffle(choices)
 
         for dx, dy in choices:
             nx, ny = x + dx, y + dy
@@ -136,18 +119,27 @@ class Spider:
 
         return (x, y), (0, 0)
 
-    def update(self, dt, target, blocked, pillars):
-        """Atualiza aranha."""
+    def update(self, dt, target, blocked, field=None):
+        """Atualiza aranha.
+
+        ``blocked`` pode ser qualquer contêiner com ``in`` (na simulação,
+        uma visão da grade que já inclui os pilares). Com ``field``
+        (um FlowField), a aranha segue o campo de distâncias e só usa o
+        passo guloso quando o campo não oferece vizinho mais próximo.
+        """
+        self.prev_pos = self.pos
         self.acc += dt
         dropped = None
 
         while self.acc >= self.step_time:
             self.acc -= self.step_time
             old = self.pos
-            new, _ = self._best_step(target, blocked | {p.pos for p in pillars})
+            new = field.next_step(old, self.rng) if field is not None else None
+            if new is None:
+                new, _ = self._best_step(target, blocked)
             self.pos = new
 
-            if new != old and random.random() < self.drop_rate:
+            if new != old and self.rng.random() < self.drop_rate:
                 dropped = Pillar(old, ttl=5.0)
 
         return dropped
@@ -157,7 +149,11 @@ class Spider:
         x, y = self.pos
         px = x * Config.CELL + Config.CELL // 2
         py = Config.FIELD_Y + y * Config.CELL + Config.CELL // 2
+        self.paint(surf, px, py)
 
+    @staticmethod
+    def paint(surf, px, py):
+        """Desenha uma aranha centrada em (px, py)."""
         body = (200, 40, 40)
         pygame.draw.circle(surf, body, (px, py), Config.CELL // 2 - 4)
         pygame.draw.circle(surf, (120, 20, 20), (px + 2, py - 2), Config.CELL // 2 - 8)
@@ -188,6 +184,11 @@ class Pillar:
         x, y = self.pos
         px = x * Config.CELL + Config.CELL // 2
         py = Config.FIELD_Y + y * Config.CELL + Config.CELL // 2
+        self.paint(surf, px, py)
+
+    @staticmethod
+    def paint(surf, px, py):
+        """Desenha um pilar centrado em (px, py)."""
         r = Config.CELL // 2 - 4
 
         base = (70, 120, 255)
@@ -200,33 +201,39 @@ class Pillar:
 class PowerUp:
     """Power-up coletável."""
 
+    TYPES = ["speed", "freeze", "shield", "time", "kill"]
+    colors = {
+        "speed": (0, 255, 255),
+        "freeze": (0, 0, 255),
+        "shield": (255, 215, 0),
+        "time": (50, 205, 50),
+        "kill": (255, 50, 50),
+    }
+    symbols = {
+        "speed": "S",
+        "freeze": "F",
+        "shield": "D",
+        "time": "T",
+        "kill": "K",
+    }
+
     def __init__(self, pos, type_):
         self.pos = pos
         self.type = type_
-        self.colors = {
-            "speed": (0, 255, 255),
-            "freeze": (0, 0, 255),
-            "shield": (255, 215, 0),
-            "time": (50, 205, 50),
-            "kill": (255, 50, 50),
-        }
-        self.symbols = {
-            "speed": "S",
-            "freeze": "F",
-            "shield": "D",
-            "time": "T",
-            "kill": "K",
-        }
 
     def draw(self, surf, font):
         """Desenha power-up."""
         x, y = self.pos
         px = x * Config.CELL + Config.CELL // 2
         py = Config.FIELD_Y + y * Config.CELL + Config.CELL // 2
+        self.paint(surf, px, py, self.type, font)
 
-        pygame.draw.circle(surf, self.colors[self.type], (px, py), Config.CELL // 2 - 2)
+    @classmethod
+    def paint(cls, surf, px, py, type_, font):
+        """Desenha um power-up de ``type_`` centrado em (px, py)."""
+        pygame.draw.circle(surf, cls.colors[type_], (px, py), Config.CELL // 2 - 2)
         pygame.draw.circle(surf, (255, 255, 255), (px, py), Config.CELL // 2 - 2, 2)
 
-        symbol = self.symbols[self.type]
+        symbol = cls.symbols[type_]
         text = font.render(symbol, True, (255, 255, 255))
         surf.blit(text, text.get_rect(center=(px, py)))
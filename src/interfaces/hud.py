@@ -0,0 +1,70 @@
+"""Camada persistente do HUD, dividida em campos."""
+
+_UNSET = object()
+
+
+class _HudField:
+    __slots__ = ("render", "value", "blits", "rect")
+
+    def __init__(self, render):
+        self.render = render
+        self.value = _UNSET
+        self.blits = []
+        self.rect = None
+
+
+class HudLayer:
+    """Painel do HUD guardado numa superfície que sobrevive entre quadros.
+
+    Cada campo tem uma função ``render(value)`` que devolve a lista de
+    ``(superfície, (x, y))`` a desenhar; ela só é chamada quando o valor
+    do campo muda. O valor ``None`` esconde o campo. ``update`` restaura o
+    fundo nas áreas que mudaram, redesenha ali os campos que as tocam (na
+    ordem em que foram adicionados) e devolve essas áreas.
+    """
+
+    def __init__(self, background):
+        self.background = background
+        self.surface = background.copy()
+        self._fields = {}
+
+    def add(self, name, render):
+        """Registra um campo; a ordem de registro é a ordem de desenho."""
+        self._fields[name] = _HudField(render)
+
+    def invalidate(self):
+        """Força todos os campos a re-renderizar no próximo ``update``."""
+        self.surface = self.background.copy()
+        for field in self._fields.values():
+            field.value = _UNSET
+            field.blits = []
+            field.rect = None
+
+    def update(self, values):
+        """Aplica ``values`` (nome -> valor) e devolve os retângulos alterados."""
+        dirty = []
+        for name, field in self._fields.items():
+            value = values.get(name)
+            if value == field.value:
+                continue
+            field.value = value
+            if field.rect:
+                dirty.append(field.rect)
+
+            field.blits = field.render(value) if value is not None else []
+            field.rect = None
+            for surf, pos in field.blits:
+                r = surf.get_rect(topleft=pos)
+                field.rect = field.rect.union(r) if field.rect else r
+            if field.rect:
+                dirty.append(field.rect)
+
+        surface = self.surface
+        for area in dirty:
+            surface.set_clip(area)
+            surface.blit(self.background, area, area)
+            for field in self._fields.values():
+                if field.rect and field.rect.colliderect(area):
+                    surface.blits(field.blits, doreturn=False)
+        surface.set_clip(None)
+        return dirty
@@ -0,0 +1,35 @@
+"""Camadas de desenho guardadas entre quadros."""
+
+import pygame
+
+_UNSET = object()
+
+
+class CachedLayer:
+    """Superfície opaca que só é redesenhada quando sua chave muda.
+
+    ``render(surface)`` desenha a camada inteira. ``update(key)`` chama
+    ``render`` quando ``key`` difere da última vista (ou depois de
+    ``invalidate``) e diz se a camada mudou; ``surface`` guarda o
+    resultado.
+    """
+
+    def __init__(self, size, render):
+        self.size = size
+        self.render = render
+        self.surface = None
+        self.key = _UNSET
+
+    def invalidate(self):
+        """Força o redesenho no próximo ``update``."""
+        self.key = _UNSET
+
+    def update(self, key):
+        """Redesenha se ``key`` mudou; devolve se houve redesenho."""
+        if self.surface is not None and key == self.key:
+            return False
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size).convert()
+        self.key = key
+        self.render(self.surface)
+        return True
@@ -0,0 +1,128 @@
+"""Sistema de partículas vetorizado."""
+
+import numpy as np
+import pygame
+
+# Import do Config com fallback
+try:
+    from ..configs.config import Config
+except ImportError:
+    try:
+        from src.configs.config import Config
+    except ImportError:
+        import sys
+        import os
+
+        config_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "configs")
+        sys.path.append(config_dir)
+        from config import Config
+
+
+class ParticleSystem:
+    """Partículas em arrays NumPy de capacidade fixa.
+
+    As vivas ficam compactadas em ``[:count]``; ``update`` move e envelhece
+    todas de uma vez e descarta as mortas. O desenho usa um sprite por
+    (cor, faixa de alfa), criado na primeira vez que aparece, e um único
+    ``Surface.blits``.
+    """
+
+    RADIUS = 2
+
+    def __init__(self, capacity=None, alpha_buckets=None, seed=None):
+        self.capacity = capacity or Config.PARTICLE_CAPACITY
+        self.alpha_buckets = alpha_buckets or Config.PARTICLE_ALPHA_BUCKETS
+        self.rng = np.random.default_rng(seed)
+
+        cap = self.capacity
+        self.pos = np.zeros((cap, 2), np.float32)
+        self.vel = np.zeros((cap, 2), np.float32)
+        self.age = np.zeros(cap, np.float32)
+        self.life = np.ones(cap, np.float32)
+        self.color = np.zeros(cap, np.int32)
+        self.count = 0
+
+        # Cores vistas até agora e sprites por cor * faixas + faixa
+        self.colors = []
+        self._color_ids = {}
+        self._sprites = []
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove todas as partículas."""
+        self.count = 0
+
+    def emit(self, x, y, color, count=10):
+        """Explosão de ``count`` partículas em (x, y).
+
+        Acima da capacidade as partículas excedentes são descartadas.
+        """
+        start = self.count
+        end = min(self.capacity, start + count)
+        n = end - start
+        if n <= 0:
+            return
+
+        angle = self.rng.uniform(0, 2 * np.pi, n)
+        speed = self.rng.uniform(20, 100, n)
+        self.pos[start:end] = (x, y)
+        self.vel[start:end, 0] = np.cos(angle) * speed
+        self.vel[start:end, 1] = np.sin(angle) * speed
+        self.age[start:end] = 0.0
+        self.life[start:end] = self.rng.uniform(0.5, 1.5, n)
+        self.color[start:end] = self._color_id(color)
+        self.count = end
+
+    def update(self, dt):
+        """Avança todas as partículas e compacta as vivas."""
+        n = self.count
+        if not n:
+            return
+        self.pos[:n] += self.vel[:n] * dt
+        self.age[:n] += dt
+
+        alive = self.age[:n] < self.life[:n]
+        k = int(np.count_nonzero(alive))
+        if k < n:
+            for arr in (self.pos, self.vel, self.age, self.life, self.color):
+                arr[:k] = arr[:n][alive]
+            self.count = k
+
+    def draw(self, surf):
+        """Desenha todas as partículas com um único ``blits``."""
+        n = self.count
+        if not n:
+            return
+
+        buckets = self.alpha_buckets
+        fade = 1.0 - self.age[:n] / self.life[:n]
+        band = np.minimum((fade * buckets).astype(np.int32), buckets - 1)
+        keys = self.color[:n] * buckets + band
+        for key in np.unique(keys).tolist():
+            if self._sprites[key] is None:
+                self._sprites[key] = self._make_sprite(key)
+
+        r = self.RADIUS
+        xy = self.pos[:n].astype(np.int32) - r
+        sprites = map(self._sprites.__getitem__, keys.tolist())
+        surf.blits(zip(sprites, xy.tolist()), doreturn=False)
+
+    def _color_id(self, color):
+        color = tuple(color[:3])
+        idx = self._color_ids.get(color)
+        if idx is None:
+            idx = self._color_ids[color] = len(self.colors)
+            self.colors.append(color)
+            self._sprites.extend([None] * self.alpha_buckets)
+        return idx
+
+    def _make_sprite(self, key):
+        """Círculo na cor e no alfa (topo da faixa) de ``key``."""
+        color, band = divmod(key, self.alpha_buckets)
+        alpha = int(255 * (band + 1) / self.alpha_buckets)
+        r = self.RADIUS
+        s = pygame.Surface((2 * r, 2 * r), pygame.SRCALPHA)
+        pygame.draw.circle(s, (*self.colors[color], alpha), (r, r), r)
+        return s
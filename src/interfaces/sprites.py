@@ -0,0 +1,154 @@
+"""Atlas de sprites pré-renderizados por tema."""
+
+import pygame
+
+# Imports com fallback
+try:
+    from ..configs.config import Config
+    from ..utils.utils import Utils
+    from .entities import Spider, Pillar, PowerUp
+except ImportError:
+    try:
+        from src.configs.config import Config
+        from src.utils.utils import Utils
+        from src.interfaces.entities import Spider, Pillar, PowerUp
+    except ImportError:
+        import sys
+        import os
+
+        current_dir = os.path.dirname(__file__)
+        config_dir = os.path.join(os.path.dirname(current_dir), "configs")
+        utils_dir = os.path.join(os.path.dirname(current_dir), "utils")
+        sys.path.extend([config_dir, utils_dir, current_dir])
+        from config import Config
+        from utils import Utils
+        from entities import Spider, Pillar, PowerUp
+
+
+class SpriteAtlas:
+    """Todas as variantes de entidades de um tema, desenhadas uma vez.
+
+    Cada sprite é ``(superfície, deslocamento)``: a superfície é quadrada
+    e o deslocamento leva do centro da célula ao canto superior esquerdo.
+    As letras são blits separados (disco, brilho pré-multiplicado quando
+    é a próxima, sombra e letra): a letra passa da borda do disco e o
+    brilho se mistura com o que já está na tela, então compor tudo numa
+    superfície só mudaria o resultado.
+    """
+
+    SIZE = 2 * Config.CELL
+
+    def __init__(self, theme, fonts):
+        self.theme = theme
+        self.fonts = fonts
+
+        self.spider = self._sprite(Spider.paint)
+        self.pillar = self._sprite(Pillar.paint)
+        self.power_ups = {
+            t: self._sprite(PowerUp.paint, t, fonts["small"]) for t in PowerUp.TYPES
+        }
+
+        paleta = theme["PALETA"]
+        self.token_discs = []
+        self.token_labels = []
+        for i, ch in enumerate(Config.SEQUENCE):
+            color = paleta[i % len(paleta)]
+            self.token_discs.append(self._sprite(self.paint_disc, color))
+            self.token_labels.append(self._label(ch, fonts["token"]))
+        self.token_glow = self._make_glow()
+        self.shield = self._sprite(self.paint_shield, size=self.SIZE + 2)
+
+        self.segments = {}
+        labels = [None, *dict.fromkeys(Config.SEQUENCE)]
+        for label in labels:
+            for color in theme["SNAKE_PATTERN"]:
+                self.segment(color, label)
+            self.segment(theme["HEAD"], label, is_head=True)
+
+    def _sprite(self, paint, *args, size=None):
+        size = size or self.SIZE
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        c = size // 2
+        paint(surf, c, c, *args)
+        return surf, -c
+
+    def _label(self, char, font):
+        """Sombra e letra, com deslocamentos a partir do centro."""
+        text = Utils.render_text_smooth(font, str(char), (255, 255, 255))
+        shadow = Utils.render_text_smooth(font, str(char), (0, 0, 0))
+        rect = text.get_rect(center=(0, 0))
+        return [(shadow, rect.move(1, 1).topleft), (text, rect.topleft)]
+
+    def _make_glow(self):
+        """Halo da próxima letra (blit com BLEND_PREMULTIPLIED)."""
+        R = Config.CELL // 2 - 3
+        size = Config.CELL * 3
+        glow = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(glow, (255, 255, 255, 70), (size // 2, size // 2), R + 8)
+        return glow, -(size // 2)
+
+    def token_blits(self, i, px, py, is_next=False):
+        """Blits do token da letra ``i`` centrado em (px, py)."""
+        disc, off = self.token_discs[i]
+        blits = [(disc, (px + off, py + off))]
+        if is_next:
+            glow, goff = self.token_glow
+            blits.append(
+                (glow, (px + goff, py + goff), None, pygame.BLEND_PREMULTIPLIED)
+            )
+        for surf, (dx, dy) in self.token_labels[i]:
+            blits.append((surf, (px + dx, py + dy)))
+        return blits
+
+    def segment(self, color, label=None, is_head=False):
+        """Sprite de um segmento da cobra (criado na primeira vez)."""
+        key = (tuple(color), label, is_head)
+        sprite = self.segments.get(key)
+        if sprite is None:
+            sprite = self.segments[key] = self._sprite(
+                self.paint_segment,
+                color,
+                label,
+                is_head,
+                self.theme.get("SNAKE_TYPE", "água"),
+                self.fonts["segment"],
+            )
+        return sprite
+
+    @staticmethod
+    def paint_disc(surf, px, py, color):
+        """Disco de fundo de uma letra."""
+        R = Config.CELL // 2 - 3
+        pygame.draw.circle(surf, color, (px, py), R)
+        pygame.draw.circle(surf, (245, 246, 248), (px, py), R, 2)
+
+    @staticmethod
+    def paint_shield(surf, px, py):
+        """Anel translúcido do escudo em volta da cabeça."""
+        pygame.draw.circle(surf, (255, 215, 0, 100), (px, py), Config.CELL, width=2)
+
+    @staticmethod
+    def paint_segment(surf, px, py, color, label, is_head, snake_type, font):
+        """Segmento da cobra com o padrão do tipo de cobra e o rótulo."""
+        R = Config.CELL // 2 - 2
+        ring = (max(color[0] - 25, 0), max(color[1] - 25, 0), max(color[2] - 25, 0))
+        inner = (
+            min(color[0] + 18, 255),
+            min(color[1] + 18, 255),
+            min(color[2] + 18, 255),
+        )
+
+        pygame.draw.circle(surf, inner, (px, py), R - 1)
+        pygame.draw.circle(surf, ring, (px, py), R, 2)
+
+        if not is_head:
+            if snake_type == "cascavel":
+                pygame.draw.circle(surf, ring, (px, py), R - 4, 2)
+            elif snake_type == "coral":
+                pygame.draw.circle(surf, (255, 255, 255), (px, py), R - 4, 1)
+
+        if label:
+            fill, outline = Utils.auto_text_colors(inner)
+            Utils.draw_text_outline_center(
+                surf, str(label), px, py, fill, outline, font, outer_px=1
+            )
@@ -4,9 +4,8 @@ Arquivo principal do jogo.
 
 import sys
 import os
-import time
-import random
 import math
+import random
 import pygame
 
 # Adicionar o diretório pai ao path para permitir imports absolutos
@@ -15,16 +14,30 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     # Tentar imports relativos primeiro (quando executado como módulo)
     from .configs.config import Config
-    from .utils.utils import Utils, ScoreManager
-    from .handlers.managers import ThemeManager, AudioManager
-    from .interfaces.entities import Particle, Bullet, Spider, Pillar, PowerUp
+    from .utils.utils import Utils, SurfaceCache, ScoreWriter, open_score_manager
+    from .handlers.managers import ThemeManager, AudioManager, BackgroundLoader
+    from .handlers.scores import RemoteScoreManager
+    from .interfaces.entities import PowerUp
+    from .interfaces.particles import ParticleSystem
+    from .interfaces.hud import HudLayer
+    from .interfaces.sprites import SpriteAtlas
+    from .interfaces.layers import CachedLayer
+    from .engine.simulation import Simulation, SimStatus, Action
+    from .engine.replay import ReplayRecorder, ReplayPlayer, Op, replay_path
 except ImportError:
     # Fallback para imports absolutos (quando executado diretamente)
     try:
         from src.configs.config import Config
-        from src.utils.utils import Utils, ScoreManager
-        from src.handlers.managers import ThemeManager, AudioManager
-        from src.interfaces.entities import Particle, Bullet, Spider, Pillar, PowerUp
+        from src.utils.utils import Utils, SurfaceCache, ScoreWriter, open_score_manager
+        from src.handlers.managers import ThemeManager, AudioManager, BackgroundLoader
+        from src.handlers.scores import RemoteScoreManager
+        from src.interfaces.entities import PowerUp
+        from src.interfaces.particles import ParticleSystem
+        from src.interfaces.hud import HudLayer
+        from src.interfaces.sprites import SpriteAtlas
+        from src.interfaces.layers import CachedLayer
+        from src.engine.simulation import Simulation, SimStatus, Action
+        from src.engine.replay import ReplayRecorder, ReplayPlayer, Op, replay_path
     except ImportError:
         # Último fallback - imports locais diretos
         try:
@@ -37,22 +50,43 @@ except ImportError:
             utils_dir = os.path.join(current_dir, "utils")
             handlers_dir = os.path.join(current_dir, "handlers")
             interfaces_dir = os.path.join(current_dir, "interfaces")
-
-            for dir_path in [configs_dir, utils_dir, handlers_dir, interfaces_dir]:
+            engine_dir = os.path.join(current_dir, "engine")
+
+            for dir_path in [
+                configs_dir,
+                utils_dir,
+                handlers_dir,
+                interfaces_dir,
+                engine_dir,
+            ]:
                 if dir_path not in sys.path:
                     sys.path.append(dir_path)
 
             from config import Config
-            from utils import Utils, ScoreManager
-            from managers import ThemeManager, AudioManager
-            from entities import Particle, Bullet, Spider, Pillar, PowerUp
+            from utils import Utils, SurfaceCache, ScoreWriter, open_score_manager
+            from managers import ThemeManager, AudioManager, BackgroundLoader
+            from scores import RemoteScoreManager
+            from entities import PowerUp
+            from particles import ParticleSystem
+            from hud import HudLayer
+            from sprites import SpriteAtlas
+            from layers import CachedLayer
+            from simulation import Simulation, SimStatus, Action
+            from replay import ReplayRecorder, ReplayPlayer, Op, replay_path
         except ImportError as e:
             print(f"Erro crítico de importação: {e}")
             print("Verifique se todos os arquivos estão na estrutura correta:")
             print("src/configs/config.py")
             print("src/utils/utils.py")
             print("src/handlers/managers.py")
+            print("src/handlers/scores.py")
             print("src/interfaces/entities.py")
+            print("src/interfaces/particles.py")
+            print("src/interfaces/hud.py")
+            print("src/interfaces/sprites.py")
+            print("src/interfaces/layers.py")
+            print("src/engine/simulation.py")
+            print("src/engine/replay.py")
             sys.exit(1)
 
 
@@ -73,58 +107,49 @@ class GameState:
     MUSIC = "music"
     SCREEN = "screen"
 
-
-class Timer:
-    """Gerencia tempo do jogo."""
-
-    def __init__(self):
-        self.start_time = None
-        self.accumulated = 0.0
-
-    def reset(self):
-        """Reset do timer."""
-        self.start_time = None
-        self.accumulated = 0.0
-
-    def start(self):
-        """Inicia timer."""
-        self.start_time = time.time()
-
-    def pause(self):
-        """Pausa timer."""
-        if self.start_time:
-            self.accumulated += time.time() - self.start_time
-            self.start_time = None
-
-    def resume(self):
-        """Resume timer."""
-        if self.start_time is None:
-            self.start_time = time.time()
-
-    def elapsed(self):
-        """Tempo decorrido."""
-        return self.accumulated + (
-            time.time() - self.start_time if self.start_time else 0.0
-        )
+    # Estados em que o campo mostra a partida
+    IN_GAME = (PLAYING, PAUSED, GAME_OVER, VICTORY, LEVEL)
 
 
 class SnakeGame:
     """Classe principal do jogo."""
 
-    def __init__(self):
+    # Overlay de cada estado: método de desenho e alfa do escurecimento
+    OVERLAYS = {
+        GameState.MENU: ("_draw_menu", 150),
+        GameState.ENTER_NAME: ("_draw_name_entry", 160),
+        GameState.LEADERBOARD: ("_draw_leaderboard", 160),
+        GameState.OPTIONS: ("_draw_options", 170),
+        GameState.THEME: ("_draw_theme_menu", 170),
+        GameState.BG: ("_draw_bg_menu", 170),
+        GameState.MUSIC: ("_draw_music_menu", 170),
+        GameState.SCREEN: ("_draw_screen_menu", 170),
+        GameState.LEVEL: ("_draw_level", 0),
+        GameState.GAME_OVER: ("_draw_game_over", 100),
+        GameState.VICTORY: ("_draw_victory", 100),
+        GameState.PAUSED: ("_draw_pause", 140),
+    }
+
+    def __init__(self, replay=None):
         pygame.init()
         self.clock = pygame.time.Clock()
 
         # Managers
         self.theme_manager = ThemeManager()
         self.audio_manager = AudioManager()
-        self.score_manager = ScoreManager(Config.LB_PATH)
-        self.timer = Timer()
+        scores = open_score_manager(Config.LB_PATH, Config.LB_JSON_PATH)
+        if Config.LB_SERVER:
+            scores = RemoteScoreManager(
+                scores, (Config.LB_SERVER, Config.LB_SERVER_PORT), Config.LB_OUTBOX_PATH
+            )
+        self.score_manager = ScoreWriter(scores)
 
         # Window setup
         self.window_w, self.window_h = Config.WIN_W, Config.WIN_H
         self._create_window()
         self._load_fonts()
+        self.hud = self._build_hud()
+        self.atlas = SpriteAtlas(self.theme_manager.current_theme, self.fonts)
 
         # Game state
         self.state = GameState.MENU
@@ -132,23 +157,50 @@ class SnakeGame:
         self.tick = 0.0
 
         # Particles system
-        self.particles = []
+        self.particles = ParticleSystem()
 
-        # Initialize game
-        self._init_game_state()
+        # Simulation (regras do jogo, sem pygame)
+        self.sim = Simulation()
+        self.bg_loader = BackgroundLoader(Config.BG_CACHE_BYTES, self._wake_loop)
         self._rebuild_field_bg()
 
+        # Replays: gravação da partida atual ou reprodução de um arquivo
+        self.recorder = None
+        self.replay = None
+        if replay:
+            self._start_replay(ReplayPlayer.load(replay))
+
+        # Fundo + letras, power-ups e pilares, refeitos só quando mudam
+        self.field_layer = CachedLayer(
+            (Config.FIELD_W, Config.FIELD_H), self._render_field_layer
+        )
+
+        # Overlays já compostos, por estado e entradas (limite em bytes)
+        self.overlay_cache = SurfaceCache(Config.OVERLAY_CACHE_BYTES)
+
+        # Renderização por retângulos sujos (Config.DIRTY_RECTS)
+        self._frame_key = None
+        self._dirty_prev = []
+
     def _create_window(self):
         """Cria janela do jogo."""
         try:
             self.window = pygame.display.set_mode(
-                (self.window_w, self.window_h), flags=pygame.SCALED, vsync=1
+                (self.window_w, self.window_h),
+                flags=pygame.SCALED,
+                vsync=int(Config.VSYNC),
             )
         except TypeError:
             self.window = pygame.display.set_mode((self.window_w, self.window_h))
 
         pygame.display.set_caption("Snake - MECATRONICA")
-        self.screen = pygame.Surface((Config.WIN_W, Config.WIN_H)).convert_alpha()
+        if self.window.get_size() == (Config.WIN_W, Config.WIN_H):
+            # Tamanho nativo: desenha direto na janela, sem escala
+            self.screen = self.window
+        else:
+            # Mesmo formato da janela, para escalar direto nela
+            self.screen = pygame.Surface((Config.WIN_W, Config.WIN_H)).convert()
+        self._full_redraw = True
 
     def _load_fonts(self):
         """Carrega fontes."""
@@ -161,104 +213,89 @@ class SnakeGame:
             "segment": Utils.load_font("fonts/CooperBlack.ttf", 24),
         }
 
-    def _init_game_state(self):
-        """Inicializa estado do jogo."""
-        self.phase = 1
-        self.snake = [(Config.GRID_W // 2, Config.GRID_H // 2)]
-        self.labels = [None]
-        self.direction = (1, 0)
-        self.velocity = Config.BASE_SPEED[1]
-        self.move_acc = 0.0
-        self.char_index = 0
-
-        # Letter positions
-        self.pos_by_idx = {}
-        self.idx_by_pos = {}
-
-        # Enemies
-        self.spiders = []
-        self.pillars = []
-
-        # Shooting system
-        self.bullets = 0
-        self.active_bullets = []
-
-        # Power-ups
-        self.power_ups = []
-        self.power_up_timer = 0.0
-        self.power_up_effects = {
-            "speed": {"active": False, "end_time": 0, "multiplier": 1.5},
-            "freeze": {"active": False, "end_time": 0, "multiplier": 0.5},
-            "shield": {"active": False, "end_time": 0},
-        }
-
-        # Stats
-        self.spider_kills = 0
-        self.death_reason = ""
-
-        self.timer.reset()
-
     def _rebuild_field_bg(self):
-        """Reconstrói fundo do campo."""
-        surf = pygame.Surface((Config.FIELD_W, Config.FIELD_H)).convert()
+        """Reconstrói fundo do campo.
+
+        A imagem do tema é decodificada pelo ``bg_loader`` numa thread;
+        até ela ficar pronta o campo usa a cor lisa do tema.
+        """
         theme = self.theme_manager.current_theme
+        size = (Config.FIELD_W, Config.FIELD_H)
 
+        surf = None
         img_path = theme.get("BG_IMAGE")
-        if img_path and os.path.exists(img_path):
-            try:
-                img = pygame.image.load(img_path).convert()
-                img = pygame.transform.smoothscale(
-                    img, (Config.FIELD_W, Config.FIELD_H)
-                )
-                surf.blit(img, (0, 0))
-                shade = pygame.Surface(
-                    (Config.FIELD_W, Config.FIELD_H), pygame.SRCALPHA
-                )
-                shade.fill((0, 0, 0, 48))
-                surf.blit(shade, (0, 0))
-            except Exception:
-                surf.fill(theme["BG_BASE"])
-        else:
+        if img_path:
+            surf = self.bg_loader.request(
+                img_path, size, self.theme_manager.current_theme_name, theme["GRID"]
+            )
+        if surf is None:
+            surf = pygame.Surface(size).convert()
             surf.fill(theme["BG_BASE"])
+            BackgroundLoader.draw_grid(surf, theme["GRID"])
 
-        # Grid
-        grid = pygame.Surface((Config.FIELD_W, Config.FIELD_H), pygame.SRCALPHA)
-        col = (*theme["GRID"], 28)
-        for x in range(0, Config.FIELD_W, Config.CELL):
-            pygame.draw.line(grid, col, (x, 0), (x, Config.FIELD_H))
-        for y in range(0, Config.FIELD_H, Config.CELL):
-            pygame.draw.line(grid, col, (0, y), (Config.FIELD_W, y))
-
-        surf.blit(grid, (0, 0))
         self.field_bg = surf
+        self._full_redraw = True
 
     def run(self):
         """Loop principal."""
         running = True
         while running:
-            dt = self.clock.tick(60) / 1000.0
+            animating = self._is_animating()
+            if animating:
+                dt = self.clock.tick(Config.FPS) / 1000.0
+                events = pygame.event.get()
+            else:
+                # Tela parada: dorme até um evento ou o próximo quadro lento
+                events = self._wait_events(1000 // Config.IDLE_FPS)
+                dt = self.clock.tick() / 1000.0
             self.tick += dt
 
             # Handle events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if not self._handle_key_event(event):
                         running = False
 
+            # Saindo de uma tela parada (menu, pausa): o tempo de espera
+            # não é da partida, então o primeiro quadro anda um tick só
+            if not animating and self._is_animating():
+                dt = min(dt, 1.0 / Config.SIM_HZ)
+
             # Update
             self._update(dt)
 
             # Draw
             self._draw()
 
+        self._close_recorder()
+        self.score_manager.close()
+        self.bg_loader.close()
         pygame.quit()
         sys.exit()
 
+    def _is_animating(self):
+        """Algo se mexe sozinho e pede a taxa cheia de quadros?"""
+        return self.state == GameState.PLAYING or len(self.particles) > 0
+
+    def _wake_loop(self):
+        """Acorda o loop parado em ``_wait_events`` (chamado de outras threads)."""
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+
+    def _wait_events(self, timeout):
+        """Bloqueia até ``timeout`` ms por um evento; devolve os pendentes."""
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
     def _handle_key_event(self, event):
         """Processa eventos de teclado."""
         key = event.key
+        if self.state != GameState.PLAYING:
+            self._full_redraw = True
 
         if self.state == GameState.MENU:
             return self._handle_menu_keys(key)
@@ -294,6 +331,7 @@ class SnakeGame:
         if key == pygame.K_1:
             self.state = GameState.ENTER_NAME
         elif key == pygame.K_2:
+            self.score_manager.refresh()  # pega pontuações gravadas por fora
             self.state = GameState.LEADERBOARD
         elif key == pygame.K_3:
             self.state = GameState.OPTIONS
@@ -317,25 +355,32 @@ class SnakeGame:
 
     def _handle_game_keys(self, key):
         """Teclas do jogo."""
+        action = Action.NONE
+
         # Movement
-        if key in (pygame.K_LEFT, pygame.K_a) and self.direction != (1, 0):
-            self.direction = (-1, 0)
-        elif key in (pygame.K_RIGHT, pygame.K_d) and self.direction != (-1, 0):
-            self.direction = (1, 0)
-        elif key in (pygame.K_UP, pygame.K_w) and self.direction != (0, 1):
-            self.direction = (0, -1)
-        elif key in (pygame.K_DOWN, pygame.K_s) and self.direction != (0, -1):
-            self.direction = (0, 1)
+        if key in (pygame.K_LEFT, pygame.K_a):
+            action = Action.LEFT
+        elif key in (pygame.K_RIGHT, pygame.K_d):
+            action = Action.RIGHT
+        elif key in (pygame.K_UP, pygame.K_w):
+            action = Action.UP
+        elif key in (pygame.K_DOWN, pygame.K_s):
+            action = Action.DOWN
 
         # Shooting
-        elif key == pygame.K_SPACE and self.bullets > 0:
-            self._shoot()
+        elif key == pygame.K_SPACE:
+            action = Action.SHOOT
 
         # Pause
         elif key == pygame.K_0:
-            self.timer.pause()
+            self._record(Op.PAUSE)
             self.state = GameState.PAUSED
 
+        # Num replay quem joga é o arquivo
+        if action != Action.NONE and self.replay is None:
+            self._record(action)
+            self.sim.apply(action)
+
         return True
 
     def _handle_leaderboard_keys(self, key):
@@ -361,19 +406,20 @@ class SnakeGame:
         if key == pygame.K_ESCAPE:
             self.state = GameState.OPTIONS
         elif key == pygame.K_1:
-            self.theme_manager.set_theme(0)
-            self._rebuild_field_bg()
-            self.state = GameState.OPTIONS
+            self._set_theme(0)
         elif key == pygame.K_2:
-            self.theme_manager.set_theme(1)
-            self._rebuild_field_bg()
-            self.state = GameState.OPTIONS
+            self._set_theme(1)
         elif key == pygame.K_3:
-            self.theme_manager.set_theme(2)
-            self._rebuild_field_bg()
-            self.state = GameState.OPTIONS
+            self._set_theme(2)
         return True
 
+    def _set_theme(self, index):
+        """Troca o tema e refaz o fundo e o atlas de sprites."""
+        self.theme_manager.set_theme(index)
+        self.atlas = SpriteAtlas(self.theme_manager.current_theme, self.fonts)
+        self._rebuild_field_bg()
+        self.state = GameState.OPTIONS
+
     def _handle_bg_keys(self, key):
         """Teclas do menu de fundo."""
         if key == pygame.K_ESCAPE:
@@ -422,8 +468,8 @@ class SnakeGame:
     def _handle_level_keys(self, key):
         """Teclas da transição de fase."""
         if key == pygame.K_RETURN:
-            self._place_letters()
-            self.timer.resume()
+            self._record(Op.START_PHASE)
+            self.sim.start_phase()
             self.state = GameState.PLAYING
         return True
 
@@ -448,7 +494,7 @@ class SnakeGame:
     def _handle_pause_keys(self, key):
         """Teclas do menu de pausa."""
         if key == pygame.K_1:  # Continuar
-            self.timer.resume()
+            self._record(Op.RESUME)
             self.state = GameState.PLAYING
         elif key == pygame.K_2:  # Reiniciar fase
             self._restart_phase()
@@ -460,643 +506,506 @@ class SnakeGame:
 
     def _restart_phase(self):
         """Reinicia a fase atual."""
-        current_phase = self.phase  # Salvar fase atual
-        self._init_game_state()
-        self.phase = current_phase  # Restaurar fase
-        self._spawn_enemies()
-        self._place_letters()
-        self.timer.reset()
-        self.timer.start()
+        self.replay = None  # dali em diante a partida é do jogador
+        self._record(Op.RESTART_PHASE)
+        self.sim.restart_phase()
         self.state = GameState.PLAYING
 
-    def _shoot(self):
-        """Dispara projétil."""
-        if self.bullets <= 0:
-            return
-
-        hx, hy = self.snake[0]
-        bullet_x = hx * Config.CELL + Config.CELL // 2
-        bullet_y = Config.FIELD_Y + hy * Config.CELL + Config.CELL // 2
-        self.active_bullets.append(Bullet(bullet_x, bullet_y, self.direction))
-        self.bullets -= 1
-        self.audio_manager.play_sfx("shoot")
-
     def _start_new_game(self):
-        """Inicia novo jogo."""
-        self._init_game_state()
-        self._spawn_enemies()
-        self._place_letters()
-        self.timer.start()
+        """Inicia novo jogo (gravando o replay se configurado)."""
+        self._close_recorder()
+        self.replay = None
+        seed = random.getrandbits(63)
+        self.sim.reset(seed)
+        if Config.RECORD_REPLAYS:
+            self.recorder = ReplayRecorder(replay_path(seed), seed)
         self.state = GameState.PLAYING
 
-    def _spawn_enemies(self):
-        """Gera inimigos."""
-        self.spiders = []
-        count = Config.SPIDERS_BY_PHASE[self.phase]
-        step_time = Config.SPIDER_STEP_BY_PHASE[self.phase]
-        drop_rate = Config.DROP_RATE_BY_PHASE[self.phase]
-
-        blocked = set(self.snake)
-        free_positions = [
-            (x, y)
-            for x in range(Config.GRID_W)
-            for y in range(Config.GRID_H)
-            if (x, y) not in blocked
-        ]
-
-        for _ in range(min(count, len(free_positions))):
-            pos = random.choice(free_positions)
-            free_positions.remove(pos)
-            self.spiders.append(Spider(pos, step_time, drop_rate))
-
-    def _place_letters(self):
-        """Posiciona letras com tentativas de segurança."""
-        blocked = (
-            set(self.snake)
-            | {s.pos for s in self.spiders}
-            | {p.pos for p in self.pillars}
-        )
+    def _start_replay(self, player):
+        """Assiste a um replay na janela."""
+        self._close_recorder()
+        self.replay = player
+        player.start(self.sim)
+        self.state = GameState.PLAYING
 
-        self.pos_by_idx, self.idx_by_pos = Utils.scatter_chars(
-            blocked, Config.NCHARS, Config.GRID_W, Config.GRID_H
-        )
+    def _record(self, op):
+        """Grava uma entrada no tick atual da simulação."""
+        if self.recorder is not None:
+            self.recorder.record(self.sim.steps, op)
 
-        # Try multiple times if snake head conflicts with letters
-        tries = 0
-        while (not self.pos_by_idx or self.snake[0] in self.idx_by_pos) and tries < 40:
-            self.pos_by_idx, self.idx_by_pos = Utils.scatter_chars(
-                blocked, Config.NCHARS, Config.GRID_W, Config.GRID_H
-            )
-            tries += 1
+    def _close_recorder(self):
+        """Fecha o replay da partida anterior, marcando o fim."""
+        if self.recorder is not None:
+            self.recorder.close(self.sim.steps)
+            self.recorder = None
 
     def _update(self, dt):
         """Atualização principal."""
-        # Update particles
-        self.particles = [p for p in self.particles if p.update(dt)]
-
-        if self.state == GameState.PLAYING:
-            self._update_game(dt)
-
-    def _update_game(self, dt):
-        """Atualiza lógica do jogo."""
-        # Update bullets
-        self.active_bullets = [
-            bullet for bullet in self.active_bullets if bullet.update(dt)
-        ]
-
-        # Check bullet-spider collisions
-        for bullet in self.active_bullets[:]:
-            bullet_pos = bullet.get_grid_pos()
-            for i, spider in enumerate(self.spiders):
-                if bullet_pos == spider.pos:
-                    self.spiders.pop(i)
-                    self.spider_kills += 1
-                    if bullet in self.active_bullets:
-                        self.active_bullets.remove(bullet)
-                    self.audio_manager.play_sfx("kill")
-                    self._add_particles(
-                        spider.pos[0] * Config.CELL + Config.CELL // 2,
-                        Config.FIELD_Y + spider.pos[1] * Config.CELL + Config.CELL // 2,
-                        (255, 50, 50),
-                        25,
-                    )
-                    break
-
-        # Update power-ups
-        self.power_up_timer += dt
-        if self.power_up_timer >= Config.POWER_UP_SPAWN_TIME:
-            if self._spawn_power_up():
-                self.power_up_timer = 0.0
-
-        # Check power-up effects expiration
-        current_time = self.timer.elapsed()
-        for effect in self.power_up_effects.values():
-            if effect.get("active", False) and current_time >= effect.get(
-                "end_time", 0
-            ):
-                effect["active"] = False
-
-        # Apply power-up effects to velocity
-        effective_vel = self.velocity
-        if self.power_up_effects["speed"]["active"]:
-            effective_vel *= self.power_up_effects["speed"]["multiplier"]
-        if self.power_up_effects["freeze"]["active"]:
-            effective_vel *= self.power_up_effects["freeze"]["multiplier"]
-
-        # Snake movement
-        self.move_acc += dt
-        step = 1.0 / max(effective_vel, 0.0001)
+        # Fundo decodificado em segundo plano ficou pronto
+        if self.bg_loader.poll():
+            self._rebuild_field_bg()
 
-        while self.move_acc >= step:
-            self.move_acc -= step
-            if not self._move_snake():
-                break
+        # Update particles
+        self.particles.update(dt)
 
-        # Update enemies
         if self.state == GameState.PLAYING:
-            blocked = set(self.snake)
-            new_pillars = []
-            for spider in self.spiders:
-                pillar = spider.update(dt, self.snake[0], blocked, self.pillars)
-                if pillar:
-                    new_pillars.append(pillar)
-            self.pillars.extend(new_pillars)
-            self.pillars = [p for p in self.pillars if not p.update(dt)]
-
-            # Check power-up collection
-            for i, power_up in enumerate(self.power_ups):
-                if self.snake[0] == power_up.pos:
-                    self._apply_power_up(power_up.type)
-                    self._add_particles(
-                        self.snake[0][0] * Config.CELL + Config.CELL // 2,
-                        Config.FIELD_Y
-                        + self.snake[0][1] * Config.CELL
-                        + Config.CELL // 2,
-                        power_up.colors[power_up.type],
-                        20,
-                    )
-                    self.power_ups.pop(i)
-                    break
-
-            # Check spider bites snake
-            if (
-                self._any_spider_bites_snake()
-                and not self.power_up_effects["shield"]["active"]
-            ):
-                self._game_over("Aranha")
-
-    def _any_spider_bites_snake(self):
-        """Verifica se alguma aranha mordeu a cobra."""
-        snake_set = set(self.snake)
-        return any(s.pos in snake_set for s in self.spiders)
-
-    def _move_snake(self):
-        """Move a cobra."""
-        hx, hy = self.snake[0]
-        nx, ny = hx + self.direction[0], hy + self.direction[1]
-
-        # Check boundary collisions
-        if nx < 0 or nx >= Config.GRID_W or ny < 0 or ny >= Config.GRID_H:
-            self._game_over("Parede")
-            return False
-
-        # Check self collision
-        if (nx, ny) in self.snake[:-1]:
-            self._game_over("Corpo")
-            return False
-
-        # Check enemy collisions (only if shield is not active)
-        if not self.power_up_effects["shield"]["active"]:
-            # Check spider collision
-            if any(s.pos == (nx, ny) for s in self.spiders):
-                self._game_over("Aranha")
-                return False
-            # Check pillar collision
-            if any(p.pos == (nx, ny) for p in self.pillars):
-                self._game_over("Pilar")
-                return False
-
-        # Move snake
-        self.snake.insert(0, (nx, ny))
-        self.labels.insert(0, None)
-
-        # Check letter collection
-        if (nx, ny) in self.idx_by_pos:
-            idx = self.idx_by_pos[(nx, ny)]
-            if idx == self.char_index:
-                self._collect_letter(idx)
+            if self.replay is not None:
+                self._handle_sim_events(self.replay.advance(self.sim, dt))
+                if self.replay.done(self.sim) and self.sim.status == SimStatus.PLAYING:
+                    # O jogador saiu no meio da partida; o replay acaba aqui
+                    self.replay = None
+                    self.state = GameState.MENU
+                    return
             else:
-                self._game_over("Letra errada")
-                return False
-        else:
-            # If not collecting a letter, remove tail
-            self.snake.pop()
-            self.labels.pop()
-
-        return True
-
-    def _collect_letter(self, idx):
-        """Coleta uma letra."""
-        self.labels[0] = Config.SEQUENCE[idx]
-        self.char_index += 1
-        self.bullets += 1
-        self.velocity = min(
-            Config.GLOBAL_CAP,
-            min(Config.PHASE_CAP[self.phase], self.velocity + Config.INC_PER_CHAR),
-        )
-
-        # Remove letter from positions
-        pos = self.pos_by_idx[idx]
-        del self.idx_by_pos[pos]
-        del self.pos_by_idx[idx]
-
-        self.audio_manager.play_sfx("collect")
-
-        # Add particles
-        self._add_particles(
-            self.snake[0][0] * Config.CELL + Config.CELL // 2,
-            Config.FIELD_Y + self.snake[0][1] * Config.CELL + Config.CELL // 2,
-            self.theme_manager.current_theme["PALETA"][
-                (idx) % len(self.theme_manager.current_theme["PALETA"])
-            ],
-            15,
-        )
-
-        # Check if phase completed
-        if self.char_index >= Config.NCHARS:
-            self._complete_phase()
-
-    def _complete_phase(self):
-        """Completa uma fase."""
-        self.char_index = 0
-        self.pos_by_idx.clear()
-        self.idx_by_pos.clear()
-
-        if self.phase >= 3:
-            self._win_game()
-        else:
-            self.phase += 1
-            # Reset match but keep snake and labels
-            self._reset_match_keep_snake()
-            self.timer.pause()
-            self.state = GameState.LEVEL
-
-    def _reset_match_keep_snake(self):
-        """Reset match mantendo cobra e labels."""
-        self.velocity = Config.BASE_SPEED[self.phase]
-        self.move_acc = 0.0
-        self.pos_by_idx = {}
-        self.idx_by_pos = {}
-
-        # Spawn new enemies
-        self._spawn_enemies()
-
-    def _game_over(self, reason):
-        """Game over."""
-        self.death_reason = reason
-        self.timer.pause()
-        self.audio_manager.play_sfx("error")
-        self._add_particles(
-            self.snake[0][0] * Config.CELL + Config.CELL // 2,
-            Config.FIELD_Y + self.snake[0][1] * Config.CELL + Config.CELL // 2,
-            (235, 70, 70),
-            20,
-        )
-        self.state = GameState.GAME_OVER
-
-    def _win_game(self):
-        """Vitória."""
-        self.timer.pause()
-        self.score_manager.add_score(
-            self.player_name or "Jogador", self.timer.elapsed()
-        )
-        self.state = GameState.VICTORY
-
-    def _spawn_power_up(self):
-        """Gera power-up."""
-        occupied = (
-            set(self.snake)
-            | {s.pos for s in self.spiders}
-            | {p.pos for p in self.pillars}
-            | set(self.pos_by_idx.values())
-        )
-
-        free_positions = [
-            (x, y)
-            for x in range(Config.GRID_W)
-            for y in range(Config.GRID_H)
-            if (x, y) not in occupied
-        ]
-
-        if free_positions:
-            pos = random.choice(free_positions)
-            power_type = random.choice(["speed", "freeze", "shield", "time", "kill"])
-            self.power_ups.append(PowerUp(pos, power_type))
-            return True
-        return False
-
-    def _apply_power_up(self, power_type):
-        """Aplica efeito do power-up."""
-        now = self.timer.elapsed()
-
-        if power_type == "speed":
-            self.power_up_effects["speed"]["active"] = True
-            self.power_up_effects["speed"]["end_time"] = now + 10.0
-        elif power_type == "freeze":
-            self.power_up_effects["freeze"]["active"] = True
-            self.power_up_effects["freeze"]["end_time"] = now + 8.0
-        elif power_type == "shield":
-            self.power_up_effects["shield"]["active"] = True
-            self.power_up_effects["shield"]["end_time"] = now + 12.0
-        elif power_type == "time":
-            # Subtract 5 seconds from accumulated time
-            self.timer.accumulated -= 5.0
-            if self.timer.start_time is not None:
-                self.timer.accumulated -= time.time() - self.timer.start_time
-                self.timer.start_time = time.time()
-        elif power_type == "kill":
-            self.bullets += 3
-
-        self.audio_manager.play_sfx("powerup")
+                self._handle_sim_events(self.sim.advance(dt))
+            if self.sim.status != SimStatus.PLAYING:
+                self.state = self.sim.status
+
+    def _handle_sim_events(self, events):
+        """Converte eventos da simulação em som e partículas."""
+        for kind, pos, data in events:
+            px = pos[0] * Config.CELL + Config.CELL // 2
+            py = Config.FIELD_Y + pos[1] * Config.CELL + Config.CELL // 2
+
+            if kind == "shoot":
+                self.audio_manager.play_sfx("shoot")
+            elif kind == "kill":
+                self.audio_manager.play_sfx("kill")
+                self._add_particles(px, py, (255, 50, 50), 25)
+            elif kind == "powerup":
+                self.audio_manager.play_sfx("powerup")
+                self._add_particles(px, py, PowerUp.colors[data], 20)
+            elif kind == "collect":
+                self.audio_manager.play_sfx("collect")
+                paleta = self.theme_manager.current_theme["PALETA"]
+                self._add_particles(px, py, paleta[data % len(paleta)], 15)
+            elif kind == "death":
+                self.audio_manager.play_sfx("error")
+                self._add_particles(px, py, (235, 70, 70), 20)
+            elif kind == "win" and self.replay is None:
+                self.score_manager.add_score(self.player_name or "Jogador", data)
 
     def _add_particles(self, x, y, color, count=10):
         """Adiciona partículas."""
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(20, 100)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            self.particles.append(
-                Particle(x, y, color, (vx, vy), random.uniform(0.5, 1.5))
-            )
+        self.particles.emit(x, y, color, count)
 
     def _draw(self):
         """Desenho principal."""
+        # Só redesenha telas paradas quando algo visível mudou; com
+        # DIRTY_RECTS também as sobreposições da partida ficam paradas
+        key = self._static_key()
+        if not self._full_redraw and key == self._frame_key:
+            if self.state == GameState.PLAYING:
+                if Config.DIRTY_RECTS:
+                    self._draw_dirty()
+                    return
+            elif not len(self.particles) and (
+                Config.DIRTY_RECTS or self.state not in GameState.IN_GAME
+            ):
+                return
+        self._frame_key = key
+
         self.screen.fill((0, 0, 0))
 
         # Draw HUD
         self._draw_hud()
 
-        # Draw field background
-        self.screen.blit(self.field_bg, (0, Config.FIELD_Y))
-
-        # Draw game objects
-        if self.state in (
-            GameState.PLAYING,
-            GameState.PAUSED,
-            GameState.GAME_OVER,
-            GameState.VICTORY,
-            GameState.LEVEL,
-        ):
-            self._draw_game_objects()
+        # Draw field background and semi-static objects
+        self.field_layer.update(self._field_layer_key())
+        self.screen.blit(self.field_layer.surface, (0, Config.FIELD_Y))
 
-        # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        # Draw moving objects and particles, presos ao campo como em
+        # _draw_dirty para não pintarem as linhas do HUD
+        field = pygame.Rect(0, Config.FIELD_Y, Config.FIELD_W, Config.FIELD_H)
+        self.screen.set_clip(field)
+        if self.state in GameState.IN_GAME:
+            self._draw_game_objects()
+        self.particles.draw(self.screen)
+        self.screen.set_clip(None)
 
         # Draw UI overlay
         self._draw_ui_overlay()
 
-        # Scale to window
-        scaled = pygame.transform.smoothscale(
-            self.screen, (self.window_w, self.window_h)
-        )
-        self.window.blit(scaled, (0, 0))
-        pygame.display.flip()
+        self._present()
+        self._full_redraw = False
+        if self.state == GameState.PLAYING:
+            self._dirty_prev = self._object_rects()
 
-    def _draw_hud(self):
-        """Desenha HUD superior."""
-        # Painel escuro de fundo
-        pygame.draw.rect(
-            self.screen, Config.DARK_PANEL, (0, 0, Config.WIN_W, Config.TOP_PANEL_H)
+    def _present(self, rects=None):
+        """Leva a tela para a janela (inteira ou só ``rects``)."""
+        if self.screen is self.window:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+
+        scale = (
+            pygame.transform.smoothscale
+            if Config.SMOOTH_SCALE
+            else pygame.transform.scale
         )
+        if rects is None:
+            scale(self.screen, self.window.get_size(), self.window)
+            pygame.display.flip()
+            return
+
+        updated = []
+        for r in rects:
+            # Bordas calculadas pela mesma regra para blocos vizinhos não
+            # deixarem frestas entre si
+            x0 = r.left * self.window_w // Config.WIN_W
+            x1 = r.right * self.window_w // Config.WIN_W
+            y0 = r.top * self.window_h // Config.WIN_H
+            y1 = r.bottom * self.window_h // Config.WIN_H
+            if x1 <= x0 or y1 <= y0:
+                continue
+            dest = pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+            scale(self.screen.subsurface(r), dest.size, self.window.subsurface(dest))
+            updated.append(dest)
+        pygame.display.update(updated)
+
+    def _static_key(self):
+        """O que, fora do jogo, obriga a redesenhar a tela."""
+        if self.state == GameState.PLAYING:
+            return (self.state,)
+        blink = int(self.tick * 2) % 2 if self.state == GameState.ENTER_NAME else 0
+        return (self.state, self.player_name, blink, bool(len(self.particles)))
+
+    def _draw_dirty(self):
+        """Redesenha só o que mudou desde o quadro anterior."""
+        field = pygame.Rect(0, Config.FIELD_Y, Config.FIELD_W, Config.FIELD_H)
+        rects = self._object_rects()
+        if self.field_layer.update(self._field_layer_key()):
+            tiles = [field]
+        else:
+            tiles = self._dirty_tiles(self._dirty_prev + rects)
+
+        self.screen.set_clip(field)
+        layer = self.field_layer.surface
+        for r in tiles:
+            self.screen.blit(layer, r, r.move(0, -Config.FIELD_Y))
+        self._draw_game_objects()
+        self.particles.draw(self.screen)
+
+        self.screen.set_clip(None)
+
+        # Só os campos do HUD que mudaram
+        for r in self.hud.update(self._hud_values()):
+            self.screen.blit(self.hud.surface, r, r)
+            tiles.append(r)
+
+        self._dirty_prev = rects
+        self._present(tiles)
+
+    def _dirty_tiles(self, rects):
+        """Junta retângulos em blocos de DIRTY_TILE células, unidos por linha."""
+        size = Config.DIRTY_TILE * Config.CELL
+        cols = -(-Config.FIELD_W // size)
+        rows = -(-Config.FIELD_H // size)
+        marked = [[False] * cols for _ in range(rows)]
+        for r in rects:
+            top = max(0, (r.top - Config.FIELD_Y) // size)
+            bottom = min(rows - 1, (r.bottom - 1 - Config.FIELD_Y) // size)
+            left = max(0, r.left // size)
+            right = min(cols - 1, (r.right - 1) // size)
+            for row in range(top, bottom + 1):
+                for col in range(left, right + 1):
+                    marked[row][col] = True
+
+        field = pygame.Rect(0, Config.FIELD_Y, Config.FIELD_W, Config.FIELD_H)
+        tiles = []
+        for row, line in enumerate(marked):
+            col = 0
+            while col < cols:
+                if not line[col]:
+                    col += 1
+                    continue
+                start = col
+                while col < cols and line[col]:
+                    col += 1
+                r = pygame.Rect(
+                    start * size,
+                    Config.FIELD_Y + row * size,
+                    (col - start) * size,
+                    size,
+                )
+                tiles.append(r.clip(field))
+        return tiles
+
+    def _object_rects(self):
+        """Retângulos de tela ocupados pelos objetos que se movem."""
+        cell = Config.CELL
+
+        def around(pos, pad):
+            return pygame.Rect(
+                pos[0] * cell - pad,
+                Config.FIELD_Y + pos[1] * cell - pad,
+                cell + 2 * pad,
+                cell + 2 * pad,
+            )
+
+        sim = self.sim
+        # Aranhas e projéteis aparecem entre a posição anterior e a atual
+        rects = [around(s.pos, 2) for s in sim.spiders]
+        rects += [around(s.prev_pos, 2) for s in sim.spiders if s.prev_pos != s.pos]
+        for b in sim.active_bullets:
+            for x, y in ((b.x, b.y), (b.prev_x, b.prev_y)):
+                rects.append(
+                    pygame.Rect(int(x) - 12, Config.FIELD_Y + int(y) - 12, 24, 24)
+                )
+
+        # Corpo com ondulação; cabeça e pescoço com língua e escudo
+        snake = sim.snake
+        rects += [around(pos, cell // 2) for pos in snake]
+        rects.append(around(snake[0], cell + 2))
+        if len(snake) > 1:
+            rects.append(around(snake[1], cell + 2))
+
+        if len(self.particles):
+            xy = self.particles.pos[: len(self.particles)]
+            x0, y0 = xy.min(axis=0)
+            x1, y1 = xy.max(axis=0)
+            rects.append(
+                pygame.Rect(
+                    int(x0) - 4, int(y0) - 4, int(x1 - x0) + 8, int(y1 - y0) + 8
+                )
+            )
+        return rects
+
+    def _build_hud(self):
+        """Monta a camada do HUD: fundo fixo e um campo por informação."""
+        bg = pygame.Surface((Config.WIN_W, Config.TOP_PANEL_H)).convert()
+        bg.fill(Config.DARK_PANEL)
 
         # Vidro transparente
         glass = pygame.Surface((Config.WIN_W, Config.TOP_PANEL_H), pygame.SRCALPHA)
         glass.fill((255, 255, 255, 16))
-        self.screen.blit(glass, (0, 0))
+        bg.blit(glass, (0, 0))
 
         pad = 16
-        theme = self.theme_manager.current_theme
-
-        # Nome do jogador e tempo
-        Utils.draw_text(
-            self.screen,
-            self.fonts["normal"],
-            f"Jogador: {self.player_name or 'Jogador'}",
-            pad,
-            12,
-            theme["FG"],
+        font = self.fonts["normal"]
+
+        def text_at(x, y):
+            def render(value):
+                text, color = value
+                surf = Utils.render_text_smooth(font, text, color)
+                return [(surf, (x(surf.get_width()), y))]
+
+            return render
+
+        left = lambda w: pad
+        center = lambda w: Config.WIN_W // 2 - w // 2
+        right = lambda w: Config.WIN_W - pad - w
+
+        hud = HudLayer(bg)
+        hud.add("name", text_at(left, 12))
+        hud.add("time", text_at(left, 44))
+        hud.add("phase", text_at(center, 12))
+        hud.add("next", self._render_hud_next)
+        hud.add("kills", text_at(center, 44))
+        hud.add("bullets", text_at(right, Config.TOP_PANEL_H - 30))
+        for i in range(Config.NCHARS):
+            hud.add(("pill", i), lambda value, i=i: self._render_pill(i, value))
+        return hud
+
+    def _hud_values(self):
+        """Valor de cada campo do HUD (``None`` esconde o campo)."""
+        fg = self.theme_manager.current_theme["FG"]
+        sim = self.sim
+        in_game = self.state in GameState.IN_GAME
+        prox_char = (
+            Config.SEQUENCE[sim.char_index] if sim.char_index < Config.NCHARS else "-"
         )
-        if self.state in (
-            GameState.PLAYING,
-            GameState.PAUSED,
-            GameState.GAME_OVER,
-            GameState.VICTORY,
-            GameState.LEVEL,
-        ):
-            Utils.draw_text(
-                self.screen,
-                self.fonts["normal"],
-                f"Tempo: {Utils.fmt_secs(self.timer.elapsed())}",
-                pad,
-                44,
-                theme["FG"],
-            )
 
-        # Fase e próxima letra
-        mid = f"Fase {self.phase}/3"
-        Utils.draw_text(
-            self.screen,
-            self.fonts["normal"],
-            mid,
-            Config.WIN_W // 2 - self.fonts["normal"].size(mid)[0] // 2,
-            12,
-            theme["FG"],
-        )
+        values = {
+            "name": (f"Jogador: {self.player_name or 'Jogador'}", fg),
+            "time": (f"Tempo: {Utils.fmt_secs(sim.time)}", fg) if in_game else None,
+            "phase": (f"Fase {sim.phase}/3", fg),
+            "next": (f"Próximo: {prox_char}", f"Vel: {sim.velocity:.1f}", fg),
+            "kills": (
+                (f"Aranhas: {sim.spider_kills}", fg) if sim.spider_kills > 0 else None
+            ),
+            "bullets": (
+                (f"Tiros: {sim.bullets}", (255, 200, 50)) if sim.bullets > 0 else None
+            ),
+        }
+        # Pílulas de progresso: -1 coletada, 0 atual, 1 pendente
+        for i in range(Config.NCHARS):
+            values[("pill", i)] = max(-1, min(1, i - sim.char_index))
+        return values
 
-        prox_char = (
-            Config.SEQUENCE[self.char_index] if self.char_index < Config.NCHARS else "-"
-        )
-        ri1 = f"Próximo: {prox_char}"
-        ri2 = f"Vel: {self.velocity:.1f}"
-        right_x = (
-            Config.WIN_W
-            - pad
-            - max(self.fonts["normal"].size(ri1)[0], self.fonts["normal"].size(ri2)[0])
-        )
-        Utils.draw_text(
-            self.screen, self.fonts["normal"], ri1, right_x, 12, theme["FG"]
+    def _draw_hud(self):
+        """Desenha HUD superior; devolve as áreas que mudaram."""
+        changed = self.hud.update(self._hud_values())
+        self.screen.blit(self.hud.surface, (0, 0))
+        return changed
+
+    def _render_hud_next(self, value):
+        """Próxima letra e velocidade, alinhadas à direita pela mais larga."""
+        ri1, ri2, color = value
+        font = self.fonts["normal"]
+        s1 = Utils.render_text_smooth(font, ri1, color)
+        s2 = Utils.render_text_smooth(font, ri2, color)
+        right_x = Config.WIN_W - 16 - max(s1.get_width(), s2.get_width())
+        return [(s1, (right_x, 12)), (s2, (right_x, 44))]
+
+    def _render_pill(self, i, status):
+        """Pílula de progresso da letra ``i``."""
+        pill_w, pill_h = 34, 26
+        start_x = Config.WIN_W // 2 - (Config.NCHARS * (pill_w + 6) - 6) // 2
+        x, y = start_x + i * (pill_w + 6), 64
+
+        if status < 0:
+            bg = (24, 142, 96)
+            fg = (18, 24, 22)
+        elif status == 0:
+            bg = (32, 170, 120)
+            fg = (18, 24, 22)
+        else:
+            bg = (64, 68, 76)
+            fg = (238, 238, 238)
+
+        pill = pygame.Surface((pill_w, pill_h), pygame.SRCALPHA)
+        pygame.draw.rect(pill, bg, (0, 0, pill_w, pill_h), border_radius=8)
+        pygame.draw.rect(
+            pill, (255, 255, 255), (0, 0, pill_w, pill_h), 1, border_radius=8
         )
-        Utils.draw_text(
-            self.screen, self.fonts["normal"], ri2, right_x, 44, theme["FG"]
+
+        ch = Config.SEQUENCE[i]
+        text_x = (pill_w - self.fonts["small"].size(ch)[0]) // 2
+        text_y = (pill_h - self.fonts["small"].get_height()) // 2
+        Utils.draw_text(pill, self.fonts["small"], ch, text_x, text_y, fg)
+        return [(pill, (x, y))]
+
+    def _field_layer_key(self):
+        """O que, se mudar, obriga a refazer a camada do campo."""
+        sim = self.sim
+        if self.state not in GameState.IN_GAME:
+            return (self.field_bg,)
+        return (
+            self.field_bg,
+            self.atlas,
+            sim.char_index,
+            tuple(sim.pos_by_idx.items()),
+            tuple((p.pos, p.type) for p in sim.power_ups),
+            tuple(p.pos for p in sim.pillars),
         )
 
-        # Aranhas abatidas
-        if self.spider_kills > 0:
-            kills_text = f"Aranhas: {self.spider_kills}"
-            Utils.draw_text(
-                self.screen,
-                self.fonts["normal"],
-                kills_text,
-                Config.WIN_W // 2 - self.fonts["normal"].size(kills_text)[0] // 2,
-                44,
-                theme["FG"],
-            )
+    def _render_field_layer(self, surf):
+        """Fundo do campo com letras, power-ups e pilares."""
+        surf.blit(self.field_bg, (0, 0))
+        if self.state not in GameState.IN_GAME:
+            return
 
-        # Indicador de balas
-        if self.bullets > 0:
-            bullets_text = f"Tiros: {self.bullets}"
-            Utils.draw_text(
-                self.screen,
-                self.fonts["normal"],
-                bullets_text,
-                Config.WIN_W - pad - self.fonts["normal"].size(bullets_text)[0],
-                Config.TOP_PANEL_H - 30,
-                (255, 200, 50),
-            )
+        atlas = self.atlas
+        blits = []
 
-        # Pílulas de progresso
-        self._draw_progress_pills()
+        # Letras
+        for i, pos in self.sim.pos_by_idx.items():
+            px, py = self._field_pixel_pos(*pos)
+            blits += atlas.token_blits(i, px, py, i == self.sim.char_index)
 
-    def _draw_progress_pills(self):
-        """Desenha as pílulas de progresso das letras."""
-        pill_w, pill_h = 34, 26
-        start_x = Config.WIN_W // 2 - (Config.NCHARS * (pill_w + 6) - 6) // 2
-        y = 64
-
-        for i, ch in enumerate(Config.SEQUENCE):
-            x = start_x + i * (pill_w + 6)
-            if i < self.char_index:
-                bg = (24, 142, 96)
-                fg = (18, 24, 22)
-            elif i == self.char_index:
-                bg = (32, 170, 120)
-                fg = (18, 24, 22)
-            else:
-                bg = (64, 68, 76)
-                fg = (238, 238, 238)
+        # Power-ups e pilares
+        sprites = [(atlas.power_ups[p.type], p.pos) for p in self.sim.power_ups]
+        sprites += [(atlas.pillar, p.pos) for p in self.sim.pillars]
+        for (sprite, off), pos in sprites:
+            px, py = self._field_pixel_pos(*pos)
+            blits.append((sprite, (px + off, py + off)))
 
-            pygame.draw.rect(self.screen, bg, (x, y, pill_w, pill_h), border_radius=8)
-            pygame.draw.rect(
-                self.screen, (255, 255, 255), (x, y, pill_w, pill_h), 1, border_radius=8
-            )
+        surf.blits(blits, doreturn=False)
 
-            text_x = x + (pill_w - self.fonts["small"].size(ch)[0]) // 2
-            text_y = y + (pill_h - self.fonts["small"].get_height()) // 2
-            Utils.draw_text(self.screen, self.fonts["small"], ch, text_x, text_y, fg)
+    def _field_pixel_pos(self, x, y):
+        """Centro da célula (x, y) em coordenadas da camada do campo."""
+        return x * Config.CELL + Config.CELL // 2, y * Config.CELL + Config.CELL // 2
 
     def _draw_game_objects(self):
-        """Desenha objetos do jogo."""
-        theme = self.theme_manager.current_theme
-
-        # Desenhar letras
-        for i, pos in self.pos_by_idx.items():
-            self._draw_letter_token(
-                pos,
-                Config.SEQUENCE[i],
-                theme["PALETA"][i % len(theme["PALETA"])],
-                i == self.char_index,
-            )
-
-        # Desenhar power-ups
-        for power_up in self.power_ups:
-            power_up.draw(self.screen, self.fonts["small"])
-
-        # Desenhar inimigos
-        for pillar in self.pillars:
-            pillar.draw(self.screen)
-        for spider in self.spiders:
-            spider.draw(self.screen)
+        """Desenha os objetos que se movem (aranhas, projéteis e cobra).
+
+        Aranhas e projéteis são interpolados entre o passo fixo anterior e
+        o atual, pela fração ``sim.alpha`` já decorrida.
+        """
+        alpha = self._interp_alpha()
+        surf, off = self.atlas.spider
+        blits = []
+        for spider in self.sim.spiders:
+            x0, y0 = self._head_pixel_pos(*spider.prev_pos)
+            x1, y1 = self._head_pixel_pos(*spider.pos)
+            px = int(x0 + (x1 - x0) * alpha)
+            py = int(y0 + (y1 - y0) * alpha)
+            blits.append((surf, (px + off, py + off)))
+        self.screen.blits(blits, doreturn=False)
 
         # Desenhar projéteis
-        for bullet in self.active_bullets:
-            bullet.draw(self.screen)
+        for bullet in self.sim.active_bullets:
+            bullet.draw(self.screen, alpha)
 
         # Desenhar cobra
         self._draw_snake()
 
-    def _draw_letter_token(self, pos, char, color, is_next=False):
-        """Desenha um token de letra."""
-        x, y = pos
-        px = x * Config.CELL + Config.CELL // 2
-        py = Config.FIELD_Y + y * Config.CELL + Config.CELL // 2
-        R = Config.CELL // 2 - 3
-
-        pygame.draw.circle(self.screen, color, (px, py), R)
-        pygame.draw.circle(self.screen, (245, 246, 248), (px, py), R, 2)
-
-        # Efeito de brilho para a próxima letra
-        if is_next:
-            glow = pygame.Surface((Config.CELL * 3, Config.CELL * 3), pygame.SRCALPHA)
-            pygame.draw.circle(
-                glow,
-                (255, 255, 255, 70),
-                (Config.CELL + Config.CELL // 2, Config.CELL + Config.CELL // 2),
-                R + 8,
-            )
-            self.screen.blit(
-                glow,
-                (
-                    px - (Config.CELL + Config.CELL // 2),
-                    py - (Config.CELL + Config.CELL // 2),
-                ),
-                special_flags=pygame.BLEND_PREMULTIPLIED,
-            )
-
-        # Desenhar a letra
-        text = Utils.render_text_smooth(self.fonts["token"], str(char), (255, 255, 255))
-        shadow = Utils.render_text_smooth(self.fonts["token"], str(char), (0, 0, 0))
-        rect = text.get_rect(center=(px, py))
-        self.screen.blit(shadow, rect.move(1, 1))
-        self.screen.blit(text, rect)
+    def _interp_alpha(self):
+        """Fração do passo fixo a interpolar (1 fora da partida)."""
+        return self.sim.alpha if self.state == GameState.PLAYING else 1.0
 
     def _draw_snake(self):
         """Desenha a cobra com animação."""
         theme = self.theme_manager.current_theme
         pattern = theme["SNAKE_PATTERN"]
+        segment = self.atlas.segment
+        blits = []
 
         # Desenhar segmentos do corpo (do rabo para a cabeça)
-        total = len(self.snake)
-        for i in range(total - 1, 0, -1):
-            x, y = self.snake[i]
+        snake = self.sim.snake
+        total = len(snake)
+        ampl = Config.SLITHER_AMPL * (0.6 + 0.4 * math.sin(self.tick * 2.0))
+        for i, (x, y), behind, ahead, label in snake.from_tail():
             px = x * Config.CELL + Config.CELL // 2
             py = Config.FIELD_Y + y * Config.CELL + Config.CELL // 2
 
             # Calcular direção do segmento
-            prev_idx = max(0, i - 1)
-            next_idx = min(total - 1, i + 1)
-            vx, vy = self._seg_dir(
-                self.snake[next_idx if next_idx < total else i], self.snake[prev_idx]
-            )
+            vx, vy = self._seg_dir(behind, ahead)
 
             # Aplicar efeito de ondulação
-            ampl = Config.SLITHER_AMPL * (0.6 + 0.4 * math.sin(self.tick * 2.0))
             px, py = self._apply_slither(px, py, vx, vy, k=(total - i), base_ampl=ampl)
 
-            color = pattern[i % len(pattern)]
-            self._draw_snake_segment(
-                px, py, color, self.labels[i] if i < len(self.labels) else None
-            )
+            surf, off = segment(pattern[i % len(pattern)], label)
+            blits.append((surf, (px + off, py + off)))
 
         # Desenhar cabeça com interpolação suave
-        hx, hy = self.snake[0]
+        hx, hy = snake[0]
+        neck = snake[1] if total > 1 else snake[0]
         head_now = self._head_pixel_pos(hx, hy)
-        prev_pos = self._head_pixel_pos(
-            *(self.snake[1] if len(self.snake) > 1 else self.snake[0])
-        )
+        prev_pos = self._head_pixel_pos(*neck)
 
-        step = 1.0 / max(self.velocity, 0.0001)
-        frac = 1.0 - (self.move_acc / step) if self.state == GameState.PLAYING else 1.0
+        step = 1.0 / max(self.sim.velocity, 0.0001)
+        if self.state == GameState.PLAYING:
+            # Tempo desde o último passo fixo também conta
+            acc = self.sim.move_acc + self._interp_alpha() / Config.SIM_HZ
+            frac = 1.0 - acc / step
+        else:
+            frac = 1.0
         frac = max(0.0, min(1.0, frac))
 
         hx_px = int(prev_pos[0] + (head_now[0] - prev_pos[0]) * frac)
         hy_px = int(prev_pos[1] + (head_now[1] - prev_pos[1]) * frac)
 
-        dx, dy = self._seg_dir(
-            self.snake[1] if len(self.snake) > 1 else self.snake[0], self.snake[0]
-        )
+        dx, dy = self._seg_dir(neck, snake[0])
         hx_px, hy_px = self._apply_slither(
             hx_px, hy_px, dx, dy, k=-0.5, base_ampl=Config.HEAD_SWAY
         )
 
         # Desenhar cabeça
-        self._draw_snake_segment(
-            hx_px,
-            hy_px,
-            theme["HEAD"],
-            self.labels[0] if self.labels else None,
-            is_head=True,
-        )
+        surf, off = segment(theme["HEAD"], snake.labels[0], is_head=True)
+        blits.append((surf, (hx_px + off, hy_px + off)))
+        self.screen.blits(blits, doreturn=False)
 
         # Desenhar língua ocasionalmente
         self._maybe_draw_tongue(hx_px, hy_px, (dx, dy))
 
         # Desenhar escudo se ativo
-        if self.power_up_effects["shield"]["active"]:
-            pygame.draw.circle(
-                self.screen, (255, 215, 0, 100), (hx_px, hy_px), Config.CELL, width=2
-            )
+        if self.sim.power_up_effects["shield"]["active"]:
+            surf, off = self.atlas.shield
+            self.screen.blit(surf, (hx_px + off, hy_px + off))
 
     def _head_pixel_pos(self, hx, hy):
         """Posição em pixels da cabeça da cobra."""
@@ -1123,44 +1032,6 @@ class SnakeGame:
         perp = (-vy, vx)
         return int(px + perp[0] * sway), int(py + perp[1] * sway)
 
-    def _draw_snake_segment(self, px, py, color, label=None, is_head=False):
-        """Desenha um segmento da cobra."""
-        R = Config.CELL // 2 - 2
-        ring = (max(color[0] - 25, 0), max(color[1] - 25, 0), max(color[2] - 25, 0))
-        inner = (
-            min(color[0] + 18, 255),
-            min(color[1] + 18, 255),
-            min(color[2] + 18, 255),
-        )
-
-        # Desenhar segmento
-        pygame.draw.circle(self.screen, inner, (px, py), R - 1)
-        pygame.draw.circle(self.screen, ring, (px, py), R, 2)
-
-        # Padrões especiais baseados no tipo de cobra
-        theme = self.theme_manager.current_theme
-        snake_type = theme.get("SNAKE_TYPE", "água")
-
-        if not is_head:
-            if snake_type == "cascavel":
-                pygame.draw.circle(self.screen, ring, (px, py), R - 4, 2)
-            elif snake_type == "coral":
-                pygame.draw.circle(self.screen, (255, 255, 255), (px, py), R - 4, 1)
-
-        # Desenhar label se houver
-        if label:
-            fill, outline = Utils.auto_text_colors(inner)
-            Utils.draw_text_outline_center(
-                self.screen,
-                str(label),
-                px,
-                py,
-                fill,
-                outline,
-                self.fonts["segment"],
-                outer_px=1,
-            )
-
     def _maybe_draw_tongue(self, px, py, direction):
         """Desenha língua ocasionalmente."""
         t = self.tick % 1.4
@@ -1186,45 +1057,94 @@ class SnakeGame:
             pygame.draw.line(self.screen, col, (tx, ty), (px2, py2), 2)
 
     def _draw_ui_overlay(self):
-        """Desenha overlays de UI."""
-        if self.state == GameState.MENU:
-            self._draw_menu()
-        elif self.state == GameState.ENTER_NAME:
-            self._draw_name_entry()
-        elif self.state == GameState.LEADERBOARD:
-            self._draw_leaderboard()
-        elif self.state == GameState.OPTIONS:
-            self._draw_options()
-        elif self.state == GameState.THEME:
-            self._draw_theme_menu()
-        elif self.state == GameState.BG:
-            self._draw_bg_menu()
-        elif self.state == GameState.MUSIC:
-            self._draw_music_menu()
-        elif self.state == GameState.SCREEN:
-            self._draw_screen_menu()
-        elif self.state == GameState.LEVEL:
-            self._draw_level()
-        elif self.state == GameState.GAME_OVER:
-            self._draw_game_over()
-        elif self.state == GameState.VICTORY:
-            self._draw_victory()
-        elif self.state == GameState.PAUSED:
-            self._draw_pause()
+        """Desenha o overlay do estado atual, vindo do cache."""
+        key = self._overlay_key()
+        if key is None:
+            return
 
-    def _dim_field(self, alpha=160):
-        """Escurece o campo de jogo."""
-        overlay = pygame.Surface((Config.FIELD_W, Config.FIELD_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, alpha))
-        self.screen.blit(overlay, (0, Config.FIELD_Y))
+        overlay = self.overlay_cache.get(key, self._render_overlay)
+        field = pygame.Rect(0, Config.FIELD_Y, Config.FIELD_W, Config.FIELD_H)
 
-    def _draw_menu(self):
-        """Desenha menu principal."""
-        self._dim_field(150)
+        def blend():
+            self.screen.blit(
+                overlay, field, field, special_flags=pygame.BLEND_PREMULTIPLIED
+            )
 
+        def compose():
+            blend()
+            return self.screen.subsurface(field).copy()
+
+        if self.state in GameState.IN_GAME or len(self.particles):
+            # A partida (ou partículas) se mexe por baixo do overlay
+            blend()
+        else:
+            # Campo parado: guarda o quadro já composto e só o copia
+            frame_key = ("frame", key, self.field_layer.key)
+            self.screen.blit(self.overlay_cache.get(frame_key, compose), field)
+
+        # Única parte animada: o cursor da entrada de nome
+        if self.state == GameState.ENTER_NAME:
+            self._draw_name_cursor()
+
+    def _overlay_key(self):
+        """Estado e entradas que mudam o overlay (``None`` sem overlay)."""
+        state = self.state
+        if state not in self.OVERLAYS:
+            return None
+        if state == GameState.ENTER_NAME:
+            return (state, self.player_name)
+        if state == GameState.LEADERBOARD:
+            top = self.score_manager.top(10)
+            return (state, tuple((r.get("name"), r.get("seconds")) for r in top))
+        if state == GameState.MUSIC:
+            return (state, self.audio_manager.enabled)
+        if state == GameState.LEVEL:
+            return (state, self.sim.phase)
+        if state == GameState.GAME_OVER:
+            return (state, self.sim.death_reason)
+        if state == GameState.VICTORY:
+            return (state, Utils.fmt_secs(self.sim.time))
+        return (state,)
+
+    def _render_overlay(self):
+        """Overlay do estado atual em alfa pré-multiplicado.
+
+        O conteúdo é desenhado numa camada transparente e composto sobre
+        o escurecimento; o resultado é aplicado com BLEND_PREMULTIPLIED,
+        que equivale a escurecer o campo e desenhar o conteúdo por cima.
+        """
+        name, dim = self.OVERLAYS[self.state]
+        content = pygame.Surface((Config.WIN_W, Config.WIN_H), pygame.SRCALPHA)
+        getattr(self, name)(content)
+
+        overlay = pygame.Surface((Config.WIN_W, Config.WIN_H), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, dim))
+        overlay.blit(
+            content.premul_alpha(), (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED
+        )
+        return overlay
+
+    def _draw_name_cursor(self):
+        """Cursor piscante da entrada de nome."""
+        if int(self.tick * 2) % 2 == 0:
+            cursor_x = (
+                Config.WIN_W // 2
+                + self.fonts["normal"].size(self.player_name)[0] // 2
+                + 2
+            )
+            pygame.draw.line(
+                self.screen,
+                (255, 255, 255),
+                (cursor_x, Config.FIELD_Y + 150),
+                (cursor_x, Config.FIELD_Y + 180),
+                2,
+            )
+
+    def _draw_menu(self, surf):
+        """Desenha menu principal."""
         title = "SNAKE - MECATRONICA"
         Utils.draw_text_outline_center(
-            self.screen,
+            surf,
             title,
             Config.WIN_W // 2,
             Config.FIELD_Y + 70,
@@ -1244,7 +1164,7 @@ class SnakeGame:
         y = Config.FIELD_Y + 150
         for i, opt in enumerate(opts):
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 opt,
                 Config.WIN_W // 2 - 160,
@@ -1254,7 +1174,7 @@ class SnakeGame:
 
         sub = "Durante o jogo: 0 - Pausar | ESPAÇO - Atirar"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["small"],
             sub,
             Config.WIN_W // 2 - self.fonts["small"].size(sub)[0] // 2,
@@ -1262,13 +1182,11 @@ class SnakeGame:
             (200, 200, 200),
         )
 
-    def _draw_name_entry(self):
+    def _draw_name_entry(self, surf):
         """Desenha tela de entrada de nome."""
-        self._dim_field(160)
-
         title = "DIGITE SEU NOME"
         Utils.draw_text_outline_center(
-            self.screen,
+            surf,
             title,
             Config.WIN_W // 2,
             Config.FIELD_Y + 70,
@@ -1279,13 +1197,13 @@ class SnakeGame:
 
         # Caixa de texto
         pygame.draw.rect(
-            self.screen,
+            surf,
             (50, 50, 50),
             (Config.WIN_W // 2 - 200, Config.FIELD_Y + 140, 400, 50),
             border_radius=5,
         )
         pygame.draw.rect(
-            self.screen,
+            surf,
             (100, 100, 100),
             (Config.WIN_W // 2 - 200, Config.FIELD_Y + 140, 400, 50),
             2,
@@ -1295,7 +1213,7 @@ class SnakeGame:
         # Texto digitado
         if self.player_name:
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 self.player_name,
                 Config.WIN_W // 2 - self.fonts["normal"].size(self.player_name)[0] // 2,
@@ -1305,7 +1223,7 @@ class SnakeGame:
         else:
             placeholder = "Clique aqui e digite..."
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 placeholder,
                 Config.WIN_W // 2 - self.fonts["normal"].size(placeholder)[0] // 2,
@@ -1313,25 +1231,10 @@ class SnakeGame:
                 (150, 150, 150),
             )
 
-        # Cursor piscante
-        if int(self.tick * 2) % 2 == 0:
-            cursor_x = (
-                Config.WIN_W // 2
-                + self.fonts["normal"].size(self.player_name)[0] // 2
-                + 2
-            )
-            pygame.draw.line(
-                self.screen,
-                (255, 255, 255),
-                (cursor_x, Config.FIELD_Y + 150),
-                (cursor_x, Config.FIELD_Y + 180),
-                2,
-            )
-
         # Instruções
         hint = "ENTER para confirmar | ESC para voltar"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["small"],
             hint,
             Config.WIN_W // 2 - self.fonts["small"].size(hint)[0] // 2,
@@ -1339,13 +1242,11 @@ class SnakeGame:
             (200, 200, 200),
         )
 
-    def _draw_leaderboard(self):
+    def _draw_leaderboard(self, surf):
         """Desenha ranking."""
-        self._dim_field(160)
-
         title = "RANKING - MELHORES TEMPOS"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             title,
             Config.WIN_W // 2 - self.fonts["big"].size(title)[0] // 2,
@@ -1353,14 +1254,13 @@ class SnakeGame:
             (255, 255, 255),
         )
 
-        lb = self.score_manager.load_leaderboard()
-        top = lb[:10]
+        top = self.score_manager.top(10)
         y = Config.FIELD_Y + 100
 
         if not top:
             msg = "Ainda não há tempos salvos."
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 msg,
                 Config.WIN_W // 2 - self.fonts["normal"].size(msg)[0] // 2,
@@ -1371,16 +1271,16 @@ class SnakeGame:
             cx = Config.WIN_W // 2 - 260
             tx = Config.WIN_W // 2 + 140
             Utils.draw_text(
-                self.screen, self.fonts["normal"], "Jogador", cx, y, (255, 255, 255)
+                surf, self.fonts["normal"], "Jogador", cx, y, (255, 255, 255)
             )
             Utils.draw_text(
-                self.screen, self.fonts["normal"], "Tempo", tx, y, (255, 255, 255)
+                surf, self.fonts["normal"], "Tempo", tx, y, (255, 255, 255)
             )
             y += 32
 
             for i, rec in enumerate(top, 1):
                 Utils.draw_text(
-                    self.screen,
+                    surf,
                     self.fonts["small"],
                     f"{i:2d}. {rec.get('name', 'Jogador')}",
                     cx,
@@ -1388,7 +1288,7 @@ class SnakeGame:
                     (255, 255, 255),
                 )
                 Utils.draw_text(
-                    self.screen,
+                    surf,
                     self.fonts["small"],
                     Utils.fmt_secs(rec.get("seconds", 0.0)),
                     tx,
@@ -1399,7 +1299,7 @@ class SnakeGame:
 
         tip = "ESC para voltar"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["small"],
             tip,
             Config.WIN_W // 2 - self.fonts["small"].size(tip)[0] // 2,
@@ -1407,13 +1307,11 @@ class SnakeGame:
             (255, 255, 255),
         )
 
-    def _draw_options(self):
+    def _draw_options(self, surf):
         """Desenha menu de opções."""
-        self._dim_field(170)
-
         title = "OPÇÕES"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             title,
             Config.WIN_W // 2 - self.fonts["big"].size(title)[0] // 2,
@@ -1426,7 +1324,7 @@ class SnakeGame:
         y = Config.FIELD_Y + 120
         for i, opt in enumerate(opts):
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 opt,
                 Config.WIN_W // 2 - 160,
@@ -1434,13 +1332,11 @@ class SnakeGame:
                 (255, 255, 255),
             )
 
-    def _draw_theme_menu(self):
+    def _draw_theme_menu(self, surf):
         """Desenha menu de temas."""
-        self._dim_field(170)
-
         title = "TEMA"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             title,
             Config.WIN_W // 2 - self.fonts["big"].size(title)[0] // 2,
@@ -1458,7 +1354,7 @@ class SnakeGame:
         y = Config.FIELD_Y + 120
         for i, opt in enumerate(opts):
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 opt,
                 Config.WIN_W // 2 - 160,
@@ -1466,13 +1362,11 @@ class SnakeGame:
                 (255, 255, 255),
             )
 
-    def _draw_bg_menu(self):
+    def _draw_bg_menu(self, surf):
         """Desenha menu de fundo."""
-        self._dim_field(170)
-
         title = "FUNDO (IMAGEM)"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             title,
             Config.WIN_W // 2 - self.fonts["big"].size(title)[0] // 2,
@@ -1485,7 +1379,7 @@ class SnakeGame:
         y = Config.FIELD_Y + 120
         for i, opt in enumerate(opts):
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 opt,
                 Config.WIN_W // 2 - 220,
@@ -1493,13 +1387,11 @@ class SnakeGame:
                 (255, 255, 255),
             )
 
-    def _draw_music_menu(self):
+    def _draw_music_menu(self, surf):
         """Desenha menu de música."""
-        self._dim_field(170)
-
         title = "MÚSICA"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             title,
             Config.WIN_W // 2 - self.fonts["big"].size(title)[0] // 2,
@@ -1509,7 +1401,7 @@ class SnakeGame:
 
         st = "Ligada" if self.audio_manager.enabled else "Desligada"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["normal"],
             f"Estado atual: {st}",
             Config.WIN_W // 2 - 160,
@@ -1522,7 +1414,7 @@ class SnakeGame:
         y = Config.FIELD_Y + 140
         for i, opt in enumerate(opts):
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 opt,
                 Config.WIN_W // 2 - 140,
@@ -1530,13 +1422,11 @@ class SnakeGame:
                 (255, 255, 255),
             )
 
-    def _draw_screen_menu(self):
+    def _draw_screen_menu(self, surf):
         """Desenha menu de resolução."""
-        self._dim_field(170)
-
         title = "TELA - RESOLUÇÃO"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             title,
             Config.WIN_W // 2 - 180,
@@ -1549,7 +1439,7 @@ class SnakeGame:
         y = Config.FIELD_Y + 120
         for i, opt in enumerate(opts):
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 opt,
                 Config.WIN_W // 2 - 140,
@@ -1557,11 +1447,11 @@ class SnakeGame:
                 (255, 255, 255),
             )
 
-    def _draw_level(self):
+    def _draw_level(self, surf):
         """Desenha transição de fase."""
-        txt = f"Fase {self.phase}!"
+        txt = f"Fase {self.sim.phase}!"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             txt,
             Config.WIN_W // 2 - self.fonts["big"].size(txt)[0] // 2,
@@ -1571,7 +1461,7 @@ class SnakeGame:
 
         sub = "ENTER para continuar"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["normal"],
             sub,
             Config.WIN_W // 2 - self.fonts["normal"].size(sub)[0] // 2,
@@ -1579,13 +1469,11 @@ class SnakeGame:
             (238, 240, 243),
         )
 
-    def _draw_game_over(self):
+    def _draw_game_over(self, surf):
         """Desenha tela de game over."""
-        self._dim_field(100)
-
         msg = "VOCÊ MORREU! 😵💀"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             msg,
             Config.WIN_W // 2 - self.fonts["big"].size(msg)[0] // 2,
@@ -1593,9 +1481,9 @@ class SnakeGame:
             (235, 70, 70),
         )
 
-        cause_str = f"Causa: {self.death_reason}"
+        cause_str = f"Causa: {self.sim.death_reason}"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["normal"],
             cause_str,
             Config.WIN_W // 2 - self.fonts["normal"].size(cause_str)[0] // 2,
@@ -1605,7 +1493,7 @@ class SnakeGame:
 
         hint = "1 Repetir | 2 Novo jogo | ESC Menu"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["small"],
             hint,
             Config.WIN_W // 2 - self.fonts["small"].size(hint)[0] // 2,
@@ -1613,14 +1501,12 @@ class SnakeGame:
             (238, 240, 243),
         )
 
-    def _draw_victory(self):
+    def _draw_victory(self, surf):
         """Desenha tela de vitória."""
-        self._dim_field(100)
-
-        total = self.timer.elapsed()
+        total = self.sim.time
         win = f"CAMPEÃO! Tempo: {Utils.fmt_secs(total)}"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             win,
             Config.WIN_W // 2 - self.fonts["big"].size(win)[0] // 2,
@@ -1630,7 +1516,7 @@ class SnakeGame:
 
         hint = "1 Jogar de novo | ESC Menu"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["small"],
             hint,
             Config.WIN_W // 2 - self.fonts["small"].size(hint)[0] // 2,
@@ -1638,13 +1524,11 @@ class SnakeGame:
             (238, 240, 243),
         )
 
-    def _draw_pause(self):
+    def _draw_pause(self, surf):
         """Desenha menu de pausa."""
-        self._dim_field(140)
-
         txt = "PAUSADO"
         Utils.draw_text(
-            self.screen,
+            surf,
             self.fonts["big"],
             txt,
             Config.WIN_W // 2 - self.fonts["big"].size(txt)[0] // 2,
@@ -1661,7 +1545,7 @@ class SnakeGame:
         y = Config.FIELD_Y + Config.FIELD_H // 2 + 4
         for i, opt in enumerate(opts):
             Utils.draw_text(
-                self.screen,
+                surf,
                 self.fonts["normal"],
                 opt,
                 Config.WIN_W // 2 - 120,
@@ -1672,15 +1556,24 @@ class SnakeGame:
     # ...existing code...
 
 
-def main():
-    """Função principal."""
+def main(argv=None):
+    """Função principal (``--replay arquivo`` assiste a uma partida gravada)."""
+    argv = sys.argv[1:] if argv is None else argv
+    replay = None
+    if len(argv) == 2 and argv[0] == "--replay":
+        replay = argv[1]
+    game = None
     try:
-        game = SnakeGame()
+        game = SnakeGame(replay)
         game.run()
     except Exception as e:
         print(f"Erro ao executar o jogo: {e}")
         print("Certifique-se de que todos os módulos necessários estão disponíveis.")
         sys.exit(1)
+    finally:
+        # Pontuações ainda na fila da thread de gravação não podem se perder
+        if game is not None:
+            game.score_manager.close()
 
 
 if __name__ == "__main__":
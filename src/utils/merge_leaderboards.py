@@ -0,0 +1,188 @@
+"""Junta rankings de vários quiosques num só, sem carregar tudo na memória.
+
+Aceita ``leaderboard.json`` (lista JSON), JSON Lines (``.jsonl``, um
+registro por linha) e bancos SQLite do ScoreManager (``.db``). Cada
+entrada já vem ordenada por ``seconds``; o merge lê todas em paralelo,
+um registro por vez, descarta repetições de (name, ts) e para nos K
+primeiros.
+
+Uso:
+    python -m src.utils.merge_leaderboards quiosque*/leaderboard.json -o final.json
+    python -m src.utils.merge_leaderboards a.json b.db --top 1000 -o final.jsonl
+"""
+
+import argparse
+import heapq
+import json
+import os
+import re
+import sqlite3
+import time
+from itertools import islice
+
+
+SQLITE_EXTS = (".db", ".sqlite", ".sqlite3")
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def _iter_json_array(path, chunk=1 << 16):
+    """Registros de uma lista JSON lidos aos pedaços."""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf, pos, eof = "", 0, False
+        started = False
+        while True:
+            pos = _SEPARATORS.match(buf, pos).end()
+            if pos == len(buf):
+                if eof:
+                    raise ValueError(f"{path}: lista JSON sem fim")
+                buf, pos = f.read(chunk), 0
+                eof = not buf
+                continue
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError(f"{path}: esperava uma lista JSON")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                data = f.read(chunk)
+                eof = not data
+                buf, pos = buf[pos:] + data, 0
+                continue
+            pos = end
+            yield obj
+
+
+def _iter_json_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _iter_sqlite(path):
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = db.execute("SELECT name, seconds, ts FROM scores ORDER BY seconds, id")
+        for name, seconds, ts in rows:
+            yield {"name": name, "seconds": seconds, "ts": ts}
+    finally:
+        db.close()
+
+
+def read_scores(path):
+    """Registros de um ranking, na ordem do arquivo, conferindo a ordem."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in SQLITE_EXTS:
+        records = _iter_sqlite(path)
+    elif ext == ".jsonl":
+        records = _iter_json_lines(path)
+    else:
+        records = _iter_json_array(path)
+
+    last = float("-inf")
+    for r in records:
+        if not isinstance(r, dict) or "seconds" not in r:
+            continue
+        seconds = float(r["seconds"])
+        if seconds < last:
+            raise ValueError(f"{path}: registros fora de ordem de seconds")
+        last = seconds
+        yield r
+
+
+def merge_scores(paths, top=None):
+    """Merge k-way por ``seconds``, sem repetir (name, ts); para em ``top``.
+
+    A mesma partida copiada em dois quiosques tem o mesmo tempo, então as
+    cópias saem do merge juntas: basta lembrar os (name, ts) do tempo
+    atual, e a memória não cresce com o número de registros.
+    """
+    merged = heapq.merge(*(read_scores(p) for p in paths), key=lambda r: r["seconds"])
+
+    def unique():
+        current, seen = None, set()
+        for r in merged:
+            if r["seconds"] != current:
+                current, seen = r["seconds"], set()
+            key = (r.get("name"), r.get("ts"))
+            if key in seen:
+                continue
+            seen.add(key)
+            yield r
+
+    return islice(unique(), top)
+
+
+def write_scores(path, records):
+    """Grava em JSON (lista), JSON Lines ou SQLite, conforme a extensão.
+
+    Escreve num temporário e troca no fim: o arquivo de saída nunca fica
+    pela metade.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    count = 0
+    if ext in SQLITE_EXTS:
+        # Mesmo esquema do SqliteScoreManager
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        db = sqlite3.connect(tmp)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS scores (id INTEGER PRIMARY KEY, "
+            "name TEXT NOT NULL, seconds REAL NOT NULL, ts INTEGER NOT NULL)"
+        )
+        with db:
+            for r in records:
+                db.execute(
+                    "INSERT INTO scores (name, seconds, ts) VALUES (?, ?, ?)",
+                    (r.get("name") or "Jogador", r["seconds"], int(r.get("ts", 0))),
+                )
+                count += 1
+        db.execute("CREATE INDEX IF NOT EXISTS scores_by_time ON scores (seconds, id)")
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS scores_by_player ON scores (name, seconds)"
+        )
+        db.close()
+        os.replace(tmp, path)
+        return count
+
+    with open(tmp, "w", encoding="utf-8") as f:
+        if ext == ".jsonl":
+            for r in records:
+                f.write(json.dumps(r, ensure_ascii=False) + "\n")
+                count += 1
+        else:
+            f.write("[")
+            for r in records:
+                f.write(",\n  " if count else "\n  ")
+                f.write(json.dumps(r, ensure_ascii=False))
+                count += 1
+            f.write("\n]\n" if count else "]\n")
+    os.replace(tmp, path)
+    return count
+
+
+def main(argv=None):
+    """Linha de comando."""
+    parser = argparse.ArgumentParser(description="Junta rankings de vários quiosques.")
+    parser.add_argument("inputs", nargs="+", help="arquivos .json, .jsonl ou .db")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--top", type=int, default=100, help="0 = todos")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count = write_scores(args.output, merge_scores(args.inputs, args.top or None))
+    elapsed = time.perf_counter() - started
+    print(f"{count} tempos de {len(args.inputs)} arquivos em {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
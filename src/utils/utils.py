@@ -1,13 +1,111 @@
 """Utilitários e funções auxiliares."""
 
 import os
+import bisect
 import json
+import queue
+import sqlite3
+import threading
 import time
 import math
-import pygame
+from collections import OrderedDict
+
+try:
+    import pygame
+except ImportError:  # A simulação headless não depende de pygame
+    pygame = None
+
+
+class TextCache:
+    """Cache LRU de superfícies de texto já renderizadas.
+
+    A chave é (fonte, texto, cor, contorno, espessura do contorno) e o
+    valor é a superfície final, com o contorno já composto. Quem recebe
+    a superfície não deve desenhar nela.
+    """
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, render):
+        """Superfície de ``key``; chama ``render()`` só na falta."""
+        surf = self._items.get(key)
+        if surf is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self._items[key] = render()
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        """Esvazia o cache (os contadores continuam)."""
+        self._items.clear()
+
+    def stats(self):
+        """Contadores de acerto, falta e descarte."""
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class SurfaceCache(TextCache):
+    """LRU de superfícies grandes (overlays, quadros compostos).
+
+    Mesma interface do TextCache, mas o limite é em bytes: cada entrada
+    pode ocupar a tela inteira, então contar entradas não diz nada sobre
+    a memória. A entrada mais recente fica mesmo acima do limite.
+    """
+
+    def __init__(self, max_bytes):
+        super().__init__(maxsize=None)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+
+    def get(self, key, render):
+        """Superfície de ``key``; chama ``render()`` só na falta."""
+        surf = self._items.get(key)
+        if surf is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self._items[key] = render()
+        self.bytes += surf.get_pitch() * surf.get_height()
+        while self.bytes > self.max_bytes and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        """Esvazia o cache (os contadores continuam)."""
+        super().clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Contadores, com os bytes em uso."""
+        return dict(super().stats(), bytes=self.bytes)
 
 
 class Utils:
+    text_cache = TextCache()
+
     @staticmethod
     def load_font(path, size, bold=False):
         """Carrega fonte com fallback."""
@@ -19,11 +117,37 @@ class Utils:
         return pygame.font.SysFont("arial", size, bold=bold)
 
     @staticmethod
-    def render_text_smooth(font, text, color):
-        """Renderiza texto com anti-aliasing."""
+    def _render_text(font, text, color):
         s = font.render(text, True, color)
         return s.convert_alpha() if (s.get_flags() & pygame.SRCALPHA) == 0 else s
 
+    @staticmethod
+    def render_text_smooth(font, text, color):
+        """Renderiza texto com anti-aliasing (via cache)."""
+        key = (font, text, tuple(color), None, 0)
+        return Utils.text_cache.get(key, lambda: Utils._render_text(font, text, color))
+
+    @staticmethod
+    def render_text_outline(font, text, fill, outline, outer_px=2):
+        """Texto com contorno composto numa superfície só (via cache)."""
+        key = (font, text, tuple(fill), tuple(outline), outer_px)
+
+        def render():
+            base = Utils._render_text(font, text, fill)
+            if outer_px <= 0:
+                return base
+            edge = Utils._render_text(font, text, outline)
+            w, h = base.get_size()
+            surf = pygame.Surface((w + 2 * outer_px, h + 2 * outer_px), pygame.SRCALPHA)
+            for dx in (0, outer_px, 2 * outer_px):
+                for dy in (0, outer_px, 2 * outer_px):
+                    if dx != outer_px or dy != outer_px:
+                        surf.blit(edge, (dx, dy))
+            surf.blit(base, (outer_px, outer_px))
+            return surf
+
+        return Utils.text_cache.get(key, render)
+
     @staticmethod
     def draw_text(surf, font, text, x, y, color):
         """Desenha texto na superfície."""
@@ -32,17 +156,8 @@ class Utils:
     @staticmethod
     def draw_text_outline_center(surf, txt, x, y, fill, outline, font, outer_px=2):
         """Desenha texto com contorno centralizado."""
-        base = Utils.render_text_smooth(font, txt, fill)
-        if outer_px > 0:
-            for dx in (-outer_px, 0, outer_px):
-                for dy in (-outer_px, 0, outer_px):
-                    if dx == 0 and dy == 0:
-                        continue
-                    surf.blit(
-                        Utils.render_text_smooth(font, txt, outline),
-                        base.get_rect(center=(x + dx, y + dy)),
-                    )
-        surf.blit(base, base.get_rect(center=(x, y)))
+        text = Utils.render_text_outline(font, txt, fill, outline, outer_px)
+        surf.blit(text, text.get_rect(center=(x, y)))
 
     @staticmethod
     def fmt_secs(s):
@@ -68,25 +183,6 @@ class Utils:
         outline = (0, 0, 0) if fill == (255, 255, 255) else (255, 255, 255)
         return fill, outline
 
-    @staticmethod
-    def scatter_chars(excluded, n, grid_w, grid_h):
-        """Espalha caracteres em posições livres."""
-        free_positions = [
-            (x, y)
-            for x in range(grid_w)
-            for y in range(grid_h)
-            if (x, y) not in excluded
-        ]
-        if len(free_positions) < n:
-            return {}, {}
-
-        import random
-
-        positions = random.sample(free_positions, n)
-        pos_by_idx = {i: positions[i] for i in range(n)}
-        idx_by_pos = {positions[i]: i for i in range(n)}
-        return pos_by_idx, idx_by_pos
-
     @staticmethod
     def head_hits_any(pos, pillars, spiders):
         """Verifica se a cabeça da cobra bateu em algo."""
@@ -115,35 +211,345 @@ class FileManager:
 
     @staticmethod
     def save_json(filepath, data):
-        """Salva dados em arquivo JSON."""
+        """Salva dados em arquivo JSON.
+
+        Escreve num temporário ao lado e troca com ``os.replace``: uma queda
+        no meio deixa o arquivo antigo inteiro, nunca um pela metade.
+        """
+        tmp = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
+            with open(tmp, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, filepath)
             return True
         except:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
             return False
 
 
 class ScoreManager:
-    """Gerencia sistema de pontuação."""
+    """Gerencia sistema de pontuação.
+
+    O ranking fica em memória, ordenado por tempo, e só é relido do disco
+    em ``refresh`` quando o arquivo mudou (mtime ou tamanho), por exemplo
+    porque o verificador gravou nele. Ler o ranking não toca o disco nem
+    espera a trava: escritas montam listas novas e só então as trocam.
+    """
+
+    MAX_ENTRIES = 100
 
     def __init__(self, filepath):
         self.filepath = filepath
+        self._entries = []
+        self._seconds = []  # tempos de _entries, para o bisect
+        self._stamp = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _file_stamp(self):
+        try:
+            st = os.stat(self.filepath)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self):
+        """Relê o arquivo se ele mudou desde a última leitura."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self):
+        stamp = self._file_stamp()
+        if self._loaded and stamp == self._stamp:
+            return False
+        lb = FileManager.load_json(self.filepath, []) if stamp else []
+        lb = [r for r in lb if isinstance(r, dict) and "seconds" in r]
+        lb.sort(key=lambda x: x["seconds"])
+        lb = lb[: self.MAX_ENTRIES]
+        self._seconds = [r["seconds"] for r in lb]
+        self._entries = lb
+        self._stamp = stamp
+        self._loaded = True
+        return True
 
     def load_leaderboard(self):
-        """Carrega ranking."""
-        return FileManager.load_json(self.filepath, [])
+        """Ranking atual (cópia da lista em memória)."""
+        if not self._loaded:
+            self.refresh()
+        return list(self._entries)
+
+    def top(self, n=10):
+        """Os ``n`` melhores tempos."""
+        if not self._loaded:
+            self.refresh()
+        return self._entries[:n]
 
     def add_score(self, name, seconds):
         """Adiciona nova pontuação."""
-        lb = self.load_leaderboard()
-        lb.append(
-            {
-                "name": name or "Jogador",
-                "seconds": round(float(seconds), 3),
-                "ts": int(time.time()),
-            }
+        return self.add_scores([(name, seconds, int(time.time()))])
+
+    def add_scores(self, rows):
+        """Insere várias ``(nome, segundos, ts)`` e grava o arquivo uma vez."""
+        with self._lock:
+            self._refresh()
+            entries, times = list(self._entries), list(self._seconds)
+            for name, seconds, ts in rows:
+                seconds = round(float(seconds), 3)
+                i = bisect.bisect_right(times, seconds)
+                entry = {"name": name or "Jogador", "seconds": seconds, "ts": ts}
+                entries.insert(i, entry)
+                times.insert(i, seconds)
+            del entries[self.MAX_ENTRIES :], times[self.MAX_ENTRIES :]
+            self._seconds = times
+            self._entries = entries
+            FileManager.save_json(self.filepath, entries)
+            self._stamp = self._file_stamp()
+        return list(entries)
+
+    def page(self, offset=0, limit=10):
+        """Uma página do ranking."""
+        return self.top(offset + limit)[offset:]
+
+    def rank_of(self, seconds):
+        """Posição (1 = melhor) que um tempo teria no ranking."""
+        if not self._loaded:
+            self.refresh()
+        return bisect.bisect_left(self._seconds, round(float(seconds), 3)) + 1
+
+    def player_stats(self, name):
+        """Como no SQLite, mas só entre as entradas guardadas no JSON."""
+        times = [r["seconds"] for r in self.top(self.MAX_ENTRIES) if r["name"] == name]
+        if not times:
+            return None
+        return {"runs": len(times), "best": min(times), "avg": sum(times) / len(times)}
+
+    def player_best(self, name):
+        """Melhor tempo de um jogador, ou None."""
+        stats = self.player_stats(name)
+        return stats["best"] if stats else None
+
+    def export_json(self, filepath):
+        """Grava o ranking no formato JSON de sempre."""
+        return FileManager.save_json(filepath, self.top(self.MAX_ENTRIES))
+
+    def close(self):
+        """Nada a fechar: cada ``add_score`` já gravou o arquivo."""
+
+
+class SqliteScoreManager:
+    """Ranking num banco SQLite, para quiosques com muitas partidas.
+
+    Guarda todas as partidas, sem o corte de 100 do JSON. Índices em
+    (seconds, id) e (name, seconds) deixam top-N, melhor do jogador e
+    posição de um tempo como buscas no índice. Os ``MAX_ENTRIES``
+    primeiros ficam em memória para o desenho e só são relidos quando o
+    banco muda (``PRAGMA data_version`` detecta escritas de outras
+    conexões). Se ``json_path`` é dado, um banco vazio importa esse
+    arquivo e ``close`` exporta o top para ele.
+    """
+
+    MAX_ENTRIES = ScoreManager.MAX_ENTRIES
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            ts INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS scores_by_time ON scores (seconds, id);
+        CREATE INDEX IF NOT EXISTS scores_by_player ON scores (name, seconds);
+    """
+
+    def __init__(self, filepath, json_path=None):
+        self.filepath = filepath
+        self.json_path = json_path
+        self.db = sqlite3.connect(filepath, check_same_thread=False)
+        self.db.executescript(self.SCHEMA)
+        self._lock = threading.RLock()
+        self._entries = []
+        self._version = None
+        if json_path and not self.db.execute("SELECT 1 FROM scores LIMIT 1").fetchone():
+            self._import_json(json_path)
+
+    def _import_json(self, json_path):
+        rows = [
+            (r.get("name") or "Jogador", float(r["seconds"]), int(r.get("ts", 0)))
+            for r in FileManager.load_json(json_path, [])
+            if isinstance(r, dict) and "seconds" in r
+        ]
+        rows.sort(key=lambda r: r[1])
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO scores (name, seconds, ts) VALUES (?, ?, ?)", rows
+            )
+
+    @staticmethod
+    def _row(row):
+        return {"name": row[0], "seconds": row[1], "ts": row[2]}
+
+    def refresh(self):
+        """Relê o top se o banco mudou desde a última leitura."""
+        with self._lock:
+            version = self.db.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._version:
+                return False
+            self._entries = self._query_page(0, self.MAX_ENTRIES)
+            self._version = version
+            return True
+
+    def _query_page(self, offset, limit):
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT name, seconds, ts FROM scores ORDER BY seconds, id "
+                "LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+        return [self._row(r) for r in rows]
+
+    def load_leaderboard(self):
+        """Top em memória (cópia)."""
+        return list(self.top(self.MAX_ENTRIES))
+
+    def top(self, n=10):
+        """Os ``n`` melhores tempos (do cache até ``MAX_ENTRIES``)."""
+        if self._version is None:
+            self.refresh()
+        if n <= self.MAX_ENTRIES:
+            return self._entries[:n]
+        return self._query_page(0, n)
+
+    def page(self, offset=0, limit=10):
+        """Uma página do ranking, direto do índice por tempo."""
+        if offset + limit <= self.MAX_ENTRIES:
+            return self.top(offset + limit)[offset:]
+        return self._query_page(offset, limit)
+
+    def add_score(self, name, seconds):
+        """Adiciona nova pontuação."""
+        return self.add_scores([(name, seconds, int(time.time()))])
+
+    def add_scores(self, rows):
+        """Insere várias ``(nome, segundos, ts)`` numa só transação."""
+        rows = [(n or "Jogador", round(float(s), 3), ts) for n, s, ts in rows]
+        with self._lock:
+            with self.db:
+                self.db.executemany(
+                    "INSERT INTO scores (name, seconds, ts) VALUES (?, ?, ?)", rows
+                )
+            self._version = None  # data_version não muda com escritas próprias
+            self.refresh()
+        return self.load_leaderboard()
+
+    def _fetch(self, sql, params):
+        with self._lock:
+            return self.db.execute(sql, params).fetchone()
+
+    def rank_of(self, seconds):
+        """Posição (1 = melhor) que um tempo teria no ranking."""
+        (count,) = self._fetch(
+            "SELECT COUNT(*) FROM scores WHERE seconds < ?",
+            (round(float(seconds), 3),),
         )
-        lb.sort(key=lambda x: x["seconds"])
-        FileManager.save_json(self.filepath, lb[:100])
-        return lb
+        return count + 1
+
+    def player_stats(self, name):
+        """Partidas, melhor e média de tempo de um jogador (None se não há)."""
+        runs, best, avg = self._fetch(
+            "SELECT COUNT(*), MIN(seconds), AVG(seconds) FROM scores WHERE name = ?",
+            (name,),
+        )
+        if not runs:
+            return None
+        return {"runs": runs, "best": best, "avg": avg}
+
+    def player_best(self, name):
+        """Melhor tempo de um jogador, ou None."""
+        (best,) = self._fetch("SELECT MIN(seconds) FROM scores WHERE name = ?", (name,))
+        return best
+
+    def export_json(self, filepath):
+        """Grava o top no formato do ``leaderboard.json``."""
+        return FileManager.save_json(filepath, self.top(self.MAX_ENTRIES))
+
+    def close(self):
+        """Exporta o JSON (se configurado) e fecha o banco."""
+        if self.json_path:
+            self.export_json(self.json_path)
+        with self._lock:
+            self.db.close()
+
+
+class ScoreWriter:
+    """Grava pontuações numa thread separada, fora do quadro do jogo.
+
+    ``add_score`` só põe a pontuação numa fila limitada (se ela encher, quem
+    chama espera: é melhor travar um quadro que perder uma pontuação). A
+    thread junta tudo o que estiver pendente numa única escrita
+    (``add_scores``). Leituras vão direto ao ScoreManager embrulhado.
+    ``close`` grava o que falta e fecha; chamar de novo não faz nada.
+    """
+
+    _STOP = object()
+
+    def __init__(self, manager, maxsize=256):
+        self.manager = manager
+        self.closed = False
+        self.queue = queue.Queue(maxsize)
+        self.thread = threading.Thread(
+            target=self._run, name="score-writer", daemon=True
+        )
+        self.thread.start()
+
+    def __getattr__(self, name):
+        return getattr(self.manager, name)
+
+    def add_score(self, name, seconds):
+        """Agenda a gravação (o tempo do registro é o de agora)."""
+        self.queue.put((name, seconds, int(time.time())))
+
+    def flush(self):
+        """Espera a fila esvaziar."""
+        self.queue.join()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [item for item in batch if item is not self._STOP]
+            try:
+                if rows:
+                    self.manager.add_scores(rows)
+            except Exception as e:
+                print(f"Erro ao gravar pontuações: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if len(rows) < len(batch):
+                return
+
+    def close(self):
+        """Grava o que está na fila e fecha o ScoreManager."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread.is_alive():
+            self.queue.put(self._STOP)
+            self.thread.join()
+        self.manager.close()
+
+
+def open_score_manager(filepath, json_path=None):
+    """ScoreManager pelo tipo do arquivo: ``.db``/``.sqlite`` usam SQLite."""
+    if os.path.splitext(filepath)[1].lower() in (".db", ".sqlite", ".sqlite3"):
+        return SqliteScoreManager(filepath, json_path)
+    return ScoreManager(filepath)